@@ -0,0 +1,159 @@
+"""Compares invoking the get_all requests one by one against invoke_all.
+
+A stand-in member, running on a local socket, answers every request
+with an empty response. The client side uses the real reactor,
+connection and invocation service, with all the partitions owned by
+that member. On each round, one get_all request per partition is
+invoked either with ``invoke`` in a loop, or with a single
+``invoke_all`` call, which writes the requests of the same connection
+back-to-back. Reports the rounds per second and the number of reads
+the member needed to receive the requests.
+
+    python benchmarks/member_batching_bench.py
+"""
+import socket
+import sys
+import threading
+import time
+import uuid
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from mock import MagicMock
+
+from hazelcast.config import Config
+from hazelcast.connection import _Reader
+from hazelcast.invocation import Invocation, InvocationService
+from hazelcast.protocol.client_message import (
+    _IS_FINAL_FLAG,
+    _UNFRAGMENTED_MESSAGE_FLAGS,
+    RESPONSE_HEADER_SIZE,
+    SIZE_OF_FRAME_LENGTH_AND_FLAGS,
+    ClientMessageBuilder,
+    OutboundMessage,
+)
+from hazelcast.protocol.codec import map_get_all_codec
+from hazelcast.reactor import AsyncoreReactor
+from hazelcast.serialization.bits import LE_INT, LE_UINT16
+from hazelcast.serialization.data import Data
+
+PARTITION_COUNT = 271
+KEYS_PER_PARTITION = 4
+DURATION = 3
+
+
+class _StandInMember:
+    def __init__(self):
+        self._server = socket.socket()
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(1)
+        self.address = self._server.getsockname()
+        self.reads = 0
+        self._sock = None
+        self._reader = _Reader(ClientMessageBuilder(self._respond))
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        self._sock, _ = self._server.accept()
+        self._sock.recv(3)  # Protocol bytes
+        while True:
+            data = self._sock.recv(128000)
+            if not data:
+                return
+            self.reads += 1
+            self._reader.read(data)
+            self._reader.process()
+
+    def _respond(self, request):
+        # A single frame response, without any backup acks
+        size = SIZE_OF_FRAME_LENGTH_AND_FLAGS + RESPONSE_HEADER_SIZE
+        buf = bytearray(size)
+        LE_INT.pack_into(buf, 0, size)
+        LE_UINT16.pack_into(buf, 4, _UNFRAGMENTED_MESSAGE_FLAGS | _IS_FINAL_FLAG)
+        LE_INT.pack_into(buf, SIZE_OF_FRAME_LENGTH_AND_FLAGS, map_get_all_codec._RESPONSE_MESSAGE_TYPE)
+        response = OutboundMessage(buf, False)
+        response.set_correlation_id(request.get_correlation_id())
+        self._sock.sendall(response.buf)
+
+    def close(self):
+        if self._sock:
+            self._sock.close()
+        self._server.close()
+
+
+def create_requests():
+    requests = []
+    for partition_id in range(PARTITION_COUNT):
+        keys = [Data(b"\x00" * 8 + b"key-%d-%d" % (partition_id, i)) for i in range(KEYS_PER_PARTITION)]
+        requests.append((partition_id, map_get_all_codec.encode_request("map", keys)))
+    return requests
+
+
+def run(member, connection, service, name, invoke):
+    requests = create_requests()
+    rounds = 0
+    reads = member.reads
+    start = time.perf_counter()
+    end = start + DURATION
+    while time.perf_counter() < end:
+        invocations = []
+        for partition_id, request in requests:
+            request = request.copy()
+            request.set_partition_id(partition_id)
+            invocations.append(Invocation(request, partition_id=partition_id))
+
+        invoke(service, invocations)
+        for invocation in invocations:
+            invocation.future.result()
+        rounds += 1
+
+    elapsed = time.perf_counter() - start
+    reads = member.reads - reads
+    print(
+        "%-10s %8.1f rounds/s %10.1f reads/round"
+        % (name, rounds / elapsed, reads / max(rounds, 1))
+    )
+
+
+def invoke_one_by_one(service, invocations):
+    for invocation in invocations:
+        service.invoke(invocation)
+
+
+def invoke_all(service, invocations):
+    service.invoke_all(invocations)
+
+
+if __name__ == "__main__":
+    member = _StandInMember()
+    config = Config()
+    reactor = AsyncoreReactor(config)
+    reactor.start()
+
+    client = MagicMock()
+    service = InvocationService(client, config, reactor)
+    connection = reactor.connection_factory(
+        client.connection_manager,
+        1,
+        MagicMock(host=member.address[0], port=member.address[1]),
+        config,
+        lambda message: service.handle_client_message(message),
+    )
+    member_uuid = uuid.uuid4()
+    client.partition_service.get_partition_owner.return_value = member_uuid
+    client.connection_manager.get_connection.return_value = connection
+    service.init(
+        client.partition_service,
+        client.connection_manager,
+        client.listener_service,
+        client.compact_schema_service,
+    )
+
+    try:
+        run(member, connection, service, "invoke", invoke_one_by_one)
+        run(member, connection, service, "invoke_all", invoke_all)
+    finally:
+        connection.close_connection(None, None)
+        reactor.shutdown()
+        member.close()
@@ -0,0 +1,119 @@
+"""Measures the throughput of the partition id computation.
+
+Hashes serialized keys of varying sizes with the block by block
+implementation used before, the ``struct.iter_unpack`` based pure Python
+implementation and the C implementation of ``mmh3``, if it is installed.
+Also compares computing the partition ids one by one against the
+``get_partition_ids`` bulk API.
+
+    python benchmarks/murmur_bench.py
+"""
+import random
+import sys
+import time
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast.hash import _MMH3_ENABLED, _mmh3_murmur_hash3_x86_32, _murmur_hash3_x86_32
+from hazelcast.partition import _InternalPartitionService
+from hazelcast.serialization import LE_UINT
+from hazelcast.serialization.data import Data
+
+KEY_COUNT = 100000
+PARTITION_COUNT = 271
+
+
+def block_by_block_murmur_hash3_x86_32(data):
+    length = max(len(data) - 8, 0)
+    nblocks = length // 4
+
+    h1 = 0x01000193
+
+    c1 = 0xCC9E2D51
+    c2 = 0x1B873593
+
+    for block_start in range(0, nblocks * 4, 4):
+        k1 = LE_UINT.unpack_from(data, block_start + 8)[0]
+
+        k1 = c1 * k1 & 0xFFFFFFFF
+        k1 = (k1 << 15 | k1 >> 17) & 0xFFFFFFFF
+        k1 = (c2 * k1) & 0xFFFFFFFF
+
+        h1 ^= k1
+        h1 = (h1 << 13 | h1 >> 19) & 0xFFFFFFFF
+        h1 = (h1 * 5 + 0xE6546B64) & 0xFFFFFFFF
+
+    tail_index = nblocks * 4
+    k1 = 0
+    tail_size = length & 3
+
+    if tail_size >= 3:
+        k1 ^= data[tail_index + 10] << 16
+    if tail_size >= 2:
+        k1 ^= data[tail_index + 9] << 8
+    if tail_size >= 1:
+        k1 ^= data[tail_index + 8]
+
+    if tail_size != 0:
+        k1 = (k1 * c1) & 0xFFFFFFFF
+        k1 = (k1 << 15 | k1 >> 17) & 0xFFFFFFFF
+        k1 = (k1 * c2) & 0xFFFFFFFF
+        h1 ^= k1
+
+    h1 ^= length
+    h1 ^= h1 >> 16
+    h1 = (h1 * 0x85EBCA6B) & 0xFFFFFFFF
+    h1 ^= h1 >> 13
+    h1 = (h1 * 0xC2B2AE35) & 0xFFFFFFFF
+    h1 ^= h1 >> 16
+    return -(h1 & 0x80000000) | (h1 & 0x7FFFFFFF)
+
+
+def create_keys(key_size):
+    # 8 bytes of heap data overhead, followed by the payload
+    rnd = random.Random(42)
+    return [bytes(8) + rnd.getrandbits(key_size * 8).to_bytes(key_size, "little") for _ in range(KEY_COUNT)]
+
+
+def run_hash(hash_fn, keys):
+    start = time.perf_counter()
+    for key in keys:
+        hash_fn(key)
+    return KEY_COUNT / (time.perf_counter() - start)
+
+
+def run_partition_ids(service, keys):
+    keys = [Data(key) for key in keys]
+
+    start = time.perf_counter()
+    one_by_one = [service.get_partition_id(key) for key in keys]
+    one_by_one_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = service.get_partition_ids(keys)
+    bulk_elapsed = time.perf_counter() - start
+
+    assert one_by_one == bulk
+    return KEY_COUNT / one_by_one_elapsed, KEY_COUNT / bulk_elapsed
+
+
+if __name__ == "__main__":
+    implementations = [
+        ("Block by block", block_by_block_murmur_hash3_x86_32),
+        ("iter_unpack", _murmur_hash3_x86_32),
+    ]
+    if _MMH3_ENABLED:
+        implementations.append(("mmh3", _mmh3_murmur_hash3_x86_32))
+
+    service = _InternalPartitionService(None)
+    service.check_and_set_partition_count(PARTITION_COUNT)
+
+    for key_size in (16, 64, 256):
+        keys = create_keys(key_size)
+        print("Key size: %d bytes" % key_size)
+        for name, hash_fn in implementations:
+            print("  %-20s %12.0f keys/s" % (name, run_hash(hash_fn, keys)))
+        one_by_one, bulk = run_partition_ids(service, keys)
+        print("  %-20s %12.0f keys/s" % ("get_partition_id", one_by_one))
+        print("  %-20s %12.0f keys/s" % ("get_partition_ids", bulk))
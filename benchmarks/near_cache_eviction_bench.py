@@ -0,0 +1,77 @@
+"""Compares the sampling based and the exact Near Cache eviction strategies.
+
+Fills a Near Cache up to its maximum size, then measures the throughput
+of the puts that each evict an entry, and of the gets that update the
+eviction order, for the LRU and LFU eviction policies.
+
+    python benchmarks/near_cache_eviction_bench.py
+"""
+import sys
+import time
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast.config import Config, EvictionPolicy, EvictionStrategy, InMemoryFormat
+from hazelcast.near_cache import NearCache
+from hazelcast.serialization import SerializationServiceV1
+
+ENTRY_COUNT = 1000000
+DURATION = 3
+
+
+def create_near_cache(service, policy, strategy):
+    return NearCache(
+        "default",
+        service,
+        InMemoryFormat.OBJECT,
+        None,
+        None,
+        True,
+        policy,
+        ENTRY_COUNT,
+        None,
+        None,
+        strategy,
+    )
+
+
+def measure(op, start_index):
+    ops = 0
+    i = start_index
+    start = time.perf_counter()
+    end = start + DURATION
+    while time.perf_counter() < end:
+        for _ in range(10):
+            op(i)
+            i += 1
+        ops += 10
+    return ops / (time.perf_counter() - start)
+
+
+def run(service, policy_name, policy, strategy_name, strategy):
+    near_cache = create_near_cache(service, policy, strategy)
+    start = time.perf_counter()
+    for i in range(ENTRY_COUNT):
+        near_cache[i] = i
+    fill_time = time.perf_counter() - start
+
+    def get(i):
+        near_cache[i % ENTRY_COUNT]
+
+    def put(i):
+        near_cache[i] = i
+
+    gets = measure(get, 0)
+    puts = measure(put, ENTRY_COUNT)
+    print(
+        "%-4s %-9s fill: %6.2f s %12.1f gets/s %12.1f evicting puts/s"
+        % (policy_name, strategy_name, fill_time, gets, puts)
+    )
+
+
+if __name__ == "__main__":
+    service = SerializationServiceV1(Config())
+    for policy_name, policy in (("LRU", EvictionPolicy.LRU), ("LFU", EvictionPolicy.LFU)):
+        run(service, policy_name, policy, "SAMPLING", EvictionStrategy.SAMPLING)
+        run(service, policy_name, policy, "EXACT", EvictionStrategy.EXACT)
@@ -0,0 +1,143 @@
+"""Measures the throughput of the inbound frame reader.
+
+Feeds ``Map.entry_set`` like responses to the reader in socket sized
+chunks and decodes them, reporting the number of MB/s processed. The
+reader used before the zero-copy one is kept here as the baseline.
+
+    python benchmarks/reader_bench.py
+"""
+import io
+import struct
+import sys
+import time
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast.connection import _Reader
+from hazelcast.protocol.builtin import DataCodec, EntryListCodec
+from hazelcast.protocol.client_message import (
+    SIZE_OF_FRAME_LENGTH_AND_FLAGS,
+    ClientMessageBuilder,
+    Frame,
+    InboundMessage,
+    REQUEST_HEADER_SIZE,
+    create_initial_buffer,
+)
+from hazelcast.protocol.codec import map_entry_set_codec
+from hazelcast.serialization.data import Data
+
+ENTRY_COUNT = 1000
+VALUE_SIZE = 1000
+MESSAGE_COUNT = 200
+CHUNK_SIZE = 128000
+
+_frame_header = struct.Struct("<iH")
+
+
+class _BytesIOReader:
+    def __init__(self, builder):
+        self._buf = io.BytesIO()
+        self._builder = builder
+        self._bytes_read = 0
+        self._bytes_written = 0
+        self._frame_size = -1
+        self._frame_flags = 0
+        self._message = None
+
+    def read(self, data):
+        self._buf.seek(self._bytes_written)
+        self._buf.write(data)
+        self._bytes_written += len(data)
+
+    def process(self):
+        message = self._read_message()
+        while message:
+            self._builder.on_message(message)
+            message = self._read_message()
+
+    def _read_message(self):
+        while True:
+            if self._read_frame():
+                if self._message.end_frame.is_final_frame():
+                    msg = self._message
+                    self._reset()
+                    return msg
+            else:
+                return None
+
+    def _read_frame(self):
+        if self._frame_size == -1:
+            if self.length < SIZE_OF_FRAME_LENGTH_AND_FLAGS:
+                return False
+
+            self._read_frame_size_and_flags()
+
+        if self.length < self._frame_size:
+            return False
+
+        self._buf.seek(self._bytes_read)
+        size = self._frame_size
+        data = self._buf.read(size)
+        self._bytes_read += size
+        self._frame_size = -1
+        frame = Frame(data, self._frame_flags)
+        if not self._message:
+            self._message = InboundMessage(frame)
+        else:
+            self._message.add_frame(frame)
+        return True
+
+    def _read_frame_size_and_flags(self):
+        self._buf.seek(self._bytes_read)
+        header_data = self._buf.read(SIZE_OF_FRAME_LENGTH_AND_FLAGS)
+        self._frame_size, self._frame_flags = _frame_header.unpack_from(header_data, 0)
+        self._frame_size -= SIZE_OF_FRAME_LENGTH_AND_FLAGS
+        self._bytes_read += SIZE_OF_FRAME_LENGTH_AND_FLAGS
+
+    def _reset(self):
+        if self._bytes_written == self._bytes_read:
+            self._buf.seek(0)
+            self._buf.truncate()
+            self._bytes_written = 0
+            self._bytes_read = 0
+        self._message = None
+
+    @property
+    def length(self):
+        return self._bytes_written - self._bytes_read
+
+
+def create_stream():
+    buf = create_initial_buffer(REQUEST_HEADER_SIZE, 0)
+    entries = [
+        (Data(b"k" * 8 + i.to_bytes(8, "big")), Data(b"v" * VALUE_SIZE))
+        for i in range(ENTRY_COUNT)
+    ]
+    EntryListCodec.encode(buf, entries, DataCodec.encode, DataCodec.encode, True)
+    return bytes(buf) * MESSAGE_COUNT
+
+
+def run(reader_class, stream):
+    decoded = []
+
+    def on_message(message):
+        decoded.append(len(map_entry_set_codec.decode_response(message)))
+
+    reader = reader_class(ClientMessageBuilder(on_message))
+    start = time.perf_counter()
+    for i in range(0, len(stream), CHUNK_SIZE):
+        reader.read(stream[i : i + CHUNK_SIZE])
+        reader.process()
+    elapsed = time.perf_counter() - start
+
+    assert decoded == [ENTRY_COUNT] * MESSAGE_COUNT
+    return len(stream) / elapsed / (1 << 20)
+
+
+if __name__ == "__main__":
+    stream = create_stream()
+    print("Stream size: %.2f MB" % (len(stream) / (1 << 20)))
+    for name, reader_class in (("BytesIO reader", _BytesIOReader), ("Zero-copy reader", _Reader)):
+        throughput = max(run(reader_class, stream) for _ in range(5))
+        print("%-20s %10.2f MB/s" % (name, throughput))
@@ -0,0 +1,106 @@
+"""Compares receiving with recv() against recv_into() the reader's buffer.
+
+A writer thread pushes small client messages through a local socket
+pair, the main thread reads them and parses the frames. Reports the
+throughput and the number of receive buffers allocated while reading.
+
+    python benchmarks/recv_bench.py
+"""
+import socket
+import sys
+import threading
+import time
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast.connection import _Reader
+from hazelcast.protocol.client_message import ClientMessageBuilder
+from hazelcast.protocol.codec import map_put_codec
+from hazelcast.serialization.data import Data
+
+MESSAGE_COUNT = 200000
+RECEIVE_BUFFER_SIZE = 128000
+
+
+def create_payload():
+    key = Data(b"k" * 16)
+    value = Data(b"v" * 100)
+    request = map_put_codec.encode_request("map", key, value, 1, -1)
+    return bytes(request.buf) * MESSAGE_COUNT
+
+
+def write(sock, payload, burst_size):
+    # Small bursts resemble many members answering small requests,
+    # where each read returns far less than the receive buffer size.
+    view = memoryview(payload)
+    for i in range(0, len(payload), burst_size):
+        sock.sendall(view[i : i + burst_size])
+
+
+class _Allocations:
+    def __init__(self):
+        self.count = 0
+        self._last = None
+
+    def record(self, buf):
+        if buf is not self._last:
+            self._last = buf
+            self.count += 1
+
+
+def recv(sock, reader, allocations):
+    # Every call allocates a new bytes object.
+    data = sock.recv(RECEIVE_BUFFER_SIZE)
+    allocations.record(data)
+    reader.read(data)
+    return len(data)
+
+
+def recv_into(sock, reader, allocations):
+    buf = reader.get_buffer(RECEIVE_BUFFER_SIZE)
+    allocations.record(buf.obj)
+    bytes_received = sock.recv_into(buf)
+    reader.buffer_updated(bytes_received)
+    return bytes_received
+
+
+def run(receive_fn, payload, burst_size):
+    counter = [0]
+
+    def on_message(_):
+        counter[0] += 1
+
+    reader = _Reader(ClientMessageBuilder(on_message))
+    r, w = socket.socketpair()
+    writer = threading.Thread(target=write, args=(w, payload, burst_size))
+    calls = 0
+    allocations = _Allocations()
+
+    start = time.perf_counter()
+    writer.start()
+    remaining = len(payload)
+    while remaining:
+        remaining -= receive_fn(r, reader, allocations)
+        reader.process()
+        calls += 1
+    elapsed = time.perf_counter() - start
+
+    writer.join()
+    r.close()
+    w.close()
+    assert counter[0] == MESSAGE_COUNT
+    return len(payload) / elapsed / (1 << 20), calls, allocations.count
+
+
+if __name__ == "__main__":
+    payload = create_payload()
+    print("Payload size: %.2f MB" % (len(payload) / (1 << 20)))
+    for burst_size in (len(payload), 4096):
+        print("Burst size: %d bytes" % burst_size)
+        for name, fn in (("recv", recv), ("recv_into", recv_into)):
+            throughput, calls, allocations = run(fn, payload, burst_size)
+            print(
+                "  %-10s %8.2f MB/s %8d reads %8d buffers allocated"
+                % (name, throughput, calls, allocations)
+            )
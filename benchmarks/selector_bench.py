@@ -0,0 +1,103 @@
+"""Compares the poll based reactor loop against the selector based one.
+
+Registers N idle socket pair dispatchers and a single active one that
+echoes a small message back and forth, then reports how many round
+trips each loop completes per second. The poll based loop asks every
+dispatcher whether it is readable/writable on each iteration, so its
+cost grows with N, while the selector based one only visits the
+dispatchers that have events.
+
+    python benchmarks/selector_bench.py
+"""
+import socket
+import sys
+import time
+from collections import deque
+from os.path import dirname
+from threading import get_ident
+
+sys.path.append(dirname(dirname(__file__)))
+
+try:
+    import asyncore
+except ImportError:
+    import hazelcast.asyncore as asyncore  # type: ignore
+
+from hazelcast.reactor import _SelectorLoop, _SelectorMap, _WakeableLoop
+
+CONNECTION_COUNTS = (10, 100, 1000)
+DURATION = 2
+MESSAGE = b"x" * 64
+
+
+class _Dispatcher(asyncore.dispatcher):
+    def __init__(self, sock, loop, map):
+        self._loop = loop
+        self._write_queue = deque()
+        self.messages_received = 0
+        asyncore.dispatcher.__init__(self, sock, map=map)
+
+    def send_message(self):
+        self._write_queue.append(MESSAGE)
+        self._loop.schedule_write(self)
+
+    def handle_read(self):
+        if self.recv(4096):
+            self.messages_received += 1
+            self.send_message()
+
+    def handle_write(self):
+        while self._write_queue:
+            self.send(self._write_queue.popleft())
+
+    def writable(self):
+        return len(self._write_queue) > 0
+
+    def readable(self):
+        return True
+
+
+def run(loop_class, map_class, connection_count):
+    map = map_class()
+    loop = loop_class(map)
+    # Runs the loop on this thread, as the reactor thread would
+    loop._ident = get_ident()
+    sockets = []
+    for _ in range(connection_count):
+        local, remote = socket.socketpair()
+        sockets.append(remote)
+        _Dispatcher(local, loop, map)
+
+    a, b = socket.socketpair()
+    pinger = _Dispatcher(a, loop, map)
+    _Dispatcher(b, loop, map)
+    pinger.send_message()
+
+    iterations = 0
+    start = time.perf_counter()
+    end = start + DURATION
+    while time.perf_counter() < end:
+        loop.run_loop()
+        iterations += 1
+    elapsed = time.perf_counter() - start
+
+    for dispatcher in list(map.values()):
+        dispatcher.close()
+    for sock in sockets:
+        sock.close()
+    return pinger.messages_received / elapsed, iterations / elapsed
+
+
+if __name__ == "__main__":
+    loops = (
+        ("poll", _WakeableLoop, dict),
+        ("selector", _SelectorLoop, _SelectorMap),
+    )
+    for connection_count in CONNECTION_COUNTS:
+        print("Idle connections: %d" % connection_count)
+        for name, loop_class, map_class in loops:
+            round_trips, iterations = run(loop_class, map_class, connection_count)
+            print(
+                "  %-10s %10.0f round trips/s %10.0f iterations/s"
+                % (name, round_trips, iterations)
+            )
@@ -126,7 +126,7 @@ class HazelcastClient:
         self._context = _ClientContext()
         client_id = HazelcastClient._CLIENT_ID.get_and_increment()
         self._name = self._create_client_name(client_id)
-        self._reactor = AsyncoreReactor()
+        self._reactor = AsyncoreReactor(config)
         self._serialization_service = SerializationServiceV1(config)
         self._near_cache_manager = NearCacheManager(config, self._serialization_service)
         self._internal_lifecycle_service = _InternalLifecycleService(config)
@@ -142,7 +142,9 @@ class HazelcastClient:
             self._config,
         )
         self._address_provider = self._create_address_provider()
-        self._internal_partition_service = _InternalPartitionService(self)
+        self._internal_partition_service = _InternalPartitionService(
+            self, config, self._serialization_service
+        )
         self._partition_service = PartitionService(
             self._internal_partition_service,
             self._serialization_service,
@@ -167,6 +169,7 @@ class HazelcastClient:
             self._connection_manager,
             self._invocation_service,
             self._compact_schema_service,
+            self._reactor.profiler,
         )
         self._proxy_manager = ProxyManager(self._context)
         self._cp_subsystem = CPSubsystem(self._context)
@@ -180,6 +183,8 @@ class HazelcastClient:
             self._connection_manager,
             self._invocation_service,
             self._near_cache_manager,
+            self._internal_partition_service,
+            self._listener_service,
         )
         self._cluster_view_listener = ClusterViewListenerService(
             self,
@@ -195,6 +200,12 @@ class HazelcastClient:
             self._listener_service,
             self._compact_schema_service,
         )
+        self._near_cache_manager.init(
+            self._reactor,
+            self._invocation_service,
+            self._internal_cluster_service,
+            self._internal_partition_service,
+        )
         self._internal_sql_service = _InternalSqlService(
             self._connection_manager,
             self._serialization_service,
@@ -545,6 +556,7 @@ class HazelcastClient:
                 self._invocation_service.shutdown()
                 self._statistics.shutdown()
                 self._reactor.shutdown()
+                self._listener_service.shutdown()
                 self._internal_lifecycle_service.fire_lifecycle_event(LifecycleState.SHUTDOWN)
 
     @property
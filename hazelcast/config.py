@@ -1,3 +1,4 @@
+import concurrent.futures
 import re
 import types
 import typing
@@ -98,6 +99,38 @@ class InMemoryFormat:
     """
 
 
+class EvictionStrategy:
+    """Near Cache eviction strategy options."""
+
+    SAMPLING = 0
+    """
+    Evicts the best candidate, according to the eviction policy, among a
+    pool of randomly sampled entries.
+    """
+
+    EXACT = 1
+    """
+    Keeps the entries ordered according to the eviction policy, and evicts
+    the least recently or the least frequently used entry in constant time.
+    Only used with the ``LRU`` and ``LFU`` eviction policies.
+    """
+
+
+class EvictionMaxSizePolicy:
+    """Near Cache maximum size policy options."""
+
+    ENTRY_COUNT = 0
+    """
+    The maximum size is the number of entries in the Near Cache.
+    """
+
+    USED_MEMORY_SIZE = 1
+    """
+    The maximum size is the total size of the keys and values in the Near
+    Cache, in bytes.
+    """
+
+
 class SSLProtocol:
     """SSL protocol options.
 
@@ -210,6 +243,89 @@ class ReconnectMode:
     """
 
 
+class ReactorLoop:
+    """Event loop implementations that the reactor can use to handle
+    the I/O events of the connections."""
+
+    POLL = 0
+    """
+    Polls all the connections on each iteration of the loop, by asking
+    each one of them whether they are interested in reads or writes.
+    """
+
+    SELECTOR = 1
+    """
+    Waits on a selector, such as epoll on Linux and kqueue on BSD and
+    macOS. The interest of a connection is only updated when its
+    outbound queue transitions between empty and non-empty, so the
+    cost of an iteration does not grow with the number of connections.
+    Recommended for clients connected to large clusters.
+    """
+
+
+class InvocationOverloadPolicy:
+    """Policy to deal with the new invocations when the number of
+    concurrent invocations is at the
+    :attr:`Config.max_concurrent_invocations`."""
+
+    BLOCK = 0
+    """
+    The caller waits until one of the ongoing invocations completes, or
+    the invocation times out. Invocations made from the reactor threads
+    do not wait, and are let through.
+    """
+
+    ERROR = 1
+    """
+    The invocation immediately fails with
+    :class:`hazelcast.errors.HazelcastOverloadError`.
+    """
+
+
+class WriteQueueOverloadPolicy:
+    """Policy to deal with the invocations that are about to be sent over
+    a connection whose outbound queue is above the
+    :attr:`Config.write_queue_high_watermark`."""
+
+    BLOCK = 0
+    """
+    The caller waits until the queue drains below the
+    :attr:`Config.write_queue_low_watermark`, or the invocation times out.
+    Invocations made from the reactor threads are queued without waiting.
+    """
+
+    ERROR = 1
+    """
+    The invocation immediately fails with
+    :class:`hazelcast.errors.WriteQueueOverloadError`.
+    """
+
+    REROUTE = 2
+    """
+    The invocation is sent over another connection whose queue is not
+    overloaded, if there is any. Otherwise, it is queued as usual.
+    Invocations bound to a specific connection are never rerouted.
+    """
+
+
+class EventQueueOverloadPolicy:
+    """Policy to deal with the events that arrive while the queue of the
+    event thread they are routed to is full.
+
+    The events are submitted to the queues by the reactor threads, which
+    must never wait, so there is no policy that blocks until there is
+    room in the queue.
+
+    See the :attr:`Config.event_thread_count`.
+    """
+
+    DROP = 0
+    """
+    The event is dropped, a warning is logged, and the number of the
+    dropped events is incremented.
+    """
+
+
 class TopicOverloadPolicy:
     """A policy to deal with an overloaded topic; a topic where there is no
     place to store new messages.
@@ -258,6 +374,7 @@ class TopicOverloadPolicy:
 
 _DEFAULT_CLUSTER_NAME = "dev"
 _DEFAULT_CONNECTION_TIMEOUT = 5.0
+_DEFAULT_RECEIVE_BUFFER_SIZE = 128000
 _DEFAULT_RETRY_INITIAL_BACKOFF = 1.0
 _DEFAULT_RETRY_MAX_BACKOFF = 30.0
 _DEFAULT_RETRY_JITTER = 0.0
@@ -284,6 +401,12 @@ class Config:
         "_client_name",
         "_connection_timeout",
         "_socket_options",
+        "_receive_buffer_size",
+        "_reactor_loop",
+        "_reactor_count",
+        "_write_queue_high_watermark",
+        "_write_queue_low_watermark",
+        "_write_queue_overload_policy",
         "_redo_operation",
         "_smart_routing",
         "_ssl_enabled",
@@ -323,12 +446,27 @@ class Config:
         "_heartbeat_timeout",
         "_invocation_timeout",
         "_invocation_retry_pause",
+        "_max_concurrent_invocations",
+        "_invocation_overload_policy",
         "_statistics_enabled",
         "_statistics_period",
         "_shuffle_member_list",
         "_backup_ack_to_client_enabled",
         "_operation_backup_timeout",
         "_fail_on_indeterminate_operation_state",
+        "_partition_id_cache_size",
+        "_bulk_request_max_entries",
+        "_bulk_request_max_bytes",
+        "_bulk_request_member_grouping",
+        "_lazy_deserialization",
+        "_response_offload_threshold",
+        "_response_offload_executor",
+        "_reactor_slow_call_threshold",
+        "_event_thread_count",
+        "_event_queue_capacity",
+        "_event_queue_overload_policy",
+        "_near_cache_reconciliation_interval",
+        "_near_cache_max_tolerated_miss_count",
         "_creds_username",
         "_creds_password",
         "_token_provider",
@@ -341,6 +479,12 @@ class Config:
         self._client_name: typing.Optional[str] = None
         self._connection_timeout: _Numeric = _DEFAULT_CONNECTION_TIMEOUT
         self._socket_options: typing.List[typing.Tuple[int, int, typing.Union[int, bytes]]] = []
+        self._receive_buffer_size: int = _DEFAULT_RECEIVE_BUFFER_SIZE
+        self._reactor_loop: int = ReactorLoop.POLL
+        self._reactor_count: int = 1
+        self._write_queue_high_watermark: int = -1
+        self._write_queue_low_watermark: int = -1
+        self._write_queue_overload_policy: int = WriteQueueOverloadPolicy.BLOCK
         self._redo_operation: bool = False
         self._smart_routing: bool = True
         self._ssl_enabled: bool = False
@@ -388,12 +532,27 @@ class Config:
         self._heartbeat_timeout: _Numeric = _DEFAULT_HEARTBEAT_TIMEOUT
         self._invocation_timeout: _Numeric = _DEFAULT_INVOCATION_TIMEOUT
         self._invocation_retry_pause: _Numeric = _DEFAULT_INVOCATION_RETRY_PAUSE
+        self._max_concurrent_invocations: int = -1
+        self._invocation_overload_policy: int = InvocationOverloadPolicy.ERROR
         self._statistics_enabled: bool = False
         self._statistics_period: _Numeric = _DEFAULT_STATISTICS_PERIOD
         self._shuffle_member_list: bool = True
         self._backup_ack_to_client_enabled: bool = True
         self._operation_backup_timeout: _Numeric = _DEFAULT_OPERATION_BACKUP_TIMEOUT
         self._fail_on_indeterminate_operation_state: bool = False
+        self._partition_id_cache_size: int = 0
+        self._bulk_request_max_entries: int = -1
+        self._bulk_request_max_bytes: int = -1
+        self._bulk_request_member_grouping: bool = False
+        self._lazy_deserialization: bool = False
+        self._response_offload_threshold: int = -1
+        self._response_offload_executor: typing.Optional[concurrent.futures.Executor] = None
+        self._reactor_slow_call_threshold: _Numeric = -1
+        self._event_thread_count: int = 0
+        self._event_queue_capacity: int = 1000000
+        self._event_queue_overload_policy: int = EventQueueOverloadPolicy.DROP
+        self._near_cache_reconciliation_interval: _Numeric = 60
+        self._near_cache_max_tolerated_miss_count: int = 10
         self._creds_username: typing.Optional[str] = None
         self._creds_password: typing.Optional[str] = None
         self._token_provider: typing.Optional[TokenProvider] = None
@@ -493,6 +652,123 @@ class Config:
 
         self._socket_options = value
 
+    @property
+    def receive_buffer_size(self) -> int:
+        """Maximum number of bytes, the client reads from a member
+        connection at once.
+
+        The received bytes are written directly into a per-connection
+        buffer. Larger values mean fewer system calls
+        under heavy traffic, at the cost of more memory per connection.
+        If the ``SO_RCVBUF`` option is set in the :attr:`socket_options`,
+        its value is used instead. By default, set to ``128000``.
+        """
+        return self._receive_buffer_size
+
+    @receive_buffer_size.setter
+    def receive_buffer_size(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("receive_buffer_size must be an integer")
+
+        if value <= 0:
+            raise ValueError("receive_buffer_size must be positive")
+
+        self._receive_buffer_size = value
+
+    @property
+    def reactor_loop(self) -> int:
+        """Event loop implementation used by the reactor.
+
+        By default, set to ``POLL``. See the
+        :class:`hazelcast.config.ReactorLoop` for possible values.
+        """
+        return self._reactor_loop
+
+    @reactor_loop.setter
+    def reactor_loop(self, value: typing.Union[int, str]) -> None:
+        self._reactor_loop = try_to_get_enum_value(value, ReactorLoop)
+
+    @property
+    def reactor_count(self) -> int:
+        """Number of reactor threads that handle the I/O of the member
+        connections.
+
+        When set to a value greater than ``1``, the connections are
+        distributed across that many threads by the member UUIDs, and the
+        timers are run on a separate thread of their own. It lets the
+        client use more than one core for reading, writing and decoding
+        the messages when connected to multiple members.
+        By default, set to ``1``.
+        """
+        return self._reactor_count
+
+    @reactor_count.setter
+    def reactor_count(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("reactor_count must be an integer")
+
+        if value <= 0:
+            raise ValueError("reactor_count must be positive")
+
+        self._reactor_count = value
+
+    @property
+    def write_queue_high_watermark(self) -> int:
+        """Number of bytes waiting in the outbound queue of a connection,
+        above which the connection is considered overloaded.
+
+        The new invocations that would be sent over an overloaded
+        connection are handled according to the
+        :attr:`write_queue_overload_policy`. When set to ``-1``, the
+        queues are unbounded. By default, set to ``-1``.
+        """
+        return self._write_queue_high_watermark
+
+    @write_queue_high_watermark.setter
+    def write_queue_high_watermark(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("write_queue_high_watermark must be an integer")
+
+        if value <= 0 and value != -1:
+            raise ValueError("write_queue_high_watermark must be positive or -1")
+
+        self._write_queue_high_watermark = value
+
+    @property
+    def write_queue_low_watermark(self) -> int:
+        """Number of bytes waiting in the outbound queue of an overloaded
+        connection, below which it is no longer considered overloaded.
+
+        Must not be greater than the :attr:`write_queue_high_watermark`.
+        When set to ``-1``, half of the high watermark is used.
+        By default, set to ``-1``.
+        """
+        return self._write_queue_low_watermark
+
+    @write_queue_low_watermark.setter
+    def write_queue_low_watermark(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("write_queue_low_watermark must be an integer")
+
+        if value < 0 and value != -1:
+            raise ValueError("write_queue_low_watermark must be non-negative or -1")
+
+        self._write_queue_low_watermark = value
+
+    @property
+    def write_queue_overload_policy(self) -> int:
+        """Policy to deal with the invocations that are about to be sent
+        over an overloaded connection.
+
+        See the :class:`hazelcast.config.WriteQueueOverloadPolicy` for
+        possible values. By default, set to ``BLOCK``.
+        """
+        return self._write_queue_overload_policy
+
+    @write_queue_overload_policy.setter
+    def write_queue_overload_policy(self, value: typing.Union[int, str]) -> None:
+        self._write_queue_overload_policy = try_to_get_enum_value(value, WriteQueueOverloadPolicy)
+
     @property
     def redo_operation(self) -> bool:
         """When set to ``True``, the client will redo the operations that
@@ -1363,6 +1639,43 @@ class Config:
 
         self._invocation_retry_pause = value
 
+    @property
+    def max_concurrent_invocations(self) -> int:
+        """Maximum number of invocations that can be in flight at the
+        same time.
+
+        The new invocations made while the client is at the limit are
+        handled according to the :attr:`invocation_overload_policy`.
+        Urgent invocations made by the client itself, such as
+        heartbeats, are not limited. When set to ``-1``, the number of
+        concurrent invocations is not limited. By default, set to ``-1``.
+        """
+        return self._max_concurrent_invocations
+
+    @max_concurrent_invocations.setter
+    def max_concurrent_invocations(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("max_concurrent_invocations must be an integer")
+
+        if value <= 0 and value != -1:
+            raise ValueError("max_concurrent_invocations must be positive or -1")
+
+        self._max_concurrent_invocations = value
+
+    @property
+    def invocation_overload_policy(self) -> int:
+        """Policy to deal with the new invocations when the client is at
+        the :attr:`max_concurrent_invocations`.
+
+        See the :class:`hazelcast.config.InvocationOverloadPolicy` for
+        possible values. By default, set to ``ERROR``.
+        """
+        return self._invocation_overload_policy
+
+    @invocation_overload_policy.setter
+    def invocation_overload_policy(self, value: typing.Union[int, str]) -> None:
+        self._invocation_overload_policy = try_to_get_enum_value(value, InvocationOverloadPolicy)
+
     @property
     def statistics_enabled(self) -> bool:
         """When set to ``True``, the client statistics collection is enabled.
@@ -1475,6 +1788,291 @@ class Config:
 
         self._fail_on_indeterminate_operation_state = value
 
+    @property
+    def partition_id_cache_size(self) -> int:
+        """Maximum number of keys whose serialized forms and partition
+        ids are cached by the client.
+
+        Only the keys of type ``str``, ``int``, ``bytes`` and
+        ``uuid.UUID`` are cached, and the least recently used ones are
+        evicted when the cache is full. This avoids serializing and
+        hashing the frequently used keys over and over again, in the
+        key based operations of the maps. When set to ``0``, the cache
+        is disabled. By default, set to ``0``.
+        """
+        return self._partition_id_cache_size
+
+    @partition_id_cache_size.setter
+    def partition_id_cache_size(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("partition_id_cache_size must be an integer")
+
+        if value < 0:
+            raise ValueError("partition_id_cache_size must be non-negative")
+
+        self._partition_id_cache_size = value
+
+    @property
+    def bulk_request_max_entries(self) -> int:
+        """Maximum number of entries sent in a single request by the bulk
+        operations of the maps, such as ``put_all`` and ``get_all``.
+
+        The entries of a partition are split into several requests, which
+        are sent at the same time, if they do not fit into a single one.
+        The results of the requests are merged as before. When set to
+        ``-1``, the number of entries is not limited. By default, set to
+        ``-1``.
+        """
+        return self._bulk_request_max_entries
+
+    @bulk_request_max_entries.setter
+    def bulk_request_max_entries(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("bulk_request_max_entries must be an integer")
+
+        if value <= 0 and value != -1:
+            raise ValueError("bulk_request_max_entries must be positive or -1")
+
+        self._bulk_request_max_entries = value
+
+    @property
+    def bulk_request_max_bytes(self) -> int:
+        """Maximum total size of the serialized keys and values sent in a
+        single request by the bulk operations of the maps, such as
+        ``put_all`` and ``get_all``, in bytes.
+
+        Works the same way as the :attr:`bulk_request_max_entries`. An
+        entry larger than this limit is sent in a request of its own.
+        When set to ``-1``, the size of the requests is not limited. By
+        default, set to ``-1``.
+        """
+        return self._bulk_request_max_bytes
+
+    @bulk_request_max_bytes.setter
+    def bulk_request_max_bytes(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("bulk_request_max_bytes must be an integer")
+
+        if value <= 0 and value != -1:
+            raise ValueError("bulk_request_max_bytes must be positive or -1")
+
+        self._bulk_request_max_bytes = value
+
+    @property
+    def bulk_request_member_grouping(self) -> bool:
+        """When set to ``True``, the requests of the bulk operations of
+        the maps, such as ``get_all``, that are sent to the same member
+        are written back-to-back, after all of them are made.
+
+        The requests are still made per partition, and they are
+        completed and retried separately. By default, set to ``False``.
+        """
+        return self._bulk_request_member_grouping
+
+    @bulk_request_member_grouping.setter
+    def bulk_request_member_grouping(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError("bulk_request_member_grouping must be a boolean")
+
+        self._bulk_request_member_grouping = value
+
+    @property
+    def lazy_deserialization(self) -> bool:
+        """When set to ``True``, the bulk operations, such as ``values``,
+        ``entry_set`` and ``get_all`` of the maps and ``read_many`` of
+        the ringbuffers, return read-only views over the serialized
+        results instead of lists and dictionaries of deserialized objects.
+
+        The items are deserialized on their first access, and cached
+        afterwards. By default, set to ``False``.
+        """
+        return self._lazy_deserialization
+
+    @lazy_deserialization.setter
+    def lazy_deserialization(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError("lazy_deserialization must be a boolean")
+
+        self._lazy_deserialization = value
+
+    @property
+    def response_offload_threshold(self) -> int:
+        """Size of the responses, in bytes, at or above which the responses
+        are decoded and deserialized on the :attr:`response_offload_executor`
+        instead of the reactor thread.
+
+        Handling a large response on the reactor thread delays all the other
+        responses, including the heartbeats. The smaller responses are still
+        handled on the reactor thread, as handing them off costs more than
+        handling them. When set to ``-1``, all the responses are handled on
+        the reactor thread. By default, set to ``-1``.
+        """
+        return self._response_offload_threshold
+
+    @response_offload_threshold.setter
+    def response_offload_threshold(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("response_offload_threshold must be an integer")
+
+        if value <= 0 and value != -1:
+            raise ValueError("response_offload_threshold must be positive or -1")
+
+        self._response_offload_threshold = value
+
+    @property
+    def response_offload_executor(self) -> typing.Optional[concurrent.futures.Executor]:
+        """Executor to handle the responses at or above the
+        :attr:`response_offload_threshold` on.
+
+        The response handlers are closures, so the executor must run them
+        in the client process, like a ``ThreadPoolExecutor`` does. It is not
+        shut down by the client. When set to ``None``, the client uses a
+        ``ThreadPoolExecutor`` of its own. By default, set to ``None``.
+        """
+        return self._response_offload_executor
+
+    @response_offload_executor.setter
+    def response_offload_executor(
+        self, value: typing.Optional[concurrent.futures.Executor]
+    ) -> None:
+        if not isinstance(value, concurrent.futures.Executor) and value is not None:
+            raise TypeError("response_offload_executor must be an Executor or None")
+
+        self._response_offload_executor = value
+
+    @property
+    def reactor_slow_call_threshold(self) -> _Numeric:
+        """Duration, in seconds, above which the calls made on the reactor
+        threads are logged as slow.
+
+        When set, the durations of the reactor loop iterations, the Future
+        callbacks and the event handlers run on the reactor threads are
+        measured. The slow ones are logged with the qualified names of the
+        callables, and the duration histograms are sent to the cluster
+        along with the other client statistics. When set to ``-1``,
+        nothing is measured. By default, set to ``-1``.
+        """
+        return self._reactor_slow_call_threshold
+
+    @reactor_slow_call_threshold.setter
+    def reactor_slow_call_threshold(self, value: _Numeric) -> None:
+        if not isinstance(value, number_types):
+            raise TypeError("reactor_slow_call_threshold must be a number")
+
+        if value < 0 and value != -1:
+            raise ValueError("reactor_slow_call_threshold must be non-negative or -1")
+
+        self._reactor_slow_call_threshold = value
+
+    @property
+    def event_thread_count(self) -> int:
+        """Number of threads that run the event handlers of the entry
+        listeners.
+
+        The events of the entry listeners of the Map, MultiMap and
+        ReplicatedMap proxies are routed to the threads by their partition
+        ids, so the events of the same key are always handled in the order
+        they are received, while a slow listener does not delay the
+        responses read by the reactor threads. The events of the other
+        listeners, including the internal ones, are handled on the reactor
+        threads. When set to ``0``, all the events are handled on the
+        reactor threads. By default, set to ``0``.
+        """
+        return self._event_thread_count
+
+    @event_thread_count.setter
+    def event_thread_count(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("event_thread_count must be an integer")
+
+        if value < 0:
+            raise ValueError("event_thread_count must be non-negative")
+
+        self._event_thread_count = value
+
+    @property
+    def event_queue_capacity(self) -> int:
+        """Maximum number of events waiting to be handled, per event thread.
+
+        The events that arrive while the queue is full are handled according
+        to the :attr:`event_queue_overload_policy`. Only used when the
+        :attr:`event_thread_count` is positive. By default, set to
+        ``1000000``.
+        """
+        return self._event_queue_capacity
+
+    @event_queue_capacity.setter
+    def event_queue_capacity(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("event_queue_capacity must be an integer")
+
+        if value <= 0:
+            raise ValueError("event_queue_capacity must be positive")
+
+        self._event_queue_capacity = value
+
+    @property
+    def event_queue_overload_policy(self) -> int:
+        """Policy to deal with the events that arrive while the queue of
+        their event thread is full.
+
+        See the :class:`hazelcast.config.EventQueueOverloadPolicy` for
+        possible values. By default, set to ``DROP``, which is currently
+        the only policy.
+        """
+        return self._event_queue_overload_policy
+
+    @event_queue_overload_policy.setter
+    def event_queue_overload_policy(self, value: typing.Union[int, str]) -> None:
+        self._event_queue_overload_policy = try_to_get_enum_value(value, EventQueueOverloadPolicy)
+
+    @property
+    def near_cache_reconciliation_interval(self) -> _Numeric:
+        """Period, in seconds, in which the invalidation metadata of the
+        Near Caches are fetched from the members.
+
+        The fetched partition UUIDs and sequence numbers are compared against
+        the ones received with the invalidation events, so that the records
+        that might have missed an invalidation are detected and not served
+        from the Near Caches. When set to ``0``, the metadata is fetched
+        only once, while the Near Cache is created. By default, set to
+        ``60``.
+        """
+        return self._near_cache_reconciliation_interval
+
+    @near_cache_reconciliation_interval.setter
+    def near_cache_reconciliation_interval(self, value: _Numeric) -> None:
+        if not isinstance(value, number_types):
+            raise TypeError("near_cache_reconciliation_interval must be a number")
+
+        if value < 0:
+            raise ValueError("near_cache_reconciliation_interval must be non-negative")
+
+        self._near_cache_reconciliation_interval = value
+
+    @property
+    def near_cache_max_tolerated_miss_count(self) -> int:
+        """Maximum number of invalidations that the Near Caches might miss
+        before their records are considered as stale.
+
+        When the total number of missed invalidations, detected by the gaps
+        in the sequence numbers of the received invalidation events, exceeds
+        this value, the records of the partitions with missed invalidations
+        are not served from the Near Caches anymore. By default, set to
+        ``10``.
+        """
+        return self._near_cache_max_tolerated_miss_count
+
+    @near_cache_max_tolerated_miss_count.setter
+    def near_cache_max_tolerated_miss_count(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError("near_cache_max_tolerated_miss_count must be an integer")
+
+        if value < 0:
+            raise ValueError("near_cache_max_tolerated_miss_count must be non-negative")
+
+        self._near_cache_max_tolerated_miss_count = value
+
     @property
     def creds_username(self) -> typing.Optional[str]:
         """Username for credentials authentication (Enterprise feature)."""
@@ -1568,6 +2166,9 @@ class NearCacheConfig:
         "_eviction_max_size",
         "_eviction_sampling_count",
         "_eviction_sampling_pool_size",
+        "_eviction_strategy",
+        "_eviction_max_size_policy",
+        "_object_sizer",
     )
 
     def __init__(self):
@@ -1579,6 +2180,9 @@ class NearCacheConfig:
         self._eviction_max_size: int = 10000
         self._eviction_sampling_count: int = 8
         self._eviction_sampling_pool_size: int = 16
+        self._eviction_strategy: int = EvictionStrategy.SAMPLING
+        self._eviction_max_size_policy: int = EvictionMaxSizePolicy.ENTRY_COUNT
+        self._object_sizer: typing.Optional[typing.Callable[[typing.Any], int]] = None
 
     @property
     def invalidate_on_change(self) -> bool:
@@ -1668,6 +2272,9 @@ class NearCacheConfig:
         """Defines maximum number of entries kept in the memory before
         eviction kicks in.
 
+        When the :attr:`eviction_max_size_policy` is ``USED_MEMORY_SIZE``,
+        defines the maximum total size of the keys and values, in bytes.
+
         By default, set to ``10000``.
         """
         return self._eviction_max_size
@@ -1720,6 +2327,54 @@ class NearCacheConfig:
 
         self._eviction_sampling_pool_size = value
 
+    @property
+    def eviction_strategy(self) -> int:
+        """Defines how the entry to evict is chosen.
+
+        See the :class:`hazelcast.config.EvictionStrategy` for possible values.
+
+        By default, set to ``SAMPLING``.
+        """
+        return self._eviction_strategy
+
+    @eviction_strategy.setter
+    def eviction_strategy(self, value: typing.Union[int, str]) -> None:
+        self._eviction_strategy = try_to_get_enum_value(value, EvictionStrategy)
+
+    @property
+    def eviction_max_size_policy(self) -> int:
+        """Defines how the :attr:`eviction_max_size` is interpreted.
+
+        See the :class:`hazelcast.config.EvictionMaxSizePolicy` for possible
+        values.
+
+        By default, set to ``ENTRY_COUNT``.
+        """
+        return self._eviction_max_size_policy
+
+    @eviction_max_size_policy.setter
+    def eviction_max_size_policy(self, value: typing.Union[int, str]) -> None:
+        self._eviction_max_size_policy = try_to_get_enum_value(value, EvictionMaxSizePolicy)
+
+    @property
+    def object_sizer(self) -> typing.Optional[typing.Callable[[typing.Any], int]]:
+        """Function that returns the size of a key or a value, in bytes.
+
+        Used to compute the sizes of the objects that are not stored in
+        the serialized form, like the values stored in the ``OBJECT``
+        in-memory format. The serialized keys and values are sized by the
+        length of their binary forms. When not set, ``sys.getsizeof`` is
+        used, which returns the shallow sizes of the objects.
+        """
+        return self._object_sizer
+
+    @object_sizer.setter
+    def object_sizer(self, value: typing.Callable[[typing.Any], int]) -> None:
+        if not callable(value):
+            raise TypeError("object_sizer must be a function")
+
+        self._object_sizer = value
+
     @classmethod
     def from_dict(cls, d: typing.Dict[str, typing.Any]) -> "NearCacheConfig":
         """Constructs a configuration object out of the given dictionary.
@@ -1,4 +1,3 @@
-import io
 import logging
 import random
 import struct
@@ -392,12 +391,12 @@ class ConnectionManager:
 
         try:
             translated = self._translate_member_address(member)
-            connection = self._create_connection(translated)
+            connection = self._create_connection(translated, member.uuid)
             return self._authenticate(connection).continue_with(self._on_auth, connection)
         except Exception as e:
             return ImmediateExceptionFuture(e)
 
-    def _create_connection(self, address):
+    def _create_connection(self, address, member_uuid=None):
         factory = self._reactor.connection_factory
         return factory(
             self,
@@ -405,6 +404,7 @@ class ConnectionManager:
             address,
             self._config,
             self._invocation_service.handle_client_message,
+            member_uuid,
         )
 
     def _translate(self, address):
@@ -861,10 +861,31 @@ class _HeartbeatManager:
 
 _frame_header = struct.Struct("<iH")
 
+# Initial capacity of the buffer frames are read into.
+_READ_BUFFER_SIZE = 128000
+
+# A new buffer is allocated for the incoming bytes if the
+# free space left in the current one is below this.
+_MIN_FREE_SPACE = 8192
+
 
 class _Reader:
-    def __init__(self, builder):
-        self._buf = io.BytesIO()
+    """Parses frames out of the bytes received from a connection.
+
+    Received bytes are accumulated in a preallocated ``bytearray`` and
+    every frame is handed out as a ``memoryview`` slice of it, without
+    copying the payload. Since the frames may outlive the next read,
+    the buffer is never overwritten in place. When there is not enough
+    room left for the incoming bytes, a fresh buffer is allocated and
+    only the unread tail (i.e. the part of a frame that spans over the
+    end of the old buffer) is copied into it. The old buffer is released
+    once no frame references it anymore.
+    """
+
+    def __init__(self, builder, buffer_size=_READ_BUFFER_SIZE):
+        self._buffer_size = buffer_size
+        self._buf = bytearray(buffer_size)
+        self._view = memoryview(self._buf)
         self._builder = builder
         self._bytes_read = 0
         self._bytes_written = 0
@@ -874,9 +895,26 @@ class _Reader:
         self._message = None
 
     def read(self, data):
-        self._buf.seek(self._bytes_written)
-        self._buf.write(data)
-        self._bytes_written += len(data)
+        size = len(data)
+        self._ensure_capacity(size)
+        end = self._bytes_written + size
+        self._view[self._bytes_written : end] = data
+        self._bytes_written = end
+
+    def get_buffer(self, sizehint):
+        """Returns a writable view over the free part of the buffer.
+
+        The view is at most ``sizehint`` bytes long. After writing
+        into it, :func:`buffer_updated` must be called with the number
+        of bytes written.
+        """
+        if len(self._buf) - self._bytes_written < min(sizehint, _MIN_FREE_SPACE):
+            self._ensure_capacity(sizehint)
+
+        return self._view[self._bytes_written : self._bytes_written + sizehint]
+
+    def buffer_updated(self, nbytes):
+        self._bytes_written += nbytes
 
     def process(self):
         message = self._read_message()
@@ -905,11 +943,10 @@ class _Reader:
         if self.length < self._frame_size:
             return False
 
-        self._buf.seek(self._bytes_read)
-        size = self._frame_size
-        data = self._buf.read(size)
-        self._bytes_read += size
+        start = self._bytes_read
+        self._bytes_read += self._frame_size
         self._frame_size = -1
+        data = self._view[start : self._bytes_read]
         # No need to reset flags since it will be overwritten on the next read_frame_size_and_flags call
         frame = Frame(data, self._frame_flags)
         if not self._message:
@@ -919,18 +956,32 @@ class _Reader:
         return True
 
     def _read_frame_size_and_flags(self):
-        self._buf.seek(self._bytes_read)
-        header_data = self._buf.read(SIZE_OF_FRAME_LENGTH_AND_FLAGS)
-        self._frame_size, self._frame_flags = _frame_header.unpack_from(header_data, 0)
+        self._frame_size, self._frame_flags = _frame_header.unpack_from(self._buf, self._bytes_read)
         self._frame_size -= SIZE_OF_FRAME_LENGTH_AND_FLAGS
         self._bytes_read += SIZE_OF_FRAME_LENGTH_AND_FLAGS
 
+    def _ensure_capacity(self, size):
+        if self._bytes_written + size <= len(self._buf):
+            return
+
+        length = self.length
+        required = length + size
+        if self._frame_size != -1:
+            # The header of the current frame is already consumed,
+            # make room for the rest of it at once.
+            required = max(required, self._frame_size)
+        elif length >= SIZE_OF_FRAME_LENGTH_AND_FLAGS:
+            frame_length = _frame_header.unpack_from(self._buf, self._bytes_read)[0]
+            required = max(required, frame_length)
+
+        buf = bytearray(max(self._buffer_size, required))
+        buf[:length] = self._view[self._bytes_read : self._bytes_written]
+        self._buf = buf
+        self._view = memoryview(buf)
+        self._bytes_read = 0
+        self._bytes_written = length
+
     def _reset(self):
-        if self._bytes_written == self._bytes_read:
-            self._buf.seek(0)
-            self._buf.truncate()
-            self._bytes_written = 0
-            self._bytes_read = 0
         self._message = None
 
     @property
@@ -952,6 +1003,8 @@ class Connection:
         self.server_version = UNKNOWN_VERSION
         self.live = True
         self.close_reason = None
+        # Set while the outbound queue is above the high watermark
+        self.overloaded = False
 
         self._connection_manager = connection_manager
         self._id = connection_id
@@ -973,6 +1026,39 @@ class Connection:
         self._write(message.buf)
         return True
 
+    def send_messages(self, messages):
+        """Sends the messages to this connection, back-to-back.
+
+        Args:
+            messages (list[hazelcast.protocol.client_message.OutboundMessage]): Messages to be
+                sent to this connection.
+
+        Returns:
+            bool: ``True`` if the messages are written to the socket, ``False`` otherwise.
+        """
+        if not self.live:
+            return False
+
+        self._write_many([message.buf for message in messages])
+        return True
+
+    @property
+    def write_queue_size(self):
+        """Number of bytes waiting in the outbound queue."""
+        raise NotImplementedError("write_queue_size")
+
+    def wait_until_writable(self, timeout):
+        """Blocks until the connection is no longer overloaded, or closed.
+
+        Args:
+            timeout (float): Maximum time to wait for, in seconds.
+
+        Returns:
+            bool: ``False`` if the connection is still overloaded after
+            the timeout, ``True`` otherwise.
+        """
+        raise NotImplementedError("wait_until_writable")
+
     # Not named close to distinguish it from the asyncore.dispatcher.close.
     def close_connection(self, reason, cause):
         """Closes the connection.
@@ -1013,6 +1099,10 @@ class Connection:
     def _write(self, buf):
         raise NotImplementedError()
 
+    def _write_many(self, bufs):
+        for buf in bufs:
+            self._write(buf)
+
     def __eq__(self, other):
         return isinstance(other, Connection) and self._id == other._id
 
@@ -452,6 +452,14 @@ class InvocationMightContainCompactDataError(HazelcastError):
         )
 
 
+class WriteQueueOverloadError(HazelcastError):
+    """
+    Signals that the outbound queue of the connection that the invocation
+    would be sent over is above the configured high watermark, and the
+    :class:`hazelcast.config.WriteQueueOverloadPolicy` is ``ERROR``.
+    """
+
+
 # Error Codes
 _UNDEFINED = 0
 _ARRAY_INDEX_OUT_OF_BOUNDS = 1
@@ -13,13 +13,18 @@ _SENTINEL = object()
 ResultType = typing.TypeVar("ResultType")
 
 
+class _FutureLocals(threading.local):
+    # Set on the reactor threads when the reactor calls are profiled
+    profiler = None
+
+
 class Future(typing.Generic[ResultType]):
     """Future is used for representing an asynchronous computation result."""
 
     _result = _SENTINEL
     _exception = None
     _traceback = None
-    _threading_locals = threading.local()
+    _threading_locals = _FutureLocals()
 
     def __init__(self):
         self._callbacks = []
@@ -119,11 +124,20 @@ class Future(typing.Generic[ResultType]):
                 self._callbacks.append(callback)
 
         if run_callback:
-            self._invoke_cb(callback)
+            profiler = self._threading_locals.profiler
+            if profiler is None:
+                self._invoke_cb(callback)
+            else:
+                profiler.run_callback(self._invoke_cb, callback)
 
     def _invoke_callbacks(self):
-        for callback in self._callbacks:
-            self._invoke_cb(callback)
+        profiler = self._threading_locals.profiler
+        if profiler is None:
+            for callback in self._callbacks:
+                self._invoke_cb(callback)
+        else:
+            for callback in self._callbacks:
+                profiler.run_callback(self._invoke_cb, callback)
 
     def _invoke_cb(self, callback):
         try:
@@ -1,38 +1,42 @@
-from hazelcast.serialization import LE_UINT
+import struct
 
+try:
+    # Optional, C implementation of the same hash function.
+    # Available as the "hash" extra.
+    from mmh3 import mmh3_32_sintdigest
 
-def murmur_hash3_x86_32(data):
-    """murmur3 hash function to determine partition
+    _MMH3_ENABLED = True
+except ImportError:
+    _MMH3_ENABLED = False
 
-    Args:
-        data (bytearray or bytes): Input byte array
+_SEED = 0x01000193
+_BLOCK = struct.Struct("<I")
 
-    Returns:
-        int: Calculated hash value.
-    """
+
+def _murmur_hash3_x86_32(data):
     length = max(len(data) - 8, 0)  # Heap data overhead
     nblocks = length // 4
 
-    h1 = 0x01000193
+    h1 = _SEED
 
     c1 = 0xCC9E2D51
     c2 = 0x1B873593
 
     # body
-    for block_start in range(0, nblocks * 4, 4):
-        # ??? big endian?
-        k1 = LE_UINT.unpack_from(data, block_start + 8)[0]
-
-        k1 = c1 * k1 & 0xFFFFFFFF
-        k1 = (k1 << 15 | k1 >> 17) & 0xFFFFFFFF  # inlined ROTL32
-        k1 = (c2 * k1) & 0xFFFFFFFF
+    tail_index = nblocks * 4
+    if nblocks:
+        # Unpack all the blocks in one go, instead
+        # of one unpack_from call per block.
+        for (k1,) in _BLOCK.iter_unpack(memoryview(data)[8 : tail_index + 8]):
+            k1 = c1 * k1 & 0xFFFFFFFF
+            k1 = (k1 << 15 | k1 >> 17) & 0xFFFFFFFF  # inlined ROTL32
+            k1 = (c2 * k1) & 0xFFFFFFFF
 
-        h1 ^= k1
-        h1 = (h1 << 13 | h1 >> 19) & 0xFFFFFFFF  # inlined _ROTL32
-        h1 = (h1 * 5 + 0xE6546B64) & 0xFFFFFFFF
+            h1 ^= k1
+            h1 = (h1 << 13 | h1 >> 19) & 0xFFFFFFFF  # inlined _ROTL32
+            h1 = (h1 * 5 + 0xE6546B64) & 0xFFFFFFFF
 
     # tail
-    tail_index = nblocks * 4
     k1 = 0
     tail_size = length & 3
 
@@ -59,6 +63,27 @@ def murmur_hash3_x86_32(data):
     return -(h1 & 0x80000000) | (h1 & 0x7FFFFFFF)
 
 
+def _mmh3_murmur_hash3_x86_32(data):
+    return mmh3_32_sintdigest(memoryview(data)[8:], _SEED)
+
+
+def murmur_hash3_x86_32(data):
+    """murmur3 hash function to determine partition
+
+    Uses the C implementation of the ``mmh3`` package, if it is installed.
+
+    Args:
+        data (bytearray or bytes): Input byte array
+
+    Returns:
+        int: Calculated hash value.
+    """
+    return _murmur_hash3_x86_32_impl(data)
+
+
+_murmur_hash3_x86_32_impl = _mmh3_murmur_hash3_x86_32 if _MMH3_ENABLED else _murmur_hash3_x86_32
+
+
 def hash_to_index(mm_hash, length):
     if mm_hash == 0x80000000:
         return 0
@@ -177,7 +177,9 @@ class HazelcastClient:
             self._config,
         )
         self._address_provider = self._create_address_provider()
-        self._internal_partition_service = InternalPartitionService(self)
+        self._internal_partition_service = InternalPartitionService(
+            self, config, self._serialization_service
+        )
         self._partition_service = PartitionService(
             self._internal_partition_service,
             self._serialization_service,
@@ -221,6 +223,7 @@ class HazelcastClient:
             self._connection_manager,
             self._invocation_service,
             self._near_cache_manager,
+            self._internal_partition_service,
         )
         self._cluster_view_listener = ClusterViewListenerService(
             self,
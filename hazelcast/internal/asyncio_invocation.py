@@ -2,13 +2,16 @@ import asyncio
 import logging
 import time
 import functools
+import typing
 
+from hazelcast.config import InvocationOverloadPolicy
 from hazelcast.errors import (
     create_error_from_message,
     HazelcastInstanceNotActiveError,
     is_retryable_error,
     TargetDisconnectedError,
     HazelcastClientNotActiveError,
+    HazelcastOverloadError,
     TargetNotMemberError,
     EXCEPTION_MESSAGE_TYPE,
     IndeterminateOperationStateError,
@@ -43,6 +46,7 @@ class Invocation:
         "backup_acks_expected",
         "pending_response",
         "pending_response_received_time",
+        "has_permit",
     )
 
     def __init__(
@@ -70,6 +74,9 @@ class Invocation:
         self.backup_acks_expected = -1
         self.pending_response = None
         self.pending_response_received_time = -1
+        # Whether the invocation holds one of the concurrent invocation
+        # permits, which is released once the invocation is completed
+        self.has_permit = False
 
 
 class InvocationService:
@@ -99,6 +106,15 @@ class InvocationService:
         self._clean_resources_task = None
         self._shutdown = False
         self._compact_schema_service = None
+        self._invocation_overload_policy = config.invocation_overload_policy
+        max_concurrent_invocations = config.max_concurrent_invocations
+        self._max_concurrent_invocations = max_concurrent_invocations
+        self._invocation_semaphore = None
+        # The tasks waiting for the invocation permits, referenced until
+        # they are done, so that they are not garbage collected
+        self._permit_tasks: typing.Set[asyncio.Task] = set()
+        if max_concurrent_invocations != -1:
+            self._invocation_semaphore = asyncio.Semaphore(max_concurrent_invocations)
 
     def init(self, partition_service, connection_manager, listener_service, compact_schema_service):
         self._partition_service = partition_service
@@ -141,6 +157,47 @@ class InvocationService:
         request = invocation.request
         request.set_correlation_id(correlation_id)
         request.set_partition_id(invocation.partition_id)
+        if self._invocation_semaphore and not invocation.urgent:
+            task = asyncio.create_task(self._invoke_with_permit(invocation))
+            self._permit_tasks.add(task)
+            task.add_done_callback(self._permit_tasks.discard)
+            return
+
+        self._do_invoke(invocation)
+
+    async def _invoke_with_permit(self, invocation):
+        semaphore = self._invocation_semaphore
+        if semaphore.locked():
+            if self._invocation_overload_policy == InvocationOverloadPolicy.ERROR:
+                invocation.future.set_exception(
+                    HazelcastOverloadError(
+                        "Maximum number of concurrent invocations (%s) is reached"
+                        % self._max_concurrent_invocations
+                    )
+                )
+                return
+
+            try:
+                await asyncio.wait_for(semaphore.acquire(), invocation.timeout - time.time())
+            except asyncio.TimeoutError:
+                if not invocation.future.done():
+                    invocation.future.set_exception(
+                        HazelcastOverloadError(
+                            "Timed out while waiting for one of the %s concurrent "
+                            "invocations to complete" % self._max_concurrent_invocations
+                        )
+                    )
+                return
+        else:
+            # Does not suspend, as the semaphore is not locked
+            await semaphore.acquire()
+
+        if invocation.future.done():
+            # Cancelled while waiting
+            semaphore.release()
+            return
+
+        invocation.has_permit = True
         self._do_invoke(invocation)
 
     async def ainvoke(self, invocation: Invocation):
@@ -265,12 +322,21 @@ class InvocationService:
 
         correlation_id = invocation.request.get_correlation_id()
         self._pending.pop(correlation_id, None)
+        self._release_invocation_permit(invocation)
 
     def _complete_with_error(self, invocation, error):
         if not invocation.future.cancelled():
             invocation.future.set_exception(error)
         correlation_id = invocation.request.get_correlation_id()
         self._pending.pop(correlation_id, None)
+        self._release_invocation_permit(invocation)
+
+    def _release_invocation_permit(self, invocation):
+        # The invocation might be completed more than once, e.g. on
+        # shutdown, concurrently with its response.
+        if invocation.has_permit:
+            invocation.has_permit = False
+            self._invocation_semaphore.release()
 
     def _fetch_schema_and_complete_again(
         self, error: SchemaNotFoundError, invocation: Invocation, message: InboundMessage
@@ -5,6 +5,7 @@ import typing
 
 from hazelcast.errors import ClientOfflineError
 from hazelcast.hash import hash_to_index
+from hazelcast.partition import _CACHEABLE_KEY_TYPES, _KeyData, _PartitionIdCache
 from hazelcast.serialization.compact import SchemaNotReplicatedError
 
 _logger = logging.getLogger(__name__)
@@ -58,13 +59,35 @@ class PartitionService:
             The partition id.
         """
         try:
-            key_data = self._serialization_service.to_data(key)
+            key_data = self._service.to_key_data(key)
         except SchemaNotReplicatedError as e:
             await self._send_schema_and_retry_fn(e, lambda: None)
             return await self.get_partition_id(key)
 
         return self._service.get_partition_id(key_data)
 
+    async def get_partition_ids(self, keys: typing.Sequence[typing.Any]) -> typing.List[int]:
+        """
+        Returns the partition ids for the given keys, in the same order.
+
+        This is equivalent to calling :func:`get_partition_id` for each key,
+        but hashes the whole batch in one call.
+
+        Args:
+            keys: The given keys.
+
+        Returns:
+            The partition ids.
+        """
+        try:
+            to_data = self._service.to_key_data
+            keys_data = [to_data(key) for key in keys]
+        except SchemaNotReplicatedError as e:
+            await self._send_schema_and_retry_fn(e, lambda: None)
+            return await self.get_partition_ids(keys)
+
+        return self._service.get_partition_ids(keys_data)
+
     def get_partition_count(self) -> int:
         """
         Returns partition count of the connected cluster.
@@ -78,12 +101,25 @@ class PartitionService:
 
 
 class InternalPartitionService:
-    __slots__ = ("partition_count", "_client", "_partition_table")
-
-    def __init__(self, client):
+    __slots__ = (
+        "partition_count",
+        "to_key_data",
+        "_client",
+        "_partition_table",
+        "_to_data",
+        "_key_cache",
+    )
+
+    def __init__(self, client, config, serialization_service):
         self.partition_count = 0
         self._client = client
         self._partition_table = _PartitionTable(None, -1, {})
+        self._to_data = serialization_service.to_data
+        self._key_cache = None
+        self.to_key_data = self._to_data
+        if config.partition_id_cache_size > 0:
+            self._key_cache = _PartitionIdCache(config.partition_id_cache_size)
+            self.to_key_data = self._to_key_data_cached
 
     def handle_partitions_view_event(self, connection, partitions, version):
         _logger.debug("Handling new partition table with version: %s", version)
@@ -108,12 +144,36 @@ class InternalPartitionService:
             raise ClientOfflineError()
         return hash_to_index(key.get_partition_hash(), self.partition_count)
 
+    def get_partition_ids(self, keys):
+        partition_count = self.partition_count
+        if partition_count == 0:
+            # See get_partition_id
+            raise ClientOfflineError()
+        return [hash_to_index(key.get_partition_hash(), partition_count) for key in keys]
+
     def check_and_set_partition_count(self, partition_count):
         if self.partition_count == 0:
             self.partition_count = partition_count
+            if self._key_cache is not None:
+                self._key_cache.clear()
             return True
         return self.partition_count == partition_count
 
+    @property
+    def key_cache(self):
+        return self._key_cache
+
+    def _to_key_data_cached(self, key):
+        if type(key) not in _CACHEABLE_KEY_TYPES:
+            return self._to_data(key)
+
+        cache = self._key_cache
+        key_data = cache.get(key)
+        if key_data is None:
+            key_data = _KeyData(self._to_data(key).buffer)
+            cache.put(key, key_data)
+        return key_data
+
     @classmethod
     def _should_be_applied(cls, connection, partitions, version, current):
         if not partitions:
@@ -9,6 +9,8 @@ from hazelcast.internal.asyncio_invocation import Invocation
 from hazelcast.internal.asyncio_partition import string_partition_strategy
 from hazelcast.util import get_attr_name
 
+_NOT_DESERIALIZED = object()
+
 MAX_SIZE = float("inf")
 
 
@@ -242,6 +244,47 @@ class EntryEvent(typing.Generic[KeyType, ValueType]):
         )
 
 
+def _lazy_entry_event_field(index):
+    def getter(self):
+        obj = self._objects[index]
+        if obj is _NOT_DESERIALIZED:
+            obj = self._objects[index] = self._to_object(self._data[index])
+        return obj
+
+    def setter(self, value):
+        self._objects[index] = value
+
+    return property(getter, setter)
+
+
+class _LazyEntryEvent(EntryEvent[KeyType, ValueType]):
+    """Entry event whose key and values are deserialized on their first
+    access, so that the ones that are never read are never deserialized."""
+
+    def __init__(
+        self,
+        to_object: typing.Callable[[typing.Any], typing.Any],
+        key_data: typing.Any,
+        value_data: typing.Any,
+        old_value_data: typing.Any,
+        merging_value_data: typing.Any,
+        event_type: int,
+        member_uuid: uuid.UUID,
+        number_of_affected_entries: int,
+    ):
+        self._to_object = to_object
+        self._data = (key_data, value_data, old_value_data, merging_value_data)
+        self._objects = [_NOT_DESERIALIZED] * 4
+        self.event_type = event_type
+        self.uuid = member_uuid
+        self.number_of_affected_entries = number_of_affected_entries
+
+    key = _lazy_entry_event_field(0)
+    value = _lazy_entry_event_field(1)
+    old_value = _lazy_entry_event_field(2)
+    merging_value = _lazy_entry_event_field(3)
+
+
 def get_entry_listener_flags(**kwargs):
     flags = 0
     for key, value in kwargs.items():
@@ -1,5 +1,8 @@
 import asyncio
+import functools
 import itertools
+import logging
+import operator
 import typing
 
 from hazelcast.aggregator import Aggregator
@@ -7,7 +10,7 @@ from hazelcast.config import IndexUtil, IndexType, IndexConfig
 from hazelcast.core import SimpleEntryView
 from hazelcast.internal.asyncio_invocation import Invocation
 from hazelcast.internal.asyncio_lock_context import LockContext
-from hazelcast.projection import Projection
+from hazelcast.projection import Projection, identity
 from hazelcast.protocol import PagingPredicateHolder
 from hazelcast.protocol.codec import (
     map_add_entry_listener_codec,
@@ -66,6 +69,8 @@ from hazelcast.protocol.codec import (
     map_set_with_max_idle_codec,
     map_remove_interceptor_codec,
     map_remove_all_codec,
+    map_fetch_entries_codec,
+    map_fetch_with_query_codec,
     map_add_near_cache_invalidation_listener_codec,
     map_force_unlock_codec,
     map_lock_codec,
@@ -80,6 +85,7 @@ from hazelcast.internal.asyncio_proxy.base import (
     get_entry_listener_flags,
     task_id,
     MAX_SIZE,
+    _LazyEntryEvent,
 )
 from hazelcast.predicate import Predicate, _PagingPredicate
 from hazelcast.serialization.data import Data
@@ -87,14 +93,45 @@ from hazelcast.types import AggregatorResultType, KeyType, ValueType, Projection
 from hazelcast.serialization.compact import SchemaNotReplicatedError
 from hazelcast.util import (
     check_not_none,
+    check_true,
     to_millis,
     IterationType,
     deserialize_entry_list_in_place,
     deserialize_list_in_place,
+    LazyDict,
+    LazyEntryList,
+    LazyList,
+    split_into_chunks,
+    EventBatcher,
 )
 
+_logger = logging.getLogger(__name__)
+
+# Iteration pointers that start the iteration of a partition
+# from the beginning. The iteration of the partition is over
+# when the index of the last returned pointer is negative.
+_ITERATION_START = [(2147483647, -1)]
+
+_ALL_ENTRY_EVENT_TYPES = (
+    EntryEventType.ADDED
+    | EntryEventType.REMOVED
+    | EntryEventType.UPDATED
+    | EntryEventType.EVICTED
+    | EntryEventType.EXPIRED
+    | EntryEventType.EVICT_ALL
+    | EntryEventType.CLEAR_ALL
+    | EntryEventType.MERGED
+    | EntryEventType.LOADED
+)
+
+
+def _entry_size(entry):
+    return entry[0].total_size() + entry[1].total_size()
+
 
 EntryEventCallable = typing.Callable[[EntryEvent[KeyType, ValueType]], None]
+BatchCallable = typing.Callable[[typing.List[KeyType], typing.Optional[Exception]], None]
+EntryEventBatchCallable = typing.Callable[[typing.List[EntryEvent[KeyType, ValueType]]], None]
 
 
 class Map(Proxy, typing.Generic[KeyType, ValueType]):
@@ -118,6 +155,116 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
     def __init__(self, service_name, name, context):
         super(Map, self).__init__(service_name, name, context)
         self._reference_id_generator = context.lock_reference_id_generator
+        self._to_key_data = context.partition_service.to_key_data
+        self._bulk_request_max_entries = context.config.bulk_request_max_entries
+        self._bulk_request_max_bytes = context.config.bulk_request_max_bytes
+        self._lazy_deserialization = context.config.lazy_deserialization
+        self._deserialize_list = deserialize_list_in_place
+        self._deserialize_entry_list = deserialize_entry_list_in_place
+        if self._lazy_deserialization:
+            self._deserialize_list = LazyList
+            self._deserialize_entry_list = LazyEntryList
+        # Batchers of the entry batch listeners, by their registration ids
+        self._event_batchers: typing.Dict[str, EventBatcher] = {}
+
+    async def add_entry_batch_listener(
+        self,
+        batch_func: EntryEventBatchCallable,
+        include_value: bool = False,
+        key: KeyType = None,
+        predicate: Predicate | None = None,
+        event_types: typing.Sequence[int] | None = None,
+        batch_size: int = 100,
+        max_delay: float = 0.1,
+    ) -> str:
+        """Adds a continuous entry listener for this map, which receives the
+        events in batches.
+
+        The events are passed to the ``batch_func`` as a list, once
+        ``batch_size`` of them are received, or ``max_delay`` seconds after
+        the first event of the batch is received, whichever comes first.
+        The keys and the values of the events are deserialized on their
+        first access, so the ones that are not read by the function are
+        never deserialized.
+        Once the listener is removed, the events that are not passed to the
+        ``batch_func`` yet are discarded.
+
+        Args:
+            batch_func: Function to be called with the list of events.
+            include_value: Whether received events should include the value or
+                not.
+            key: Key for filtering the events.
+            predicate: Predicate for filtering the events.
+            event_types: Types of the events to be received, as
+                :class:`EntryEventType` values. When ``None``, the events of
+                all types are received.
+            batch_size: Maximum number of events passed to the ``batch_func``
+                at once.
+            max_delay: Maximum time in seconds an event waits for the other
+                events of its batch.
+
+        Returns:
+            A registration id which is used as a key to remove the listener.
+        """
+        check_not_none(batch_func, "batch_func can't be None")
+        check_true(batch_size > 0, "batch_size must be positive")
+        check_true(max_delay > 0, "max_delay must be positive")
+        flags = _ALL_ENTRY_EVENT_TYPES
+        if event_types is not None:
+            flags = functools.reduce(operator.or_, event_types, 0)
+
+        try:
+            key_data = self._to_key_data(key) if key is not None else None
+            predicate_data = self._to_data(predicate) if predicate is not None else None
+        except SchemaNotReplicatedError as e:
+            return await self._send_schema_and_retry(
+                e,
+                self.add_entry_batch_listener,
+                batch_func,
+                include_value,
+                key,
+                predicate,
+                event_types,
+                batch_size,
+                max_delay,
+            )
+
+        request, codec = self._encode_entry_listener_request(
+            include_value, key_data, predicate_data, flags
+        )
+        batcher = EventBatcher(batch_func, batch_size, max_delay, self._context.reactor.add_timer)
+        to_object = self._to_object
+
+        def handle_event_entry(
+            key_data,
+            value_data,
+            old_value_data,
+            merging_value_data,
+            event_type,
+            uuid,
+            number_of_affected_entries,
+        ):
+            batcher.add(
+                _LazyEntryEvent(
+                    to_object,
+                    key_data,
+                    value_data,
+                    old_value_data,
+                    merging_value_data,
+                    event_type,
+                    uuid,
+                    number_of_affected_entries,
+                )
+            )
+
+        registration_id = await self._register_listener(
+            request,
+            lambda r: codec.decode_response(r),
+            lambda reg_id: map_remove_entry_listener_codec.encode_request(self.name, reg_id),
+            lambda m: codec.handle(m, handle_event_entry),
+        )
+        self._event_batchers[registration_id] = batcher
+        return registration_id
 
     async def add_entry_listener(
         self,
@@ -177,91 +324,32 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
             MERGED=merged_func,
             LOADED=loaded_func,
         )
-        if key is not None and predicate is not None:
-            try:
-                key_data = self._to_data(key)
-                predicate_data = self._to_data(predicate)
-            except SchemaNotReplicatedError as e:
-                return await self._send_schema_and_retry(
-                    e,
-                    self.add_entry_listener,
-                    include_value,
-                    key,
-                    predicate,
-                    added_func,
-                    removed_func,
-                    updated_func,
-                    evicted_func,
-                    evict_all_func,
-                    clear_all_func,
-                    merged_func,
-                    expired_func,
-                    loaded_func,
-                )
-            with_key_and_predicate_codec = map_add_entry_listener_to_key_with_predicate_codec
-            request = with_key_and_predicate_codec.encode_request(
-                self.name, key_data, predicate_data, include_value, flags, self._is_smart
+        try:
+            key_data = self._to_key_data(key) if key is not None else None
+            predicate_data = self._to_data(predicate) if predicate is not None else None
+        except SchemaNotReplicatedError as e:
+            return await self._send_schema_and_retry(
+                e,
+                self.add_entry_listener,
+                include_value,
+                key,
+                predicate,
+                added_func,
+                removed_func,
+                updated_func,
+                evicted_func,
+                evict_all_func,
+                clear_all_func,
+                merged_func,
+                expired_func,
+                loaded_func,
             )
-            response_decoder = with_key_and_predicate_codec.decode_response
-            event_message_handler = with_key_and_predicate_codec.handle
-        elif key is not None and predicate is None:
-            try:
-                key_data = self._to_data(key)
-            except SchemaNotReplicatedError as e:
-                return await self._send_schema_and_retry(
-                    e,
-                    self.add_entry_listener,
-                    include_value,
-                    key,
-                    predicate,
-                    added_func,
-                    removed_func,
-                    updated_func,
-                    evicted_func,
-                    evict_all_func,
-                    clear_all_func,
-                    merged_func,
-                    expired_func,
-                    loaded_func,
-                )
 
-            with_key_codec = map_add_entry_listener_to_key_codec
-            request = with_key_codec.encode_request(
-                self.name, key_data, include_value, flags, self._is_smart
-            )
-            response_decoder = with_key_codec.decode_response
-            event_message_handler = with_key_codec.handle
-        elif key is None and predicate is not None:
-            try:
-                predicate = self._to_data(predicate)
-            except SchemaNotReplicatedError as e:
-                return await self._send_schema_and_retry(
-                    e,
-                    self.add_entry_listener,
-                    include_value,
-                    key,
-                    predicate,
-                    added_func,
-                    removed_func,
-                    updated_func,
-                    evicted_func,
-                    evict_all_func,
-                    clear_all_func,
-                    merged_func,
-                    expired_func,
-                    loaded_func,
-                )
-            with_predicate_codec = map_add_entry_listener_with_predicate_codec
-            request = with_predicate_codec.encode_request(
-                self.name, predicate, include_value, flags, self._is_smart
-            )
-            response_decoder = with_predicate_codec.decode_response
-            event_message_handler = with_predicate_codec.handle
-        else:
-            codec = map_add_entry_listener_codec
-            request = codec.encode_request(self.name, include_value, flags, self._is_smart)
-            response_decoder = codec.decode_response
-            event_message_handler = codec.handle
+        request, codec = self._encode_entry_listener_request(
+            include_value, key_data, predicate_data, flags
+        )
+        response_decoder = codec.decode_response
+        event_message_handler = codec.handle
 
         def handle_event_entry(
             key_data,
@@ -473,7 +561,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.contains_key, key)
 
@@ -522,7 +610,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.delete, key)
         return await self._delete_internal(key_data)
@@ -556,7 +644,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
                         self._to_object
                     )
                     entry_data_list = response["response"]
-                    return deserialize_entry_list_in_place(entry_data_list, self._to_object)
+                    return self._deserialize_entry_list(entry_data_list, self._to_object)
 
                 request = map_entries_with_paging_predicate_codec.encode_request(self.name, holder)
             else:
@@ -567,14 +655,14 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
 
                 def handler(message):
                     entry_data_list = map_entries_with_predicate_codec.decode_response(message)
-                    return deserialize_entry_list_in_place(entry_data_list, self._to_object)
+                    return self._deserialize_entry_list(entry_data_list, self._to_object)
 
                 request = map_entries_with_predicate_codec.encode_request(self.name, predicate_data)
         else:
 
             def handler(message):
                 entry_data_list = map_entry_set_codec.decode_response(message)
-                return deserialize_entry_list_in_place(entry_data_list, self._to_object)
+                return self._deserialize_entry_list(entry_data_list, self._to_object)
 
             request = map_entry_set_codec.encode_request(self.name)
 
@@ -596,7 +684,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.evict, key)
 
@@ -679,7 +767,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
             entry_processor_data = self._to_data(entry_processor)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.execute_on_key, key, entry_processor)
@@ -711,7 +799,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
             key_list = []
             for key in keys:
                 check_not_none(key, "key can't be None")
-                key_list.append(self._to_data(key))
+                key_list.append(self._to_key_data(key))
 
             entry_processor_data = self._to_data(entry_processor)
         except SchemaNotReplicatedError as e:
@@ -748,7 +836,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.force_unlock, key)
 
@@ -783,7 +871,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.get, key)
         return await self._get_internal(key_data)
@@ -815,7 +903,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         for key in keys:
             check_not_none(key, "key can't be None")
             try:
-                key_data = self._to_data(key)
+                key_data = self._to_key_data(key)
             except SchemaNotReplicatedError as e:
                 return await self._send_schema_and_retry(e, self.get_all, keys)
             partition_id = partition_service.get_partition_id(key_data)
@@ -848,7 +936,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.get_entry_view, key)
 
@@ -864,6 +952,43 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         request = map_get_entry_view_codec.encode_request(self.name, key_data, task_id())
         return await self._invoke_on_key(request, key_data, handler)
 
+    def get_many(
+        self, keys: typing.Iterable[KeyType], batch_size: int = 1000, max_in_flight: int = 16
+    ) -> typing.AsyncIterator[typing.Tuple[KeyType, ValueType]]:
+        """Returns an asynchronous iterator over the entries for the given
+        keys.
+
+        The keys are consumed lazily, grouped by their partitions and
+        requested in batches of at most ``batch_size`` keys. The entries
+        are yielded as the batches are responded, so they are not in the
+        order of the given keys. The keys that do not exist in the map
+        are skipped.
+
+        At most ``max_in_flight`` batches are requested at the same time,
+        so the memory used does not depend on the number of keys.
+
+            >>> async for key, value in my_map.get_many(keys):
+            ...     print(key, value)
+
+        Warning:
+            This method uses ``__hash__`` and ``__eq__`` methods of binary form
+            of the key, not the actual implementations of ``__hash__`` and
+            ``__eq__`` defined in key's class.
+
+        Args:
+            keys: Iterable of the keys to get.
+            batch_size: Maximum number of keys requested in a single
+                request.
+            max_in_flight: Maximum number of requests in flight.
+
+        Returns:
+            Asynchronous iterator of the map entries, as key-value tuples.
+        """
+        check_not_none(keys, "keys can't be None")
+        check_true(batch_size > 0, "batch_size must be positive")
+        check_true(max_in_flight > 0, "max_in_flight must be positive")
+        return self._get_many_internal(keys, batch_size, max_in_flight)
+
     async def is_empty(self) -> bool:
         """Returns whether this map contains no key-value mappings or not.
 
@@ -890,13 +1015,46 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.is_locked, key)
 
         request = map_is_locked_codec.encode_request(self.name, key_data)
         return await self._invoke_on_key(request, key_data, map_is_locked_codec.decode_response)
 
+    def iterator(
+        self, page_size: int = 1000, predicate: Predicate | None = None
+    ) -> typing.AsyncIterator[typing.Tuple[KeyType, ValueType]]:
+        """Returns an asynchronous iterator over the entries of this map, or
+        the entries filtered with the predicate if provided.
+
+        The entries are fetched from the cluster in pages of at most
+        ``page_size`` entries, one partition after another, and they are
+        deserialized one by one, as they are consumed. While the entries
+        of a page are consumed, the next page is fetched, so at most two
+        pages are held in memory at the same time, regardless of the size
+        of the map.
+
+            >>> async for key, value in my_map.iterator():
+            ...     print(key, value)
+
+        Warning:
+            The iterator is NOT a snapshot of the map. The entries that are
+            added or removed during the iteration may or may not be returned.
+
+        Args:
+            page_size: Maximum number of entries fetched in a single request.
+            predicate: Predicate for the map to filter entries.
+
+        Returns:
+            Asynchronous iterator of the map entries, as key-value tuples.
+        """
+        check_true(page_size > 0, "page_size must be positive")
+        if isinstance(predicate, _PagingPredicate):
+            raise AssertionError("Paging predicate is not supported.")
+
+        return self._iterator_internal(page_size, predicate)
+
     async def key_set(self, predicate: Predicate | None = None) -> typing.List[ValueType]:
         """Returns a List clone of the keys contained in this map or the keys
         of the entries filtered with the predicate if provided.
@@ -926,7 +1084,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
                         self._to_object
                     )
                     data_list = response["response"]
-                    return deserialize_list_in_place(data_list, self._to_object)
+                    return self._deserialize_list(data_list, self._to_object)
 
                 request = map_key_set_with_paging_predicate_codec.encode_request(self.name, holder)
             else:
@@ -937,14 +1095,14 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
 
                 def handler(message):
                     data_list = map_key_set_with_predicate_codec.decode_response(message)
-                    return deserialize_list_in_place(data_list, self._to_object)
+                    return self._deserialize_list(data_list, self._to_object)
 
                 request = map_key_set_with_predicate_codec.encode_request(self.name, predicate_data)
         else:
 
             def handler(message):
                 data_list = map_key_set_codec.decode_response(message)
-                return deserialize_list_in_place(data_list, self._to_object)
+                return self._deserialize_list(data_list, self._to_object)
 
             request = map_key_set_codec.encode_request(self.name)
 
@@ -964,7 +1122,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         if keys:
             try:
-                key_data_list = [self._to_data(key) for key in keys]
+                key_data_list = [self._to_key_data(key) for key in keys]
             except SchemaNotReplicatedError as e:
                 return await self._send_schema_and_retry(
                     e, self.load_all, keys, replace_existing_values
@@ -1007,7 +1165,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.lock, key, lease_time)
 
@@ -1107,7 +1265,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
             value_data = self._to_data(value)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.put, key, value, ttl, max_idle)
@@ -1132,7 +1290,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
             check_not_none(key, "key can't be None")
             check_not_none(value, "value can't be None")
             try:
-                entry = (self._to_data(key), self._to_data(value))
+                entry = (self._to_key_data(key), self._to_data(value))
             except SchemaNotReplicatedError as e:
                 return await self._send_schema_and_retry(e, self.put_all, map)
             partition_id = partition_service.get_partition_id(entry[0])
@@ -1143,10 +1301,8 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
 
         async with asyncio.TaskGroup() as tg:  # type: ignore[attr-defined]
             for partition_id, entry_list in partition_map.items():
-                request = map_put_all_codec.encode_request(
-                    self.name, entry_list, False
-                )  # TODO trigger map loader
-                tg.create_task(self._ainvoke_on_partition(request, partition_id))
+                for chunk in self._split_bulk_request(entry_list, _entry_size):
+                    tg.create_task(self._put_all_internal(partition_id, chunk))
         return None
 
     async def put_if_absent(
@@ -1196,7 +1352,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
             value_data = self._to_data(value)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(
@@ -1235,7 +1391,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
             value_data = self._to_data(value)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(
@@ -1264,7 +1420,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.remove, key)
 
@@ -1312,7 +1468,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
             value_data = self._to_data(value)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.remove_if_same, key, value)
@@ -1329,6 +1485,9 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         Returns:
             ``True`` if registration is removed, ``False`` otherwise.
         """
+        batcher = self._event_batchers.pop(registration_id, None)
+        if batcher is not None:
+            batcher.close()
         return await self._deregister_listener(registration_id)
 
     async def remove_interceptor(self, registration_id: str) -> bool:
@@ -1377,7 +1536,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
             value_data = self._to_data(value)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.replace, key, value)
@@ -1415,7 +1574,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         check_not_none(old_value, "old_value can't be None")
         check_not_none(new_value, "new_value can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
             old_value_data = self._to_data(old_value)
             new_value_data = self._to_data(new_value)
         except SchemaNotReplicatedError as e:
@@ -1458,12 +1617,99 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
             value_data = self._to_data(value)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.set, key, value, ttl, max_idle)
         return await self._set_internal(key_data, value_data, ttl, max_idle)
 
+    async def set_many(
+        self,
+        entries: typing.Iterable[typing.Tuple[KeyType, ValueType]],
+        batch_size: int = 1000,
+        max_in_flight: int = 16,
+        batch_func: BatchCallable | None = None,
+    ) -> int:
+        """Stores the entries of the given iterable in this map.
+
+        The entries are consumed lazily, grouped by their partitions and
+        sent in batches of at most ``batch_size`` entries, as in the
+        :func:`put_all`.
+
+        At most ``max_in_flight`` batches are sent at the same time, so
+        the memory used does not depend on the number of entries.
+
+        No atomicity guarantees are given. In the case of a failure, the
+        rest of the batches are still sent.
+
+        Args:
+            entries: Iterable of key-value tuples to be stored in this map.
+            batch_size: Maximum number of entries sent in a single request.
+            max_in_flight: Maximum number of requests in flight.
+            batch_func: Function to be called with the keys of each batch,
+                and ``None`` or the error the batch is failed with, once
+                the batch is completed.
+
+        Returns:
+            The number of entries stored.
+
+        Raises:
+            Exception: The error of the first failed batch, after all the
+                batches are completed.
+        """
+        check_not_none(entries, "entries can't be None")
+        check_true(batch_size > 0, "batch_size must be positive")
+        check_true(max_in_flight > 0, "max_in_flight must be positive")
+
+        window = asyncio.Semaphore(max_in_flight)
+        tasks: typing.Set[asyncio.Task] = set()
+        stored = 0
+        errors: typing.List[Exception] = []
+
+        def to_data(entry):
+            key, value = entry
+            check_not_none(key, "key can't be None")
+            check_not_none(value, "value can't be None")
+            key_data = self._to_key_data(key)
+            return key_data, (key_data, self._to_data(value))
+
+        async def send(partition_id, batch, entry_list):
+            nonlocal stored
+            error = None
+            try:
+                await self._put_all_internal(partition_id, entry_list)
+            except Exception as e:
+                error = e
+            finally:
+                window.release()
+
+            if batch_func:
+                try:
+                    batch_func([key for key, _ in batch], error)
+                except Exception:
+                    _logger.exception("Exception when invoking the batch callback")
+
+            if error is None:
+                stored += len(batch)
+            else:
+                errors.append(error)
+
+        async for partition_id, batch, entry_list in self._batch_by_partition(
+            entries, batch_size, to_data
+        ):
+            await window.acquire()
+            task = asyncio.create_task(send(partition_id, batch, entry_list))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+        if errors:
+            raise errors[0]
+
+        return stored
+
     async def set_ttl(self, key: KeyType, ttl: float) -> None:
         """Updates the TTL (time to live) value of the entry specified by the
         given key with a new TTL value.
@@ -1480,7 +1726,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(ttl, "ttl can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.set_ttl, key, ttl)
         return await self._set_ttl_internal(key_data, ttl)
@@ -1523,7 +1769,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.try_lock, key, lease_time, timeout)
 
@@ -1562,7 +1808,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
             value_data = self._to_data(value)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.try_put, key, value, timeout)
@@ -1584,7 +1830,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.try_remove, key, timeout)
         return await self._try_remove_internal(key_data, timeout)
@@ -1601,7 +1847,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         try:
-            key_data = self._to_data(key)
+            key_data = self._to_key_data(key)
         except SchemaNotReplicatedError as e:
             return await self._send_schema_and_retry(e, self.unlock, key)
 
@@ -1639,7 +1885,7 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
                         self._to_object
                     )
                     data_list = response["response"]
-                    return deserialize_list_in_place(data_list, self._to_object)
+                    return self._deserialize_list(data_list, self._to_object)
 
                 request = map_values_with_paging_predicate_codec.encode_request(self.name, holder)
             else:
@@ -1650,14 +1896,14 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
 
                 def handler(message):
                     data_list = map_values_with_predicate_codec.decode_response(message)
-                    return deserialize_list_in_place(data_list, self._to_object)
+                    return self._deserialize_list(data_list, self._to_object)
 
                 request = map_values_with_predicate_codec.encode_request(self.name, predicate_data)
         else:
 
             def handler(message):
                 data_list = map_values_codec.decode_response(message)
-                return deserialize_list_in_place(data_list, self._to_object)
+                return self._deserialize_list(data_list, self._to_object)
 
             request = map_values_codec.encode_request(self.name)
 
@@ -1681,6 +1927,27 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
         """
         return LockContext(self, key)
 
+    def _encode_entry_listener_request(self, include_value, key_data, predicate_data, flags):
+        if key_data is not None and predicate_data is not None:
+            codec = map_add_entry_listener_to_key_with_predicate_codec
+            request = codec.encode_request(
+                self.name, key_data, predicate_data, include_value, flags, self._is_smart
+            )
+        elif key_data is not None:
+            codec = map_add_entry_listener_to_key_codec
+            request = codec.encode_request(
+                self.name, key_data, include_value, flags, self._is_smart
+            )
+        elif predicate_data is not None:
+            codec = map_add_entry_listener_with_predicate_codec
+            request = codec.encode_request(
+                self.name, predicate_data, include_value, flags, self._is_smart
+            )
+        else:
+            codec = map_add_entry_listener_codec
+            request = codec.encode_request(self.name, include_value, flags, self._is_smart)
+        return request, codec
+
     def _contains_key_internal(self, key_data):
         request = map_contains_key_codec.encode_request(self.name, key_data, task_id())
         return self._invoke_on_key(request, key_data, map_contains_key_codec.decode_response)
@@ -1694,17 +1961,155 @@ class Map(Proxy, typing.Generic[KeyType, ValueType]):
 
     async def _get_all_internal(self, partition_to_keys, tasks=None):
         def handler(message):
-            entry_data_list = map_get_all_codec.decode_response(message)
-            return deserialize_entry_list_in_place(entry_data_list, self._to_object)
+            return map_get_all_codec.decode_response(message)
 
         tasks = tasks or []
         async with asyncio.TaskGroup() as tg:
             for partition_id, key_dict in partition_to_keys.items():
-                request = map_get_all_codec.encode_request(self.name, key_dict.values())
-                task = tg.create_task(self._ainvoke_on_partition(request, partition_id, handler))
-                tasks.append(task)
-        kvs = itertools.chain.from_iterable(task.result() for task in tasks)
-        return dict(kvs)
+                key_data_list = list(key_dict.values())
+                for chunk in self._split_bulk_request(key_data_list, Data.total_size):
+                    request = map_get_all_codec.encode_request(self.name, chunk)
+                    task = tg.create_task(
+                        self._ainvoke_on_partition(request, partition_id, handler)
+                    )
+                    tasks.append(task)
+        return self._to_dict(itertools.chain.from_iterable(task.result() for task in tasks))
+
+    async def _get_many_internal(self, keys, batch_size, max_in_flight):
+        pending: typing.Set[asyncio.Task] = set()
+
+        def to_data(key):
+            check_not_none(key, "key can't be None")
+            key_data = self._to_key_data(key)
+            return key_data, key_data
+
+        async for partition_id, batch, key_data_list in self._batch_by_partition(
+            keys, batch_size, to_data
+        ):
+            if len(pending) == max_in_flight:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for entry in task.result().items():
+                        yield entry
+
+            key_dict = dict(zip(batch, key_data_list))
+            pending.add(asyncio.create_task(self._get_all_internal({partition_id: key_dict})))
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                for entry in task.result().items():
+                    yield entry
+
+    async def _iterator_internal(self, page_size, predicate):
+        fetch_page = self._fetch_entries
+        if predicate:
+            projection_data = await self._to_data_waiting_schema(self._to_data, identity())
+            predicate_data = await self._to_data_waiting_schema(self._to_data, predicate)
+            fetch_page = functools.partial(self._fetch_with_query, projection_data, predicate_data)
+
+        partition_count = self._partition_service.partition_count
+        partition_id = 0
+        future = fetch_page(partition_id, _ITERATION_START, page_size)
+        while future:
+            iteration_pointers, entries = await future
+            # Fetch the next page while the entries of this one are consumed
+            if iteration_pointers[-1][0] >= 0:
+                future = fetch_page(partition_id, iteration_pointers, page_size)
+            elif partition_id + 1 < partition_count:
+                partition_id += 1
+                future = fetch_page(partition_id, _ITERATION_START, page_size)
+            else:
+                future = None
+
+            for entry in entries:
+                yield entry
+
+    def _fetch_entries(self, partition_id, iteration_pointers, page_size):
+        to_object = self._to_object
+
+        def handler(message):
+            response = map_fetch_entries_codec.decode_response(message)
+            entries = (
+                (to_object(key_data), to_object(value_data))
+                for key_data, value_data in response["entries"]
+            )
+            return response["iteration_pointers"], entries
+
+        request = map_fetch_entries_codec.encode_request(self.name, iteration_pointers, page_size)
+        return self._invoke_on_partition(request, partition_id, handler)
+
+    def _fetch_with_query(
+        self, projection_data, predicate_data, partition_id, iteration_pointers, page_size
+    ):
+        to_object = self._to_object
+
+        def handler(message):
+            response = map_fetch_with_query_codec.decode_response(message)
+            # Results are the entries, as they are projected with the identity
+            entries = (
+                (entry.key, entry.value)
+                for entry in (to_object(data) for data in response["results"] if data)
+            )
+            return response["iteration_pointers"], entries
+
+        request = map_fetch_with_query_codec.encode_request(
+            self.name, iteration_pointers, page_size, projection_data, predicate_data
+        )
+        return self._invoke_on_partition(request, partition_id, handler)
+
+    async def _batch_by_partition(self, items, batch_size, to_data):
+        # Groups the items by their partitions, and yields the batches
+        # of the items and their serialized forms, as soon as they are
+        # full. The rest of the batches are yielded at the end.
+        partition_service = self._context.partition_service
+        batches: typing.Dict[int, typing.Tuple[list, list]] = {}
+        for item in items:
+            key_data, data = await self._to_data_waiting_schema(to_data, item)
+            partition_id = partition_service.get_partition_id(key_data)
+            try:
+                batch, data_list = batches[partition_id]
+            except KeyError:
+                batch, data_list = batches[partition_id] = ([], [])
+
+            batch.append(item)
+            data_list.append(data)
+            if len(batch) == batch_size:
+                del batches[partition_id]
+                yield partition_id, batch, data_list
+
+        for partition_id, (batch, data_list) in batches.items():
+            yield partition_id, batch, data_list
+
+    def _split_bulk_request(self, items, size_fn):
+        return split_into_chunks(
+            items, self._bulk_request_max_entries, self._bulk_request_max_bytes, size_fn
+        )
+
+    async def _put_all_internal(self, partition_id, entry_list):
+        request = map_put_all_codec.encode_request(
+            self.name, entry_list, False
+        )  # TODO trigger map loader
+        return await self._ainvoke_on_partition(request, partition_id)
+
+    def _to_dict(self, entries):
+        # The entries are either the serialized ones in the responses,
+        # or the deserialized ones in the Near Cache, which are returned
+        # as they are by to_object.
+        entry_list = list(entries)
+        if self._lazy_deserialization:
+            return LazyDict(entry_list, self._to_object)
+        return dict(deserialize_entry_list_in_place(entry_list, self._to_object))
+
+    async def _to_data_waiting_schema(self, to_data, item):
+        # The streaming methods consume their inputs, so they can't
+        # be retried from the beginning like the other methods, when
+        # the schema of a Compact object is not replicated yet.
+        while True:
+            try:
+                return to_data(item)
+            except SchemaNotReplicatedError as e:
+                await self._send_schema_and_retry(e, lambda: None)
 
     def _remove_internal(self, key_data):
         def handler(message):
@@ -1912,7 +2317,7 @@ class MapFeatNearCache(Map[KeyType, ValueType]):
                     key_data = key_dic[key]
                     value = self._near_cache[key_data]
                     future = asyncio.Future()
-                    future.set_result((key, value))
+                    future.set_result([(key, value)])
                     tasks.append(future)
                     del key_dic[key]
                 except KeyError:
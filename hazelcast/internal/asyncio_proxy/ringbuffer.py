@@ -21,6 +21,7 @@ from hazelcast.util import (
     check_not_empty,
     check_true,
     deserialize_list_in_place,
+    LazyList,
 )
 
 
@@ -64,6 +65,9 @@ class Ringbuffer(PartitionSpecificProxy, typing.Generic[ItemType]):
     def __init__(self, service_name, name, context):
         super(Ringbuffer, self).__init__(service_name, name, context)
         self._capacity = None
+        self._deserialize_list = deserialize_list_in_place
+        if context.config.lazy_deserialization:
+            self._deserialize_list = LazyList
 
     async def capacity(self) -> int:
         """Returns the capacity of this Ringbuffer.
@@ -285,7 +289,7 @@ class Ringbuffer(PartitionSpecificProxy, typing.Generic[ItemType]):
 
         def handler(message):
             response = ringbuffer_read_many_codec.decode_response(message)
-            items = deserialize_list_in_place(response["items"], self._to_object)
+            items = self._deserialize_list(response["items"], self._to_object)
             read_count = response["read_count"]
             next_seq = response["next_seq"]
             item_seqs = response["item_seqs"]
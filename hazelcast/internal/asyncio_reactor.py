@@ -72,7 +72,7 @@ class AsyncioConnection(Connection):
         self._close_task: asyncio.Task | None = None
         self._connect_task: asyncio.Task | None = None
         self._connected = False
-        self._receive_buffer_size = _BUFFER_SIZE
+        self._receive_buffer_size = config.receive_buffer_size
 
     @classmethod
     def create_and_connect(
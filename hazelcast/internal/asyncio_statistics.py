@@ -28,17 +28,26 @@ _NEAR_CACHE_DESCRIPTOR_PREFIX = "nearcache"
 _NEAR_CACHE_DESCRIPTOR_DISCRIMINATOR = "name"
 
 _TCP_METRICS_PREFIX = "tcp"
+_PARTITION_ID_CACHE_METRICS_PREFIX = "partitionIdCache"
 
 
 class Statistics:
     def __init__(
-        self, client, config, reactor, connection_manager, invocation_service, near_cache_manager
+        self,
+        client,
+        config,
+        reactor,
+        connection_manager,
+        invocation_service,
+        near_cache_manager,
+        partition_service,
     ):
         self._client = client
         self._reactor = reactor
         self._connection_manager = connection_manager
         self._invocation_service = invocation_service
         self._near_cache_manager = near_cache_manager
+        self._partition_service = partition_service
         self._enabled = config.statistics_enabled
         self._period = config.statistics_period
         self._statistics_task = None
@@ -160,6 +169,7 @@ class Statistics:
         self._add_near_cache_metrics(attributes, compressor)
         self._add_system_and_process_metrics(attributes, compressor)
         self._add_tcp_metrics(compressor)
+        self._add_partition_id_cache_metrics(compressor)
         await self._send_stats(
             collection_timestamp, "".join(attributes), compressor.generate_blob(), connection
         )
@@ -365,6 +375,33 @@ class Statistics:
         except Exception:
             _logger.exception("Error while collecting '%s.%s'.", _TCP_METRICS_PREFIX, metric)
 
+    def _add_partition_id_cache_metrics(self, compressor):
+        cache = self._partition_service.key_cache
+        if cache is None:
+            return
+
+        self._add_partition_id_cache_metric(compressor, "hits", cache.hits)
+        self._add_partition_id_cache_metric(compressor, "misses", cache.misses)
+        self._add_partition_id_cache_metric(compressor, "size", cache.size)
+        self._add_partition_id_cache_metric(
+            compressor, "hitRatio", 100 * cache.hit_ratio, ValueType.DOUBLE, ProbeUnit.PERCENT
+        )
+
+    def _add_partition_id_cache_metric(
+        self, compressor, metric, value, value_type=ValueType.LONG, unit=ProbeUnit.COUNT
+    ):
+        descriptor = MetricDescriptor(
+            metric=metric,
+            prefix=_PARTITION_ID_CACHE_METRICS_PREFIX,
+            unit=unit,
+        )
+        try:
+            self._add_metric(compressor, descriptor, value, value_type)
+        except Exception:
+            _logger.exception(
+                "Error while collecting '%s.%s'.", _PARTITION_ID_CACHE_METRICS_PREFIX, metric
+            )
+
     def _add_metric(self, compressor, descriptor, value, value_type):
         if value_type == ValueType.LONG:
             compressor.add_long(descriptor, value)
@@ -1,18 +1,23 @@
 import logging
+import threading
 import time
 import functools
+from concurrent.futures import ThreadPoolExecutor
 
+from hazelcast.config import InvocationOverloadPolicy, WriteQueueOverloadPolicy
 from hazelcast.errors import (
     create_error_from_message,
     HazelcastInstanceNotActiveError,
     is_retryable_error,
     TargetDisconnectedError,
     HazelcastClientNotActiveError,
+    HazelcastOverloadError,
     TargetNotMemberError,
     EXCEPTION_MESSAGE_TYPE,
     IndeterminateOperationStateError,
     OperationTimeoutError,
     InvocationMightContainCompactDataError,
+    WriteQueueOverloadError,
 )
 from hazelcast.future import Future
 from hazelcast.protocol.client_message import InboundMessage
@@ -43,6 +48,7 @@ class Invocation:
         "backup_acks_expected",
         "pending_response",
         "pending_response_received_time",
+        "has_permit",
     )
 
     def __init__(
@@ -70,6 +76,9 @@ class Invocation:
         self.backup_acks_expected = -1
         self.pending_response = None
         self.pending_response_received_time = -1
+        # Whether the invocation holds one of the concurrent invocation
+        # permits, which is released once the invocation is completed
+        self.has_permit = False
 
 
 class InvocationService:
@@ -88,7 +97,15 @@ class InvocationService:
         self._connection_manager = None
         self._listener_service = None
         self._check_invocation_allowed_fn = None
+        # Accessed from the user threads and from all the reactor
+        # threads. Only the single step dict operations are used on
+        # it, and it is copied before being iterated over.
         self._pending = {}
+        # Responses and their backup acks might be received on different
+        # reactor threads, and the backup timeouts are detected on the
+        # timer thread. Guards the backup ack bookkeeping of invocations,
+        # so that they are completed exactly once.
+        self._backup_acks_lock = threading.Lock()
         self._next_correlation_id = AtomicInteger(1)
         self._is_redo_operation = config.redo_operation
         self._invocation_timeout = config.invocation_timeout
@@ -99,6 +116,29 @@ class InvocationService:
         self._clean_resources_timer = None
         self._shutdown = False
         self._compact_schema_service = None
+        self._write_queue_bounded = config.write_queue_high_watermark != -1
+        self._write_queue_overload_policy = config.write_queue_overload_policy
+        self._max_concurrent_invocations = config.max_concurrent_invocations
+        self._invocation_overload_policy = config.invocation_overload_policy
+        # Number of non-urgent invocations in flight, when they are limited
+        self._concurrent_invocations = 0
+        self._concurrent_invocations_condition = threading.Condition(threading.Lock())
+        # Holds the invocations to be written together by the
+        # invoke_all calls in progress, per connection.
+        self._batch_local = threading.local()
+        self._response_offload_threshold = config.response_offload_threshold
+        self._response_offload_executor = config.response_offload_executor
+        self._owns_response_offload_executor = False
+        if self._response_offload_threshold != -1 and self._response_offload_executor is None:
+            self._response_offload_executor = ThreadPoolExecutor(
+                thread_name_prefix="hazelcast-response"
+            )
+            self._owns_response_offload_executor = True
+        # Time spent on the reactor threads while handling the
+        # responses, in nanoseconds, and the number of responses
+        # handled on the response offload executor instead.
+        self.response_handler_time = 0
+        self.offloaded_response_count = 0
 
     def init(self, partition_service, connection_manager, listener_service, compact_schema_service):
         self._partition_service = partition_service
@@ -131,18 +171,55 @@ class InvocationService:
             error = create_error_from_message(message)
             return self._notify_error(invocation, error)
 
+        threshold = self._response_offload_threshold
+        if threshold != -1 and message.size >= threshold and self._offload(invocation, message):
+            return
+
+        start = time.perf_counter_ns()
         self._notify(invocation, message)
+        self.response_handler_time += time.perf_counter_ns() - start
 
     def invoke(self, invocation):
         if not invocation.timeout:
             invocation.timeout = self._invocation_timeout + time.time()
 
+        if self._max_concurrent_invocations != -1 and not invocation.urgent:
+            error = self._acquire_invocation_permit(invocation)
+            if error:
+                invocation.future.set_exception(error)
+                return
+
+            invocation.has_permit = True
+
         correlation_id = self._next_correlation_id.get_and_increment()
         request = invocation.request
         request.set_correlation_id(correlation_id)
         request.set_partition_id(invocation.partition_id)
         self._do_invoke(invocation)
 
+    def invoke_all(self, invocations):
+        """Invokes the invocations, like the :func:`invoke`.
+
+        The requests of the invocations that are sent to the same
+        connection, i.e. the same member, are written back-to-back
+        after all the invocations are made. The invocations are
+        completed and retried separately, as usual.
+        """
+        batch = {}
+        self._batch_local.batch = batch
+        try:
+            max_invocations = self._max_concurrent_invocations
+            for invocation in invocations:
+                if max_invocations != -1 and self._concurrent_invocations >= max_invocations:
+                    # The invocation might wait for a permit, which
+                    # might be held by the invocations not yet sent.
+                    self._send_batch(batch)
+
+                self.invoke(invocation)
+        finally:
+            self._batch_local.batch = None
+            self._send_batch(batch)
+
     def shutdown(self):
         if self._shutdown:
             return
@@ -150,8 +227,13 @@ class InvocationService:
         self._shutdown = True
         if self._clean_resources_timer:
             self._clean_resources_timer.cancel()
+        condition = self._concurrent_invocations_condition
+        with condition:
+            condition.notify_all()
         for invocation in list(self._pending.values()):
             self._notify_error(invocation, HazelcastClientNotActiveError())
+        if self._owns_response_offload_executor:
+            self._response_offload_executor.shutdown(wait=False)
 
     def _invoke_on_partition_owner(self, invocation, partition_id):
         owner_uuid = self._partition_service.get_partition_owner(partition_id)
@@ -230,6 +312,9 @@ class InvocationService:
         if self._shutdown:
             raise HazelcastClientNotActiveError()
 
+        if self._write_queue_bounded and connection.overloaded and not invocation.urgent:
+            connection = self._handle_overloaded_connection(invocation, connection)
+
         if self._backup_ack_to_client_enabled:
             invocation.request.set_backup_aware_flag()
 
@@ -240,6 +325,15 @@ class InvocationService:
         if invocation.event_handler:
             self._listener_service.add_event_handler(correlation_id, invocation.event_handler)
 
+        batch = getattr(self._batch_local, "batch", None)
+        if batch is not None and not invocation.urgent:
+            invocation.sent_connection = connection
+            try:
+                batch[connection].append(invocation)
+            except KeyError:
+                batch[connection] = [invocation]
+            return True
+
         if not connection.send_message(message):
             if invocation.event_handler:
                 self._listener_service.remove_event_handler(correlation_id)
@@ -248,6 +342,55 @@ class InvocationService:
         invocation.sent_connection = connection
         return True
 
+    def _send_batch(self, batch):
+        for connection, invocations in batch.items():
+            if connection.send_messages([invocation.request for invocation in invocations]):
+                continue
+
+            for invocation in invocations:
+                if invocation.event_handler:
+                    correlation_id = invocation.request.get_correlation_id()
+                    self._listener_service.remove_event_handler(correlation_id)
+
+                # The invocation might be already notified,
+                # if the connection is closed in the meantime.
+                if invocation.sent_connection is connection:
+                    self._notify_error(
+                        invocation, IOError("Could not invoke on connection %s" % connection)
+                    )
+
+        batch.clear()
+
+    def _handle_overloaded_connection(self, invocation, connection):
+        policy = self._write_queue_overload_policy
+        if policy == WriteQueueOverloadPolicy.ERROR:
+            raise WriteQueueOverloadError(
+                "Outbound queue of the connection %s is above the high watermark" % connection
+            )
+
+        if policy == WriteQueueOverloadPolicy.REROUTE:
+            if invocation.connection:
+                return connection
+
+            for other in list(self._connection_manager.active_connections.values()):
+                if other.live and not other.overloaded:
+                    return other
+
+            return connection
+
+        if hasattr(Future._threading_locals, "is_reactor_thread"):
+            # Blocking the reactor thread would prevent the
+            # queue from draining, so we just queue it.
+            return connection
+
+        if not connection.wait_until_writable(invocation.timeout - time.time()):
+            raise OperationTimeoutError(
+                "Request timed out while waiting for the outbound queue "
+                "of the connection %s to drain" % connection
+            )
+
+        return connection
+
     def _complete(self, invocation: Invocation, client_message: InboundMessage) -> None:
         try:
             result = invocation.response_handler(client_message)
@@ -260,11 +403,56 @@ class InvocationService:
 
         correlation_id = invocation.request.get_correlation_id()
         self._pending.pop(correlation_id, None)
+        if invocation.has_permit:
+            self._release_invocation_permit(invocation)
 
     def _complete_with_error(self, invocation, error):
         invocation.future.set_exception(error, None)
         correlation_id = invocation.request.get_correlation_id()
         self._pending.pop(correlation_id, None)
+        if invocation.has_permit:
+            self._release_invocation_permit(invocation)
+
+    def _acquire_invocation_permit(self, invocation):
+        max_invocations = self._max_concurrent_invocations
+        condition = self._concurrent_invocations_condition
+        with condition:
+            if self._concurrent_invocations >= max_invocations:
+                if self._invocation_overload_policy == InvocationOverloadPolicy.ERROR:
+                    return HazelcastOverloadError(
+                        "Maximum number of concurrent invocations (%s) is reached" % max_invocations
+                    )
+
+                # Blocking the reactor thread would prevent the ongoing
+                # invocations from completing, so we let it through.
+                if not hasattr(Future._threading_locals, "is_reactor_thread"):
+                    has_permit = condition.wait_for(
+                        lambda: self._concurrent_invocations < max_invocations or self._shutdown,
+                        invocation.timeout - time.time(),
+                    )
+                    if self._shutdown:
+                        return HazelcastClientNotActiveError()
+
+                    if not has_permit:
+                        return HazelcastOverloadError(
+                            "Timed out while waiting for one of the %s concurrent "
+                            "invocations to complete" % max_invocations
+                        )
+
+            self._concurrent_invocations += 1
+            return None
+
+    def _release_invocation_permit(self, invocation):
+        condition = self._concurrent_invocations_condition
+        with condition:
+            # The invocation might be completed more than once, e.g. on
+            # shutdown, concurrently with its response.
+            if not invocation.has_permit:
+                return
+
+            invocation.has_permit = False
+            self._concurrent_invocations -= 1
+            condition.notify()
 
     def _fetch_schema_and_complete_again(
         self, error: SchemaNotFoundError, invocation: Invocation, message: InboundMessage
@@ -378,23 +566,39 @@ class InvocationService:
 
     def _notify(self, invocation, client_message):
         expected_backups = client_message.get_number_of_backup_acks()
-        if expected_backups > invocation.backup_acks_received:
-            invocation.pending_response_received_time = time.time()
-            invocation.backup_acks_expected = expected_backups
-            invocation.pending_response = client_message
-            return
+        if expected_backups:
+            with self._backup_acks_lock:
+                if expected_backups > invocation.backup_acks_received:
+                    invocation.pending_response_received_time = time.time()
+                    invocation.backup_acks_expected = expected_backups
+                    invocation.pending_response = client_message
+                    return
 
         self._complete(invocation, client_message)
 
+    def _offload(self, invocation, client_message):
+        try:
+            self._response_offload_executor.submit(self._notify, invocation, client_message)
+        except RuntimeError:
+            # The executor is shut down
+            return False
+
+        self.offloaded_response_count += 1
+        return True
+
     def _notify_backup_complete(self, invocation):
-        invocation.backup_acks_received += 1
-        if not invocation.pending_response:
-            return
+        with self._backup_acks_lock:
+            invocation.backup_acks_received += 1
+            pending_response = invocation.pending_response
+            if not pending_response:
+                return
 
-        if invocation.backup_acks_expected != invocation.backup_acks_received:
-            return
+            if invocation.backup_acks_expected != invocation.backup_acks_received:
+                return
+
+            invocation.pending_response = None
 
-        self._complete(invocation, invocation.pending_response)
+        self._complete(invocation, pending_response)
 
     def _start_clean_resources_timer(self):
         def run():
@@ -420,16 +624,20 @@ class InvocationService:
         self._clean_resources_timer = self._reactor.add_timer(self._CLEAN_RESOURCES_PERIOD, run)
 
     def _detect_and_handle_backup_timeout(self, invocation, now):
-        if not invocation.pending_response:
-            return
+        with self._backup_acks_lock:
+            pending_response = invocation.pending_response
+            if not pending_response:
+                return
 
-        if invocation.backup_acks_expected == invocation.backup_acks_received:
-            return
+            if invocation.backup_acks_expected == invocation.backup_acks_received:
+                return
 
-        expiration_time = invocation.pending_response_received_time + self._backup_timeout
-        timeout_reached = 0 < expiration_time < now
-        if not timeout_reached:
-            return
+            expiration_time = invocation.pending_response_received_time + self._backup_timeout
+            timeout_reached = 0 < expiration_time < now
+            if not timeout_reached:
+                return
+
+            invocation.pending_response = None
 
         if self._fail_on_indeterminate_state:
             error = IndeterminateOperationStateError(
@@ -438,4 +646,4 @@ class InvocationService:
             self._complete_with_error(invocation, error)
             return
 
-        self._complete(invocation, invocation.pending_response)
+        self._complete(invocation, pending_response)
@@ -1,4 +1,5 @@
 import logging
+import queue
 import sys
 import threading
 import typing
@@ -15,6 +16,8 @@ from hazelcast.util import check_not_none
 
 _logger = logging.getLogger(__name__)
 
+_SHUTDOWN_TASK = object()
+
 
 class _ListenerRegistration:
     __slots__ = (
@@ -35,6 +38,19 @@ class _ListenerRegistration:
         self.connection_registrations = {}  # Dict of Connection, EventRegistration
 
 
+class _StripedEventHandler:
+    """Event handler of a user entry listener, whose events are handled on
+    the event threads, rather than the reactor threads."""
+
+    __slots__ = ("handler",)
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def __call__(self, message):
+        self.handler(message)
+
+
 class _EventRegistration:
     __slots__ = ("server_registration_id", "correlation_id")
 
@@ -43,6 +59,85 @@ class _EventRegistration:
         self.correlation_id = correlation_id
 
 
+class _StripedEventExecutor:
+    """Runs the event handlers on a fixed number of threads, each with a
+    bounded queue of its own.
+
+    The events are routed to the threads by their partition ids, so the
+    events of the same partition, hence of the same key, are handled in
+    the order they are submitted. The events without a partition id are
+    spread over the threads in a round robin fashion.
+
+    The events are submitted by the reactor threads, which never wait for
+    room in a full queue. The events submitted to a full queue are dropped,
+    and a warning is logged.
+    """
+
+    def __init__(self, thread_count, queue_capacity, handle_event):
+        self._queues = [queue.Queue(queue_capacity) for _ in range(thread_count)]
+        self._handle_event = handle_event
+        self._threads = [
+            threading.Thread(target=self._run, args=(q,), name="hazelcast-event-%d" % i)
+            for i, q in enumerate(self._queues)
+        ]
+        self._live = False
+        # Incremented only from the reactor threads
+        self._next_index = 0
+        self.dropped_events = 0
+
+    def start(self):
+        self._live = True
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+
+    def execute(self, partition_id, handler, message):
+        queues = self._queues
+        if partition_id < 0:
+            index = self._next_index
+            self._next_index = index + 1
+        else:
+            index = partition_id
+        task_queue = queues[index % len(queues)]
+
+        try:
+            task_queue.put_nowait((handler, message))
+        except queue.Full:
+            self.dropped_events += 1
+            _logger.warning("Event queue is full, dropping the event %s", message)
+
+    @property
+    def queue_size(self):
+        """Number of events waiting to be handled."""
+        return sum(q.qsize() for q in self._queues)
+
+    def shutdown(self):
+        if not self._live:
+            return
+
+        self._live = False
+        for task_queue in self._queues:
+            try:
+                task_queue.put_nowait(_SHUTDOWN_TASK)
+            except queue.Full:
+                # The thread will see that the executor is
+                # not live after handling the current event.
+                pass
+
+    def _run(self, task_queue):
+        handle_event = self._handle_event
+        while self._live:
+            task = task_queue.get()
+            if task is _SHUTDOWN_TASK:
+                return
+
+            handler, message = task
+            try:
+                handle_event(handler, message)
+            except:
+                _logger.exception("Failed to handle the event %s", message)
+
+
 class ListenerService:
     def __init__(
         self,
@@ -51,6 +146,7 @@ class ListenerService:
         connection_manager,
         invocation_service,
         compact_schema_service: CompactSchemaService,
+        reactor_profiler=None,
     ):
         self._client = client
         self._connection_manager = connection_manager
@@ -60,13 +156,46 @@ class ListenerService:
         self._active_registrations: typing.Dict[str, _ListenerRegistration] = {}
         self._registration_lock = threading.RLock()
         self._event_handlers: typing.Dict[int, typing.Callable] = {}
+        self._reactor_profiler = reactor_profiler
+        self._event_executor = None
+        if config.event_thread_count > 0:
+            self._event_executor = _StripedEventExecutor(
+                config.event_thread_count,
+                config.event_queue_capacity,
+                self._handle_event,
+            )
 
     def start(self):
+        if self._event_executor is not None:
+            self._event_executor.start()
         self._connection_manager.add_listener(self._connection_added, self._connection_removed)
 
+    def shutdown(self):
+        if self._event_executor is not None:
+            self._event_executor.shutdown()
+
+    @property
+    def event_executor(self):
+        return self._event_executor
+
     def register_listener(
-        self, registration_request, decode_register_response, encode_deregister_request, handler
+        self,
+        registration_request,
+        decode_register_response,
+        encode_deregister_request,
+        handler,
+        striped=False,
     ):
+        """Registers the listener on all the connections.
+
+        When ``striped`` is ``True``, and the event threads are enabled,
+        the events of the listener are handled on the event threads. It is
+        meant for the user entry listeners, while the events of the
+        internal listeners are handled on the reactor threads.
+        """
+        if striped and self._event_executor is not None:
+            handler = _StripedEventHandler(handler)
+
         with self._registration_lock:
             registration_id = str(uuid4())
             registration = _ListenerRegistration(
@@ -144,13 +273,30 @@ class ListenerService:
     def handle_client_message(self, message: InboundMessage, correlation_id: int):
         handler = self._event_handlers.get(correlation_id, None)
         if handler:
+            # Only the user entry listeners are registered with striped
+            # handlers, and only when the event threads are enabled.
+            executor = self._event_executor
+            if executor is not None and type(handler) is _StripedEventHandler:
+                executor.execute(message.get_partition_id(), handler.handler, message)
+                return
+
             try:
-                handler(message)
+                profiler = self._reactor_profiler
+                if profiler is None:
+                    handler(message)
+                else:
+                    profiler.run_event_handler(handler, message)
             except SchemaNotFoundError as e:
                 self._fetch_schema_and_handle_again(e, handler, message)
         else:
             _logger.debug("Got event message with unknown correlation id: %s", message)
 
+    def _handle_event(self, handler, message):
+        try:
+            handler(message)
+        except SchemaNotFoundError as e:
+            self._fetch_schema_and_handle_again(e, handler, message)
+
     def _fetch_schema_and_handle_again(
         self,
         error: SchemaNotFoundError,
@@ -1,10 +1,23 @@
+import logging
 import random
 import sys
-
-from hazelcast.config import InMemoryFormat, EvictionPolicy
-from hazelcast.util import current_time
+import threading
+from collections import OrderedDict
+
+from hazelcast.config import (
+    InMemoryFormat,
+    EvictionPolicy,
+    EvictionStrategy,
+    EvictionMaxSizePolicy,
+)
+from hazelcast.invocation import Invocation
+from hazelcast.protocol.codec import map_fetch_near_cache_invalidation_metadata_codec
+from hazelcast.serialization.data import Data
+from hazelcast.util import current_time, current_time_in_millis, to_millis
 from sys import getsizeof
 
+_logger = logging.getLogger(__name__)
+
 
 def _lru_key_func(x):
     return x.last_access_time
@@ -26,16 +39,146 @@ _eviction_key_func = {
 }
 
 
+class _LRUEvictionIndex:
+    """Keeps the keys ordered from the least to the most recently used."""
+
+    __slots__ = ("_keys",)
+
+    def __init__(self):
+        self._keys = OrderedDict()
+
+    def add(self, record):
+        self._keys[record.key] = None
+
+    def touch(self, record):
+        self._keys.move_to_end(record.key)
+
+    def remove(self, record):
+        del self._keys[record.key]
+
+    def clear(self):
+        self._keys.clear()
+
+    def peek(self):
+        return next(iter(self._keys))
+
+    def memory_cost(self):
+        return getsizeof(self._keys)
+
+
+class _LFUEvictionIndex:
+    """Keeps the keys in buckets of their access hits, where each bucket is
+    ordered from the least to the most recently used key."""
+
+    __slots__ = ("_buckets", "_min_hits")
+
+    def __init__(self):
+        self._buckets = {}
+        self._min_hits = 0
+
+    def add(self, record):
+        self._add(record.key, record.access_hit)
+
+    def touch(self, record):
+        # Called after the access hit of the record is incremented
+        hits = record.access_hit
+        if self._remove(record.key, hits - 1) and self._min_hits == hits - 1:
+            self._min_hits = hits
+        self._add(record.key, hits)
+
+    def remove(self, record):
+        self._remove(record.key, record.access_hit)
+
+    def clear(self):
+        self._buckets.clear()
+        self._min_hits = 0
+
+    def peek(self):
+        buckets = self._buckets
+        bucket = buckets.get(self._min_hits, None)
+        if bucket is None:
+            # The bucket with the minimum hits is emptied by a removal
+            self._min_hits = min(buckets)
+            bucket = buckets[self._min_hits]
+        return next(iter(bucket))
+
+    def memory_cost(self):
+        buckets = self._buckets
+        return getsizeof(buckets) + sum(getsizeof(bucket) for bucket in buckets.values())
+
+    def _add(self, key, hits):
+        bucket = self._buckets.get(hits, None)
+        if bucket is None:
+            bucket = self._buckets[hits] = OrderedDict()
+        bucket[key] = None
+        if hits < self._min_hits:
+            self._min_hits = hits
+
+    def _remove(self, key, hits):
+        """Removes the key from its bucket, and returns ``True`` if the
+        bucket is emptied."""
+        bucket = self._buckets[hits]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[hits]
+            return True
+        return False
+
+
+_exact_eviction_index = {
+    EvictionPolicy.LRU: _LRUEvictionIndex,
+    EvictionPolicy.LFU: _LFUEvictionIndex,
+}
+
+
 class DataRecord:
-    """An expirable and evictable data object which represents a cache entry."""
+    """An expirable and evictable data object which represents a cache entry.
+
+    The timestamps of the record are in milliseconds.
+
+    The size and the memory cost of the entry are computed once, when the
+    record is put into the Near Cache, so that exactly the same amounts are
+    subtracted from the totals of the Near Cache when the record is removed,
+    even if the value is mutated in the meantime.
+    """
+
+    __slots__ = (
+        "key",
+        "value",
+        "create_time",
+        "expiration_time",
+        "last_access_time",
+        "access_hit",
+        "partition_id",
+        "invalidation_sequence",
+        "uuid",
+        "size",
+        "memory_cost",
+    )
 
     def __init__(self, key, value, create_time=None, ttl_seconds=None):
+        """
+        Args:
+            key: Key of the entry.
+            value: Value of the entry.
+            create_time (int): Creation time of the record, in milliseconds.
+                When ``None``, the current time is used. ``0`` when the
+                timestamps of the record are not tracked.
+            ttl_seconds (float): Time to live of the record, in seconds.
+        """
         self.key = key
         self.value = value
-        self.create_time = create_time if create_time is not None else current_time()
-        self.expiration_time = self.create_time + ttl_seconds if ttl_seconds is not None else None
+        self.create_time = create_time if create_time is not None else current_time_in_millis()
+        self.expiration_time = (
+            self.create_time + to_millis(ttl_seconds) if ttl_seconds is not None else None
+        )
         self.last_access_time = self.create_time
         self.access_hit = 0
+        self.partition_id = -1
+        self.invalidation_sequence = 0
+        self.uuid = None
+        self.size = 0
+        self.memory_cost = 0
 
     def is_expired(self, max_idle_seconds):
         """Determines whether this record is expired or not.
@@ -47,12 +190,21 @@ class DataRecord:
             bool: ``True`` is this record is not expired, ``False`` otherwise.
         """
 
-        now = current_time()
+        now = current_time_in_millis()
         return (self.expiration_time is not None and self.expiration_time < now) or (
-            max_idle_seconds is not None and self.last_access_time + max_idle_seconds < now
+            max_idle_seconds is not None
+            and self.last_access_time + to_millis(max_idle_seconds) < now
         )
 
     def __repr__(self):
+        if self.create_time == 0:
+            # The timestamps are not tracked
+            return "DataRecord(key=%s, value=%s, access_hit=%s)" % (
+                self.key,
+                self.value,
+                self.access_hit,
+            )
+
         return (
             "DataRecord(key=%s, value=%s, create_time=%s, "
             "expiration_time=%s, last_access_time=%s, access_hit=%s)"
@@ -67,8 +219,26 @@ class DataRecord:
         )
 
 
+_RECORD_MEMORY_COST = getsizeof(DataRecord(None, None, 0))
+_TIMESTAMP_MEMORY_COST = getsizeof(current_time_in_millis())
+# Of the size and the memory cost stored in each record
+_SIZE_MEMORY_COST = 2 * getsizeof(1 << 20)
+
+
+def _memory_cost(obj):
+    if isinstance(obj, Data):
+        return getsizeof(obj) + getsizeof(obj.buffer)
+    return getsizeof(obj)
+
+
 class NearCache(dict):
-    """NearCache is a local cache used by :class:`~hazelcast.proxy.map.MapFeatNearCache`."""
+    """NearCache is a local cache used by :class:`~hazelcast.proxy.map.MapFeatNearCache`.
+
+    The records are put by the user threads, and invalidated, evicted and
+    expired by the reactor and the event threads, so every mutation of the
+    records, the eviction index and the size counters is done while holding
+    the lock of the Near Cache.
+    """
 
     def __init__(
         self,
@@ -82,6 +252,9 @@ class NearCache(dict):
         eviction_max_size,
         eviction_sampling_count=None,
         eviction_sampling_pool_size=None,
+        eviction_strategy=EvictionStrategy.SAMPLING,
+        eviction_max_size_policy=EvictionMaxSizePolicy.ENTRY_COUNT,
+        object_sizer=None,
     ):
         super(NearCache, self).__init__()
         self.name = name
@@ -92,6 +265,17 @@ class NearCache(dict):
         self.invalidate_on_change = invalidate_on_change
         self.eviction_policy = eviction_policy
         self.eviction_max_size = eviction_max_size
+        self.eviction_strategy = eviction_strategy
+        self.eviction_max_size_policy = eviction_max_size_policy
+        self.object_sizer = object_sizer if object_sizer is not None else getsizeof
+
+        # The defaults below are derived from the maximum number of
+        # entries, which is not known when the maximum size is in bytes.
+        if eviction_max_size_policy == EvictionMaxSizePolicy.USED_MEMORY_SIZE:
+            if eviction_sampling_count is None:
+                eviction_sampling_count = 8
+            if eviction_sampling_pool_size is None:
+                eviction_sampling_pool_size = 16
 
         if eviction_sampling_count is None:  # None or zero
             self.eviction_sampling_count = max(eviction_max_size // 10, 1)
@@ -107,8 +291,32 @@ class NearCache(dict):
         else:
             self.eviction_sampling_pool_size = self.eviction_max_size
 
+        self.repairing_handler = None
+
         # internal
         self._key_func = _eviction_key_func[self.eviction_policy]
+        self._eviction_index = None
+        if eviction_strategy == EvictionStrategy.EXACT:
+            index_cls = _exact_eviction_index.get(eviction_policy, None)
+            if index_cls is not None:
+                self._eviction_index = index_cls()
+        # The access times are only needed for the idle expiration and
+        # the sampling based LRU eviction, and the access hits for LFU.
+        self._expiry_enabled = time_to_live is not None or max_idle is not None
+        self._track_access_time = max_idle is not None or (
+            eviction_policy == EvictionPolicy.LRU and self._eviction_index is None
+        )
+        self._track_access_hit = eviction_policy == EvictionPolicy.LFU
+        self._track_time = self._track_access_time or time_to_live is not None
+        self._record_memory_cost = _RECORD_MEMORY_COST + _SIZE_MEMORY_COST
+        if self._track_time:
+            self._record_memory_cost += _TIMESTAMP_MEMORY_COST
+        if time_to_live is not None:
+            self._record_memory_cost += _TIMESTAMP_MEMORY_COST
+        self._entries_memory_cost = 0
+        self._used_memory_size = 0
+        self._expiration_keys = None
+        self._expiration_index = 0
         self._eviction_candidates = list()
         self._evictions = 0
         self._expirations = 0
@@ -117,6 +325,8 @@ class NearCache(dict):
         self._invalidations = 0
         self._invalidation_requests = 0
         self._creation_time_in_seconds = current_time()
+        # Reentrant, as the reads and the puts delete records while holding it
+        self._lock = threading.RLock()
 
     def get_statistics(self):
         """Returns the statistics of the NearCache.
@@ -133,48 +343,124 @@ class NearCache(dict):
             "invalidations": self._invalidations,
             "invalidation_requests": self._invalidation_requests,
             "owned_entry_count": self.__len__(),
-            "owned_entry_memory_cost": getsizeof(self, 0),
+            "owned_entry_memory_cost": self._get_owned_entry_memory_cost(),
+            "used_memory_size": self._used_memory_size,
         }
 
         return stats
 
     def __setitem__(self, key, value):
-        self._do_eviction_if_required()
-
         if self.in_memory_format == InMemoryFormat.BINARY:
             value = self.serialization_service.to_data(value)
+            if isinstance(value.buffer, memoryview):
+                # Values decoded from responses are views over the
+                # connection's receive buffer. Copy them so that the
+                # cached record does not keep that buffer alive.
+                value = Data(value.buffer.tobytes())
         elif self.in_memory_format == InMemoryFormat.OBJECT:
             value = self.serialization_service.to_object(value)
         else:
             raise ValueError("Invalid in-memory format!!!")
 
-        data_record = DataRecord(key, value, ttl_seconds=self.time_to_live)
-        super(NearCache, self).__setitem__(key, data_record)
+        entry_size = self._get_size(key) + self._get_size(value)
+        if (
+            self.eviction_max_size_policy == EvictionMaxSizePolicy.USED_MEMORY_SIZE
+            and entry_size > self.eviction_max_size
+        ):
+            # Would evict all the other records, and still exceed the
+            # maximum size. The previous value of the key is outdated.
+            with self._lock:
+                if key in self:
+                    self.__delitem__(key)
+            return
+
+        create_time = current_time_in_millis() if self._track_time else 0
+        data_record = DataRecord(key, value, create_time, self.time_to_live)
+        data_record.size = entry_size
+        data_record.memory_cost = self._get_entry_memory_cost(key, value)
+        repairing_handler = self.repairing_handler
+        if repairing_handler is not None:
+            repairing_handler.stamp(data_record)
+
+        with self._lock:
+            self._do_eviction_if_required(key, entry_size)
+
+            old_record = self.get(key, None)
+            if old_record is not None:
+                self._entries_memory_cost -= old_record.memory_cost
+                self._used_memory_size -= old_record.size
+            self._entries_memory_cost += data_record.memory_cost
+            self._used_memory_size += entry_size
+
+            eviction_index = self._eviction_index
+            if eviction_index is not None:
+                if old_record is not None:
+                    eviction_index.remove(old_record)
+                eviction_index.add(data_record)
+            super(NearCache, self).__setitem__(key, data_record)
+
+    def __delitem__(self, key):
+        with self._lock:
+            record = self.pop(key)
+            self._entries_memory_cost -= record.memory_cost
+            self._used_memory_size -= record.size
+            if self._eviction_index is not None:
+                self._eviction_index.remove(record)
+
+    def clear(self):
+        with self._lock:
+            super(NearCache, self).clear()
+            self._entries_memory_cost = 0
+            self._used_memory_size = 0
+            self._expiration_keys = None
+            if self._eviction_index is not None:
+                self._eviction_index.clear()
 
     def __getitem__(self, key):
-        try:
-            value_record = super(NearCache, self).__getitem__(key)
-            if value_record.is_expired(self.max_idle):
-                super(NearCache, self).__delitem__(key)
-                raise KeyError
-        except KeyError as ke:
-            self._misses += 1
-            raise ke
-
-        if self.eviction_policy == EvictionPolicy.LRU:
-            value_record.last_access_time = current_time()
-        elif self.eviction_policy == EvictionPolicy.LFU:
-            value_record.access_hit += 1
-        self._hits += 1
+        with self._lock:
+            try:
+                value_record = super(NearCache, self).__getitem__(key)
+                if self._expiry_enabled and value_record.is_expired(self.max_idle):
+                    self.__delitem__(key)
+                    raise KeyError
+
+                repairing_handler = self.repairing_handler
+                if repairing_handler is not None and repairing_handler.is_stale_read(value_record):
+                    self.__delitem__(key)
+                    self._invalidations += 1
+                    raise KeyError
+            except KeyError as ke:
+                self._misses += 1
+                raise ke
+
+            if self._track_access_time:
+                value_record.last_access_time = current_time_in_millis()
+            if self._track_access_hit:
+                value_record.access_hit += 1
+
+            if self._eviction_index is not None:
+                self._eviction_index.touch(value_record)
+            self._hits += 1
+
         return (
             self.serialization_service.to_object(value_record.value)
             if self.in_memory_format == InMemoryFormat.BINARY
             else value_record.value
         )
 
-    def _do_eviction_if_required(self):
-        if not self._is_eviction_required():
-            return
+    def _do_eviction_if_required(self, key, entry_size):
+        while self._is_eviction_required(key, entry_size):
+            size = self.__len__()
+            if self._eviction_index is not None:
+                self._evict_exact()
+            else:
+                self._evict_sampled()
+
+            if self.__len__() == size:
+                # Nothing is evicted or expired, do not retry
+                return
+
+    def _evict_sampled(self):
         new_eviction_samples = self._find_new_random_samples()
         new_eviction_samples_cleaned = self._scan_and_expire_collection(new_eviction_samples)
         if len(new_eviction_samples_cleaned) == 0:  # have nothing to expire
@@ -195,13 +481,22 @@ class NearCache(dict):
                 # key may be evicted previously so just ignore it
                 pass
 
+    def _evict_exact(self):
+        key = self._eviction_index.peek()
+        record = self.get(key)
+        self.__delitem__(key)
+        if self._expiry_enabled and record.is_expired(self.max_idle):
+            self._expirations += 1
+        else:
+            self._evictions += 1
+
     def _find_new_random_samples(self):
         records = list(self.values())  # has random order because of dict hash
         new_sample_pool = set(self._eviction_candidates)
-        start = self._random_index()
+        start = self._random_index(len(records))
         for i in range(start, start + self.eviction_sampling_count):
-            index = i if i < len(records) else i - len(records)
-            if records[index].is_expired(self.max_idle):
+            index = i % len(records)
+            if self._expiry_enabled and records[index].is_expired(self.max_idle):
                 self._clean_expired_record(records[index].key)
             elif (
                 self._is_better_than_worse_entry(records[index])
@@ -213,14 +508,14 @@ class NearCache(dict):
     def _scan_and_expire_collection(self, records):
         new_records = []
         for record in records:
-            if record.is_expired(self.max_idle):
+            if self._expiry_enabled and record.is_expired(self.max_idle):
                 self._clean_expired_record(record.key)
             else:
                 new_records.append(record)
         return new_records
 
-    def _random_index(self):
-        return random.randint(0, self.eviction_max_size - 1)
+    def _random_index(self, record_count):
+        return random.randint(0, record_count - 1)
 
     def _is_better_than_worse_entry(self, data_record):
         return (
@@ -228,10 +523,78 @@ class NearCache(dict):
             or (self._key_func(data_record) - self._key_func(self._eviction_candidates[-1])) < 0
         )
 
-    def _is_eviction_required(self):
-        return (
-            self.eviction_policy != EvictionPolicy.NONE and self.eviction_max_size <= self.__len__()
-        )
+    def _is_eviction_required(self, key, entry_size):
+        if self.eviction_policy == EvictionPolicy.NONE:
+            return False
+
+        if self.eviction_max_size_policy == EvictionMaxSizePolicy.USED_MEMORY_SIZE:
+            used_memory_size = self._used_memory_size + entry_size
+            old_record = self.get(key, None)
+            if old_record is not None:
+                # It is replaced by the entry
+                used_memory_size -= old_record.size
+            return self.__len__() > 0 and used_memory_size > self.eviction_max_size
+
+        return self.eviction_max_size <= self.__len__()
+
+    def _get_size(self, obj):
+        if isinstance(obj, Data):
+            return obj.total_size()
+        return self.object_sizer(obj)
+
+    def _get_entry_memory_cost(self, key, value):
+        # The key of the record is the same object with the key of the entry
+        return self._record_memory_cost + _memory_cost(key) + _memory_cost(value)
+
+    def _get_owned_entry_memory_cost(self):
+        with self._lock:
+            cost = getsizeof(self, 0) + self._entries_memory_cost
+            if self._eviction_index is not None:
+                cost += self._eviction_index.memory_cost()
+            return cost
+
+    def _do_expiration(self, max_records):
+        """Removes the expired records, checking at most the given number
+        of records.
+
+        The keys are snapshotted at the start of each sweep over the Near
+        Cache, and the sweep continues from where the previous call left.
+        Each key is released from the snapshot once it is checked, but the
+        keys that are removed from the Near Cache before they are checked
+        are kept alive by the snapshot until the sweep reaches them. The
+        snapshot is dropped when the Near Cache is cleared or destroyed.
+
+        Each record is checked and removed while holding the lock, so that
+        a record that is replaced or removed concurrently is never removed
+        in place of the checked one. The lock is not held for the whole
+        sweep, so the other threads are not blocked by it.
+        """
+        if not self._expiry_enabled:
+            return
+
+        with self._lock:
+            keys = self._expiration_keys
+            if keys is None:
+                keys = self._expiration_keys = list(self.keys())
+                self._expiration_index = 0
+            start = self._expiration_index
+            end = min(start + max_records, len(keys))
+            self._expiration_index = end
+
+        max_idle = self.max_idle
+        for i in range(start, end):
+            key = keys[i]
+            keys[i] = None
+            with self._lock:
+                record = self.get(key, None)
+                if record is not None and record.is_expired(max_idle):
+                    self._clean_expired_record(key)
+
+        with self._lock:
+            # The snapshot might be dropped, or a new one might be taken
+            # after a clear, in the meantime.
+            if self._expiration_keys is keys and end == len(keys):
+                self._expiration_keys = None
 
     def _clean_expired_record(self, key):
         try:
@@ -242,29 +605,327 @@ class NearCache(dict):
             pass
 
     def _clear(self):
-        size = self.__len__()
-        self.clear()
-        self._invalidations += size
-        self._invalidation_requests += 1
+        with self._lock:
+            size = self.__len__()
+            self.clear()
+            self._invalidations += size
+            self._invalidation_requests += 1
 
     def _invalidate(self, key_data):
-        try:
-            self.__delitem__(key_data)
-            self._invalidations += 1
-        except KeyError:
-            # There is nothing to invalidate
-            pass
-        self._invalidation_requests += 1
+        with self._lock:
+            try:
+                self.__delitem__(key_data)
+                self._invalidations += 1
+            except KeyError:
+                # There is nothing to invalidate
+                pass
+            self._invalidation_requests += 1
 
     def __repr__(self):
         return "NearCache(len=%s, evicted=%s)" % (self.__len__(), self._evictions)
 
 
+class _MetaDataContainer:
+    """Invalidation metadata of a partition, as seen by a Near Cache."""
+
+    __slots__ = ("sequence", "stale_sequence", "missed_sequence_count", "uuid")
+
+    def __init__(self):
+        self.sequence = 0
+        self.stale_sequence = 0
+        self.missed_sequence_count = 0
+        self.uuid = None
+
+
+class RepairingHandler:
+    """Tracks the partition UUIDs and the sequence numbers of the
+    invalidations received for a Near Cache.
+
+    The records put into the Near Cache are stamped with the metadata of
+    their partitions, and the ones that might have missed an invalidation
+    are detected as stale on reads.
+    """
+
+    def __init__(self, name, partition_service, serialization_service):
+        self.name = name
+        self._partition_service = partition_service
+        self._serialization_service = serialization_service
+        self._containers = {}
+        self._lock = threading.Lock()
+
+    def get_meta_data_container(self, partition_id):
+        container = self._containers.get(partition_id, None)
+        if container is None:
+            container = self._containers.setdefault(partition_id, _MetaDataContainer())
+        return container
+
+    def handle(self, key, partition_uuid, sequence):
+        partition_id = self._get_partition_id(key)
+        with self._lock:
+            self._check_or_repair_uuid(partition_id, partition_uuid)
+            self._check_or_repair_sequence(partition_id, sequence, False)
+
+    def handle_batch(self, keys, partition_uuids, sequences):
+        for key, partition_uuid, sequence in zip(keys, partition_uuids, sequences):
+            self.handle(key, partition_uuid, sequence)
+
+    def init_uuids(self, partition_uuids):
+        with self._lock:
+            for partition_id, partition_uuid in partition_uuids:
+                self.get_meta_data_container(partition_id).uuid = partition_uuid
+
+    def init_sequences(self, partition_sequences):
+        with self._lock:
+            for partition_id, sequence in partition_sequences:
+                self.get_meta_data_container(partition_id).sequence = sequence
+
+    def repair_uuids(self, partition_uuids):
+        with self._lock:
+            for partition_id, partition_uuid in partition_uuids:
+                self._check_or_repair_uuid(partition_id, partition_uuid)
+
+    def repair_sequences(self, partition_sequences):
+        with self._lock:
+            for partition_id, sequence in partition_sequences:
+                self._check_or_repair_sequence(partition_id, sequence, True)
+
+    def get_missed_sequence_count(self):
+        return sum(c.missed_sequence_count for c in list(self._containers.values()))
+
+    def update_last_known_stale_sequences(self):
+        with self._lock:
+            for container in self._containers.values():
+                if container.missed_sequence_count != 0:
+                    container.missed_sequence_count = 0
+                    container.stale_sequence = container.sequence
+
+    def stamp(self, record):
+        partition_id = self._partition_service.get_partition_id(record.key)
+        container = self.get_meta_data_container(partition_id)
+        record.partition_id = partition_id
+        record.invalidation_sequence = container.sequence
+        record.uuid = container.uuid
+
+    def is_stale_read(self, record):
+        container = self.get_meta_data_container(record.partition_id)
+        return (
+            record.uuid != container.uuid or record.invalidation_sequence < container.stale_sequence
+        )
+
+    def _get_partition_id(self, key):
+        if key is None:
+            # Clear events carry no key, they are tracked on the
+            # partition that the name of the data structure maps to.
+            key = self._serialization_service.to_data(self.name)
+        return self._partition_service.get_partition_id(key)
+
+    def _check_or_repair_uuid(self, partition_id, partition_uuid):
+        container = self.get_meta_data_container(partition_id)
+        if container.uuid == partition_uuid:
+            return
+
+        container.uuid = partition_uuid
+        container.sequence = 0
+        container.stale_sequence = 0
+
+    def _check_or_repair_sequence(self, partition_id, sequence, via_anti_entropy):
+        container = self.get_meta_data_container(partition_id)
+        current_sequence = container.sequence
+        if current_sequence >= sequence:
+            return
+
+        container.sequence = sequence
+        sequence_diff = sequence - current_sequence
+        if via_anti_entropy:
+            container.missed_sequence_count += sequence_diff
+        elif sequence_diff > 1:
+            container.missed_sequence_count += sequence_diff - 1
+
+
+class RepairingTask:
+    """Repairs the invalidation metadata of the Near Caches.
+
+    Runs periodically on the reactor. On each run, marks the records of the
+    partitions with missed invalidations as stale, once the total number of
+    missed invalidations exceeds the tolerated count, and fetches the
+    metadata from the data members in every reconciliation interval.
+    """
+
+    _RUN_PERIOD = 1.0
+
+    def __init__(
+        self,
+        config,
+        reactor,
+        invocation_service,
+        cluster_service,
+        partition_service,
+        serialization_service,
+    ):
+        self._reconciliation_interval = config.near_cache_reconciliation_interval
+        self._max_tolerated_miss_count = config.near_cache_max_tolerated_miss_count
+        self._reactor = reactor
+        self._invocation_service = invocation_service
+        self._cluster_service = cluster_service
+        self._partition_service = partition_service
+        self._serialization_service = serialization_service
+        self._handlers = {}
+        self._timer = None
+        self._last_anti_entropy_run = current_time()
+        self._lock = threading.Lock()
+
+    def register_and_get_handler(self, name):
+        with self._lock:
+            handler = self._handlers.get(name, None)
+            if handler is not None:
+                return handler
+
+            handler = RepairingHandler(name, self._partition_service, self._serialization_service)
+            self._handlers[name] = handler
+            if self._timer is None:
+                self._timer = self._reactor.add_timer(self._RUN_PERIOD, self._run)
+
+        self._fetch_metadata([handler], True)
+        return handler
+
+    def deregister_handler(self, name):
+        with self._lock:
+            self._handlers.pop(name, None)
+            if not self._handlers and self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _run(self):
+        timer = self._timer
+        try:
+            self._fix_sequence_gaps()
+            now = current_time()
+            interval = self._reconciliation_interval
+            if interval > 0 and now - self._last_anti_entropy_run >= interval:
+                self._last_anti_entropy_run = now
+                self._fetch_metadata(list(self._handlers.values()), False)
+        except Exception:
+            _logger.exception("Failed to repair the invalidation metadata of the Near Caches")
+        finally:
+            with self._lock:
+                # The task might be cancelled, or even rescheduled by a new
+                # registration, while running.
+                if self._timer is timer:
+                    if self._handlers:
+                        self._timer = self._reactor.add_timer(self._RUN_PERIOD, self._run)
+                    else:
+                        self._timer = None
+
+    def _fix_sequence_gaps(self):
+        handlers = list(self._handlers.values())
+        missed_count = sum(handler.get_missed_sequence_count() for handler in handlers)
+        if missed_count <= self._max_tolerated_miss_count:
+            return
+
+        for handler in handlers:
+            handler.update_last_known_stale_sequences()
+
+    def _fetch_metadata(self, handlers, initialize):
+        if not handlers:
+            return
+
+        codec = map_fetch_near_cache_invalidation_metadata_codec
+        names = [handler.name for handler in handlers]
+        members = self._cluster_service.get_members(lambda m: not m.lite_member)
+        for member in members:
+            request = codec.encode_request(names, member.uuid)
+            invocation = Invocation(
+                request, uuid=member.uuid, response_handler=codec.decode_response
+            )
+            self._invocation_service.invoke(invocation)
+            invocation.future.add_done_callback(
+                lambda f: self._handle_metadata(f, handlers, initialize)
+            )
+
+    def _handle_metadata(self, future, handlers, initialize):
+        try:
+            response = future.result()
+        except Exception as e:
+            _logger.debug("Failed to fetch the invalidation metadata of the Near Caches: %s", e)
+            return
+
+        partition_uuids = response["partition_uuid_list"]
+        sequences = dict(response["name_partition_sequence_list"])
+        for handler in handlers:
+            partition_sequences = sequences.get(handler.name, [])
+            if initialize:
+                handler.init_uuids(partition_uuids)
+                handler.init_sequences(partition_sequences)
+            else:
+                handler.repair_uuids(partition_uuids)
+                handler.repair_sequences(partition_sequences)
+
+
+class ExpirationTask:
+    """Removes the expired records of the Near Caches in the background.
+
+    Runs periodically on the reactor, and checks a bounded number of records
+    of each Near Cache on each run, so that the expired records of the keys
+    that are never read again do not stay in the memory.
+    """
+
+    _RUN_PERIOD = 1.0
+    _MAX_RECORDS_PER_RUN = 10000
+
+    def __init__(self, reactor):
+        self._reactor = reactor
+        self._near_caches = {}
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def register(self, near_cache):
+        with self._lock:
+            self._near_caches[near_cache.name] = near_cache
+            if self._timer is None:
+                self._timer = self._reactor.add_timer(self._RUN_PERIOD, self._run)
+
+    def deregister(self, name):
+        with self._lock:
+            self._near_caches.pop(name, None)
+            if not self._near_caches and self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _run(self):
+        timer = self._timer
+        try:
+            for near_cache in list(self._near_caches.values()):
+                near_cache._do_expiration(self._MAX_RECORDS_PER_RUN)
+        except Exception:
+            _logger.exception("Failed to remove the expired records of the Near Caches")
+        finally:
+            with self._lock:
+                # See RepairingTask._run
+                if self._timer is timer:
+                    if self._near_caches:
+                        self._timer = self._reactor.add_timer(self._RUN_PERIOD, self._run)
+                    else:
+                        self._timer = None
+
+
 class NearCacheManager:
     def __init__(self, config, serialization_service):
         self._config = config
         self._serialization_service = serialization_service
         self._caches = {}
+        self._repairing_task = None
+        self._expiration_task = None
+
+    def init(self, reactor, invocation_service, cluster_service, partition_service):
+        self._expiration_task = ExpirationTask(reactor)
+        self._repairing_task = RepairingTask(
+            self._config,
+            reactor,
+            invocation_service,
+            cluster_service,
+            partition_service,
+            self._serialization_service,
+        )
 
     def get_or_create_near_cache(self, name):
         near_cache = self._caches.get(name, None)
@@ -284,8 +945,21 @@ class NearCacheManager:
                 near_cache_config.eviction_max_size,
                 near_cache_config.eviction_sampling_count,
                 near_cache_config.eviction_sampling_pool_size,
+                near_cache_config.eviction_strategy,
+                near_cache_config.eviction_max_size_policy,
+                near_cache_config.object_sizer,
             )
 
+            repairing_task = self._repairing_task
+            if near_cache_config.invalidate_on_change and repairing_task is not None:
+                near_cache.repairing_handler = repairing_task.register_and_get_handler(name)
+
+            expiration_task = self._expiration_task
+            if expiration_task is not None and (
+                near_cache_config.time_to_live is not None or near_cache_config.max_idle is not None
+            ):
+                expiration_task.register(near_cache)
+
             self._caches[name] = near_cache
 
         return near_cache
@@ -301,6 +975,12 @@ class NearCacheManager:
         except KeyError:
             pass
 
+        if self._repairing_task is not None:
+            self._repairing_task.deregister_handler(name)
+
+        if self._expiration_task is not None:
+            self._expiration_task.deregister(name)
+
     def destroy_near_caches(self):
         for key in list(self._caches.keys()):
             self.destroy_near_cache(key)
@@ -1,14 +1,23 @@
 import logging
+import threading
 import uuid
+from collections import OrderedDict
 
 import typing
 
 from hazelcast.errors import ClientOfflineError
-from hazelcast.hash import hash_to_index
+from hazelcast.hash import hash_to_index, murmur_hash3_x86_32
+from hazelcast.serialization import BE_INT
 from hazelcast.serialization.compact import SchemaNotReplicatedError
+from hazelcast.serialization.data import Data, PARTITION_HASH_OFFSET
 
 _logger = logging.getLogger(__name__)
 
+# Exact types of the keys that can be cached. Subclasses, like bool
+# for int, are not cached, as their serialized forms may differ even
+# though they compare equal to the instances of these types.
+_CACHEABLE_KEY_TYPES = {str, int, bytes, uuid.UUID}
+
 
 class _PartitionTable:
     __slots__ = ("connection", "version", "partitions")
@@ -22,6 +31,79 @@ class _PartitionTable:
         return "PartitionTable(connection=%s, version=%s)" % (self.connection, self.version)
 
 
+class _KeyData(Data):
+    """Serialized form of a cached key, whose hashes are computed once."""
+
+    __slots__ = ("_hash", "_partition_hash")
+
+    def __init__(self, buf):
+        super(_KeyData, self).__init__(buf)
+        self._hash = murmur_hash3_x86_32(buf)
+        partition_hash = BE_INT.unpack_from(buf, PARTITION_HASH_OFFSET)[0]
+        self._partition_hash = partition_hash if partition_hash != 0 else self._hash
+
+    def get_partition_hash(self):
+        return self._partition_hash
+
+    def hash_code(self):
+        return self._hash
+
+    def __hash__(self):
+        return self._hash
+
+
+class _PartitionIdCache:
+    """Bounded LRU cache of the serialized forms of the keys.
+
+    As the partition hashes of the cached keys are memoized, the
+    partition ids of them are computed without serializing or
+    hashing the keys again.
+    """
+
+    __slots__ = ("capacity", "hits", "misses", "_entries", "_lock")
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            key_data = self._entries.get(key, None)
+            if key_data is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return key_data
+
+    def put(self, key, key_data):
+        with self._lock:
+            entries = self._entries
+            entries[key] = key_data
+            entries.move_to_end(key)
+            if len(entries) > self.capacity:
+                entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def size(self):
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self):
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
 class PartitionService:
     """
     Allows retrieving information about the partition count, the partition
@@ -58,13 +140,36 @@ class PartitionService:
             The partition id.
         """
         try:
-            key_data = self._serialization_service.to_data(key)
+            key_data = self._service.to_key_data(key)
         except SchemaNotReplicatedError as e:
             self._send_schema_and_retry_fn(e, lambda: None).result()
             return self.get_partition_id(key)
 
         return self._service.get_partition_id(key_data)
 
+    def get_partition_ids(self, keys: typing.Sequence[typing.Any]) -> typing.List[int]:
+        """
+        Returns the partition ids for the given keys, in the same order.
+
+        This is equivalent to calling :func:`get_partition_id` for each key,
+        but the keys are serialized and hashed one by one in a single call,
+        which reads the partition count only once.
+
+        Args:
+            keys: The given keys.
+
+        Returns:
+            The partition ids.
+        """
+        try:
+            to_data = self._service.to_key_data
+            keys_data = [to_data(key) for key in keys]
+        except SchemaNotReplicatedError as e:
+            self._send_schema_and_retry_fn(e, lambda: None).result()
+            return self.get_partition_ids(keys)
+
+        return self._service.get_partition_ids(keys_data)
+
     def get_partition_count(self) -> int:
         """
         Returns partition count of the connected cluster.
@@ -78,12 +183,25 @@ class PartitionService:
 
 
 class _InternalPartitionService:
-    __slots__ = ("partition_count", "_client", "_partition_table")
-
-    def __init__(self, client):
+    __slots__ = (
+        "partition_count",
+        "to_key_data",
+        "_client",
+        "_partition_table",
+        "_to_data",
+        "_key_cache",
+    )
+
+    def __init__(self, client, config, serialization_service):
         self.partition_count = 0
         self._client = client
         self._partition_table = _PartitionTable(None, -1, {})
+        self._to_data = serialization_service.to_data
+        self._key_cache = None
+        self.to_key_data = self._to_data
+        if config.partition_id_cache_size > 0:
+            self._key_cache = _PartitionIdCache(config.partition_id_cache_size)
+            self.to_key_data = self._to_key_data_cached
 
     def handle_partitions_view_event(self, connection, partitions, version):
         _logger.debug("Handling new partition table with version: %s", version)
@@ -108,12 +226,36 @@ class _InternalPartitionService:
             raise ClientOfflineError()
         return hash_to_index(key.get_partition_hash(), self.partition_count)
 
+    def get_partition_ids(self, keys):
+        partition_count = self.partition_count
+        if partition_count == 0:
+            # See get_partition_id
+            raise ClientOfflineError()
+        return [hash_to_index(key.get_partition_hash(), partition_count) for key in keys]
+
     def check_and_set_partition_count(self, partition_count):
         if self.partition_count == 0:
             self.partition_count = partition_count
+            if self._key_cache is not None:
+                self._key_cache.clear()
             return True
         return self.partition_count == partition_count
 
+    @property
+    def key_cache(self):
+        return self._key_cache
+
+    def _to_key_data_cached(self, key):
+        if type(key) not in _CACHEABLE_KEY_TYPES:
+            return self._to_data(key)
+
+        cache = self._key_cache
+        key_data = cache.get(key)
+        if key_data is None:
+            key_data = _KeyData(self._to_data(key).buffer)
+            cache.put(key, key_data)
+        return key_data
+
     @classmethod
     def _should_be_applied(cls, connection, partitions, version, current):
         if not partitions:
@@ -98,7 +98,7 @@ class ByteArrayCodec:
 
     @staticmethod
     def decode(msg):
-        return msg.next_frame().buf
+        return bytes(msg.next_frame().buf)
 
 
 class DataCodec:
@@ -208,6 +208,102 @@ class EntryListUUIDLongCodec:
         return result
 
 
+_INTEGER_INTEGER_ENTRY_SIZE_IN_BYTES = INT_SIZE_IN_BYTES + INT_SIZE_IN_BYTES
+
+
+class EntryListIntegerIntegerCodec:
+    @staticmethod
+    def encode(buf, entries, is_final=False):
+        n = len(entries)
+        size = SIZE_OF_FRAME_LENGTH_AND_FLAGS + n * _INTEGER_INTEGER_ENTRY_SIZE_IN_BYTES
+        b = bytearray(size)
+        LE_INT.pack_into(b, 0, size)
+        if is_final:
+            LE_UINT16.pack_into(b, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
+        for i in range(n):
+            key, value = entries[i]
+            o = SIZE_OF_FRAME_LENGTH_AND_FLAGS + i * _INTEGER_INTEGER_ENTRY_SIZE_IN_BYTES
+            FixSizedTypesCodec.encode_int(b, o, key)
+            FixSizedTypesCodec.encode_int(b, o + INT_SIZE_IN_BYTES, value)
+        buf.extend(b)
+
+    @staticmethod
+    def decode(msg):
+        b = msg.next_frame().buf
+        n = len(b) // _INTEGER_INTEGER_ENTRY_SIZE_IN_BYTES
+        result = []
+        for i in range(n):
+            o = i * _INTEGER_INTEGER_ENTRY_SIZE_IN_BYTES
+            key = FixSizedTypesCodec.decode_int(b, o)
+            value = FixSizedTypesCodec.decode_int(b, o + INT_SIZE_IN_BYTES)
+            result.append((key, value))
+        return result
+
+
+_INTEGER_LONG_ENTRY_SIZE_IN_BYTES = INT_SIZE_IN_BYTES + LONG_SIZE_IN_BYTES
+
+
+class EntryListIntegerLongCodec:
+    @staticmethod
+    def encode(buf, entries, is_final=False):
+        n = len(entries)
+        size = SIZE_OF_FRAME_LENGTH_AND_FLAGS + n * _INTEGER_LONG_ENTRY_SIZE_IN_BYTES
+        b = bytearray(size)
+        LE_INT.pack_into(b, 0, size)
+        if is_final:
+            LE_UINT16.pack_into(b, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
+        for i in range(n):
+            key, value = entries[i]
+            o = SIZE_OF_FRAME_LENGTH_AND_FLAGS + i * _INTEGER_LONG_ENTRY_SIZE_IN_BYTES
+            FixSizedTypesCodec.encode_int(b, o, key)
+            FixSizedTypesCodec.encode_long(b, o + INT_SIZE_IN_BYTES, value)
+        buf.extend(b)
+
+    @staticmethod
+    def decode(msg):
+        b = msg.next_frame().buf
+        n = len(b) // _INTEGER_LONG_ENTRY_SIZE_IN_BYTES
+        result = []
+        for i in range(n):
+            o = i * _INTEGER_LONG_ENTRY_SIZE_IN_BYTES
+            key = FixSizedTypesCodec.decode_int(b, o)
+            value = FixSizedTypesCodec.decode_long(b, o + INT_SIZE_IN_BYTES)
+            result.append((key, value))
+        return result
+
+
+_INTEGER_UUID_ENTRY_SIZE_IN_BYTES = INT_SIZE_IN_BYTES + UUID_SIZE_IN_BYTES
+
+
+class EntryListIntegerUUIDCodec:
+    @staticmethod
+    def encode(buf, entries, is_final=False):
+        n = len(entries)
+        size = SIZE_OF_FRAME_LENGTH_AND_FLAGS + n * _INTEGER_UUID_ENTRY_SIZE_IN_BYTES
+        b = bytearray(size)
+        LE_INT.pack_into(b, 0, size)
+        if is_final:
+            LE_UINT16.pack_into(b, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
+        for i in range(n):
+            key, value = entries[i]
+            o = SIZE_OF_FRAME_LENGTH_AND_FLAGS + i * _INTEGER_UUID_ENTRY_SIZE_IN_BYTES
+            FixSizedTypesCodec.encode_int(b, o, key)
+            FixSizedTypesCodec.encode_uuid(b, o + INT_SIZE_IN_BYTES, value)
+        buf.extend(b)
+
+    @staticmethod
+    def decode(msg):
+        b = msg.next_frame().buf
+        n = len(b) // _INTEGER_UUID_ENTRY_SIZE_IN_BYTES
+        result = []
+        for i in range(n):
+            o = i * _INTEGER_UUID_ENTRY_SIZE_IN_BYTES
+            key = FixSizedTypesCodec.decode_int(b, o)
+            value = FixSizedTypesCodec.decode_uuid(b, o + INT_SIZE_IN_BYTES)
+            result.append((key, value))
+        return result
+
+
 class EntryListUUIDListIntegerCodec:
     @staticmethod
     def encode(buf, entries, is_final=False):
@@ -285,11 +381,9 @@ class FixSizedTypesCodec:
 
         msb_offset = offset + BOOLEAN_SIZE_IN_BYTES
         lsb_offset = msb_offset + LONG_SIZE_IN_BYTES
-        b = (
-            buf[lsb_offset - 1 : msb_offset - 1 : -1]
-            + buf[lsb_offset + LONG_SIZE_IN_BYTES - 1 : lsb_offset - 1 : -1]
-        )
-        return uuid.UUID(bytes=bytes(b))
+        msb = LE_ULONG.unpack_from(buf, msb_offset)[0]
+        lsb = LE_ULONG.unpack_from(buf, lsb_offset)[0]
+        return uuid.UUID(int=(msb << UUID_MSB_SHIFT) | lsb)
 
     @staticmethod
     def decode_short(buf, offset):
@@ -619,7 +713,7 @@ class StringCodec:
 
     @staticmethod
     def decode(msg):
-        return msg.next_frame().buf.decode("utf-8")
+        return str(msg.next_frame().buf, "utf-8")
 
 
 class ListCNFixedSizeCodec:
@@ -143,11 +143,13 @@ class Frame:
 
 
 class InboundMessage:
-    __slots__ = ("start_frame", "end_frame", "_next_frame")
+    __slots__ = ("start_frame", "end_frame", "size", "_next_frame")
 
     def __init__(self, start_frame):
         self.start_frame = start_frame
         self.end_frame = start_frame
+        # Total size of the frame contents, without the frame headers
+        self.size = len(start_frame.buf)
         self._next_frame = start_frame
 
     def next_frame(self):
@@ -167,6 +169,7 @@ class InboundMessage:
         # For inbound messages, we always had the start_frame and end_frame set
         self.end_frame.next = frame
         self.end_frame = frame
+        self.size += len(frame.buf)
 
     def get_message_type(self):
         return LE_INT.unpack_from(self.start_frame.buf, _MESSAGE_TYPE_OFFSET)[0]
@@ -177,6 +180,9 @@ class InboundMessage:
     def get_fragmentation_id(self):
         return LE_LONG.unpack_from(self.start_frame.buf, _FRAGMENTATION_ID_OFFSET)[0]
 
+    def get_partition_id(self):
+        return LE_INT.unpack_from(self.start_frame.buf, _PARTITION_ID_OFFSET)[0]
+
     def get_number_of_backup_acks(self):
         return LE_UINT8.unpack_from(self.start_frame.buf, _RESPONSE_BACKUP_ACKS_OFFSET)[0]
 
@@ -184,8 +190,10 @@ class InboundMessage:
         # should be called after calling drop_fragmentation_frame() on fragment
         self.end_frame.next = fragment.start_frame
         self.end_frame = fragment.end_frame
+        self.size += fragment.size
 
     def drop_fragmentation_frame(self):
+        self.size -= len(self.start_frame.buf)
         self.start_frame = self.start_frame.next
         self._next_frame = self.start_frame
 
@@ -0,0 +1,31 @@
+from hazelcast.serialization.bits import *
+from hazelcast.protocol.builtin import FixSizedTypesCodec
+from hazelcast.protocol.client_message import OutboundMessage, REQUEST_HEADER_SIZE, create_initial_buffer
+from hazelcast.protocol.builtin import StringCodec
+from hazelcast.protocol.builtin import ListMultiFrameCodec
+from hazelcast.protocol.builtin import EntryListCodec
+from hazelcast.protocol.builtin import EntryListIntegerLongCodec
+from hazelcast.protocol.builtin import EntryListIntegerUUIDCodec
+
+# hex: 0x013D00
+_REQUEST_MESSAGE_TYPE = 81152
+# hex: 0x013D01
+_RESPONSE_MESSAGE_TYPE = 81153
+
+_REQUEST_UUID_OFFSET = REQUEST_HEADER_SIZE
+_REQUEST_INITIAL_FRAME_SIZE = _REQUEST_UUID_OFFSET + UUID_SIZE_IN_BYTES
+
+
+def encode_request(names, uuid):
+    buf = create_initial_buffer(_REQUEST_INITIAL_FRAME_SIZE, _REQUEST_MESSAGE_TYPE)
+    FixSizedTypesCodec.encode_uuid(buf, _REQUEST_UUID_OFFSET, uuid)
+    ListMultiFrameCodec.encode(buf, names, StringCodec.encode, True)
+    return OutboundMessage(buf, False)
+
+
+def decode_response(msg):
+    msg.next_frame()
+    response = dict()
+    response["name_partition_sequence_list"] = EntryListCodec.decode(msg, StringCodec.decode, EntryListIntegerLongCodec.decode)
+    response["partition_uuid_list"] = EntryListIntegerUUIDCodec.decode(msg)
+    return response
@@ -0,0 +1,33 @@
+from hazelcast.serialization.bits import *
+from hazelcast.protocol.builtin import FixSizedTypesCodec
+from hazelcast.protocol.client_message import OutboundMessage, REQUEST_HEADER_SIZE, create_initial_buffer
+from hazelcast.protocol.builtin import StringCodec
+from hazelcast.protocol.builtin import EntryListIntegerIntegerCodec
+from hazelcast.protocol.builtin import DataCodec
+from hazelcast.protocol.builtin import ListMultiFrameCodec
+
+# hex: 0x014000
+_REQUEST_MESSAGE_TYPE = 81920
+# hex: 0x014001
+_RESPONSE_MESSAGE_TYPE = 81921
+
+_REQUEST_BATCH_OFFSET = REQUEST_HEADER_SIZE
+_REQUEST_INITIAL_FRAME_SIZE = _REQUEST_BATCH_OFFSET + INT_SIZE_IN_BYTES
+
+
+def encode_request(name, iteration_pointers, batch, projection, predicate):
+    buf = create_initial_buffer(_REQUEST_INITIAL_FRAME_SIZE, _REQUEST_MESSAGE_TYPE)
+    FixSizedTypesCodec.encode_int(buf, _REQUEST_BATCH_OFFSET, batch)
+    StringCodec.encode(buf, name)
+    EntryListIntegerIntegerCodec.encode(buf, iteration_pointers)
+    DataCodec.encode(buf, projection)
+    DataCodec.encode(buf, predicate, True)
+    return OutboundMessage(buf, True, True)
+
+
+def decode_response(msg):
+    msg.next_frame()
+    response = dict()
+    response["results"] = ListMultiFrameCodec.decode_contains_nullable(msg, DataCodec.decode)
+    response["iteration_pointers"] = EntryListIntegerIntegerCodec.decode(msg)
+    return response
@@ -132,6 +132,7 @@ class MultiMap(Proxy["BlockingMultiMap"], typing.Generic[KeyType, ValueType]):
             lambda r: response_decoder(r),
             lambda reg_id: multi_map_remove_entry_listener_codec.encode_request(self.name, reg_id),
             lambda m: event_message_handler(m, handle_event_entry),
+            striped=True,
         )
 
     def contains_key(self, key: KeyType) -> Future[bool]:
@@ -194,6 +194,7 @@ class ReplicatedMap(Proxy["BlockingReplicatedMap"], typing.Generic[KeyType, Valu
                 self.name, reg_id
             ),
             lambda m: event_message_handler(m, handle_event_entry),
+            striped=True,
         )
 
     def clear(self) -> Future[None]:
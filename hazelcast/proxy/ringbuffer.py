@@ -22,6 +22,7 @@ from hazelcast.util import (
     check_not_empty,
     check_true,
     deserialize_list_in_place,
+    LazyList,
 )
 
 OVERFLOW_POLICY_OVERWRITE = 0
@@ -182,6 +183,9 @@ class Ringbuffer(PartitionSpecificProxy["BlockingRingbuffer"], typing.Generic[It
     def __init__(self, service_name, name, context):
         super(Ringbuffer, self).__init__(service_name, name, context)
         self._capacity = None
+        self._deserialize_list = deserialize_list_in_place
+        if context.config.lazy_deserialization:
+            self._deserialize_list = LazyList
 
     def capacity(self) -> Future[int]:
         """Returns the capacity of this Ringbuffer.
@@ -395,7 +399,7 @@ class Ringbuffer(PartitionSpecificProxy["BlockingRingbuffer"], typing.Generic[It
 
         def handler(message):
             response = ringbuffer_read_many_codec.decode_response(message)
-            items = deserialize_list_in_place(response["items"], self._to_object)
+            items = self._deserialize_list(response["items"], self._to_object)
             read_count = response["read_count"]
             next_seq = response["next_seq"]
             item_seqs = response["item_seqs"]
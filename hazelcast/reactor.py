@@ -7,18 +7,20 @@ import io
 import logging
 import os
 import select
+import selectors
 import socket
 import ssl
 import sys
 import threading
 import time
 
+from bisect import bisect_left
 from collections import deque
-from functools import total_ordering
-from heapq import heappush, heappop
+from functools import partial, total_ordering
+from heapq import heapify, heappush, heappop
 from threading import get_ident
 
-from hazelcast.config import SSLProtocol, Config
+from hazelcast.config import SSLProtocol, Config, ReactorLoop
 from hazelcast.connection import Connection
 from hazelcast.core import Address
 from hazelcast.errors import HazelcastError
@@ -58,6 +60,28 @@ _RETRYABLE_ERROR_CODES = (
     ssl.SSL_ERROR_WANT_READ,
 )
 
+# Errors that signal the connection is closed by the
+# remote side, same as the ones asyncore checks for.
+_DISCONNECTED_ERROR_CODES = (
+    errno.ECONNRESET,
+    errno.ENOTCONN,
+    errno.ESHUTDOWN,
+    errno.ECONNABORTED,
+    errno.EPIPE,
+    errno.EBADF,
+)
+
+_READ_WRITE_EVENTS = selectors.EVENT_READ | selectors.EVENT_WRITE
+
+# Canceled timers are only removed from the heap when they reach
+# its root. The heap is scanned for them once it grows past this
+# size, and twice the size it had after the previous scan.
+_TIMERS_COMPACTION_MIN_SIZE = 256
+
+# Upper bounds of the buckets of the latency histograms, in seconds.
+# The durations above the last bound are counted in an extra bucket.
+_LATENCY_BUCKET_BOUNDS = (0.0001, 0.001, 0.01, 0.1, 1.0)
+
 
 def _set_nonblocking(fd):
     if not _FCNTL_EXISTS:
@@ -67,6 +91,122 @@ def _set_nonblocking(fd):
     fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
 
 
+def _poll(map, timeout):
+    """Counterpart of the asyncore.poll2, which returns the time spent
+    waiting for the events, in seconds."""
+    pollster = select.poll()
+    for fd, obj in list(map.items()):
+        flags = 0
+        if obj.readable():
+            flags |= select.POLLIN | select.POLLPRI
+        if obj.writable() and not obj.accepting:
+            flags |= select.POLLOUT
+        if flags:
+            pollster.register(fd, flags | select.POLLERR | select.POLLHUP | select.POLLNVAL)
+
+    start = time.perf_counter()
+    events = pollster.poll(int(timeout * 1000))
+    waited = time.perf_counter() - start
+    for fd, flags in events:
+        obj = map.get(fd)
+        if obj is not None:
+            asyncore.readwrite(obj, flags)
+    return waited
+
+
+def _qualified_name(fn):
+    while isinstance(fn, partial):
+        fn = fn.func
+
+    name = getattr(fn, "__qualname__", None)
+    if name is None:
+        return repr(fn)
+
+    module = getattr(fn, "__module__", None)
+    return "%s.%s" % (module, name) if module else name
+
+
+class _LatencyHistogram:
+    """Counts of the durations that fall into the buckets bounded by
+    the _LATENCY_BUCKET_BOUNDS, and the longest one seen.
+
+    Only updated from the reactor threads without a lock, so the
+    counts may be approximate when there are multiple loops.
+    """
+
+    __slots__ = ("buckets", "max_duration")
+
+    def __init__(self):
+        self.buckets = [0] * (len(_LATENCY_BUCKET_BOUNDS) + 1)
+        self.max_duration = 0.0
+
+    def record(self, duration):
+        self.buckets[bisect_left(_LATENCY_BUCKET_BOUNDS, duration)] += 1
+        if duration > self.max_duration:
+            self.max_duration = duration
+
+    @property
+    def count(self):
+        return sum(self.buckets)
+
+
+class ReactorProfiler:
+    """Measures the time spent on the reactor threads.
+
+    Records the durations of the loop iterations, excluding the time
+    spent waiting for the events, and of the Future callbacks and the
+    event handlers run on the reactor threads. The calls that take
+    longer than the threshold are logged with the qualified names of
+    the callables.
+
+    It is only created when the ``reactor_slow_call_threshold`` is set,
+    and the callers check for its presence, so nothing is measured
+    otherwise.
+    """
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.loop_iterations = _LatencyHistogram()
+        self.callbacks = _LatencyHistogram()
+        self.event_handlers = _LatencyHistogram()
+        self.slow_calls = 0
+
+    def run_callback(self, invoke, callback):
+        """Runs the ``invoke(callback)`` and records its duration as the
+        duration of the callback."""
+        start = time.perf_counter()
+        try:
+            invoke(callback)
+        finally:
+            self._record(self.callbacks, "callback", callback, time.perf_counter() - start)
+
+    def run_event_handler(self, handler, message):
+        start = time.perf_counter()
+        try:
+            handler(message)
+        finally:
+            self._record(self.event_handlers, "event handler", handler, time.perf_counter() - start)
+
+    def record_loop_iteration(self, duration, loop_name):
+        self.loop_iterations.record(duration)
+        if duration > self.threshold:
+            self.slow_calls += 1
+            _logger.warning(
+                "Slow iteration of the %s loop took %.3f ms", loop_name, duration * 1000
+            )
+
+    def _record(self, histogram, kind, fn, duration):
+        histogram.record(duration)
+        if duration > self.threshold:
+            self.slow_calls += 1
+            _logger.warning(
+                "Slow %s %s took %.3f ms on the reactor thread",
+                kind,
+                _qualified_name(fn),
+                duration * 1000,
+            )
+
+
 class _SocketAdapter:
     def __init__(self, fd):
         self._fd = fd
@@ -92,6 +232,11 @@ class _AbstractWaker(asyncore.dispatcher):
         return False
 
     def wake(self):
+        """Wakes the loop up, if it is not already awake.
+
+        Returns:
+            bool: ``True`` if the wake up signal is sent, ``False`` otherwise.
+        """
         raise NotImplementedError("wake")
 
 
@@ -104,12 +249,15 @@ class _PipedWaker(_AbstractWaker):
         _set_nonblocking(self._write_fd)
 
     def wake(self):
-        if not self.awake:
-            self.awake = True
-            try:
-                os.write(self._write_fd, b"x")
-            except (IOError, ValueError):
-                pass
+        if self.awake:
+            return False
+
+        self.awake = True
+        try:
+            os.write(self._write_fd, b"x")
+        except (IOError, ValueError):
+            pass
+        return True
 
     def handle_read(self):
         self.awake = False
@@ -146,12 +294,15 @@ class _SocketedWaker(_AbstractWaker):
         self._reader.settimeout(0)
 
     def wake(self):
-        if not self.awake:
-            self.awake = True
-            try:
-                self._writer.send(b"x")
-            except (IOError, socket.error, ValueError):
-                pass
+        if self.awake:
+            return False
+
+        self.awake = True
+        try:
+            self._writer.send(b"x")
+        except (IOError, socket.error, ValueError):
+            pass
+        return True
 
     def handle_read(self):
         self.awake = False
@@ -171,13 +322,20 @@ class _AbstractLoop:
         self._map = map
         self._timers = []  # Accessed only from the reactor thread
         self._new_timers = deque()  # Popped only from the reactor thread
+        self._timers_compaction_size = _TIMERS_COMPACTION_MIN_SIZE
         self._is_live = False
         self._thread = None
         self._ident = -1
+        self.name = "hazelcast-reactor"
+        # Incremented from the user threads without a lock,
+        # so the values are approximate.
+        self.wakes_issued = 0
+        self.wakes_suppressed = 0
+        self.profiler = None
 
     def start(self):
         self._is_live = True
-        self._thread = threading.Thread(target=self._loop, name="hazelcast-reactor")
+        self._thread = threading.Thread(target=self._loop, name=self.name)
         self._thread.daemon = True
         self._thread.start()
         self._ident = self._thread.ident
@@ -185,10 +343,20 @@ class _AbstractLoop:
     def _loop(self):
         _logger.debug("Starting Reactor Thread")
         Future._threading_locals.is_reactor_thread = True
+        profiler = self.profiler
+        if profiler is not None:
+            Future._threading_locals.profiler = profiler
+
         while self._is_live:
             try:
-                self.run_loop()
-                self._check_timers()
+                if profiler is None:
+                    self.run_loop()
+                    self._check_timers()
+                else:
+                    start = time.perf_counter()
+                    waited = self.run_profiled_loop()
+                    self._check_timers()
+                    profiler.record_loop_iteration(time.perf_counter() - start - waited, self.name)
             except select.error:
                 # TODO: parse error type to catch only error "9"
                 _logger.warning("Connection closed by server")
@@ -217,6 +385,10 @@ class _AbstractLoop:
                 # above, there should be at least one element
                 heappush(timers, new_timers.popleft())
 
+            if len(timers) >= self._timers_compaction_size:
+                self._compact_timers()
+                timers = self._timers
+
         if timers:
             now = time.time()
             while timers:
@@ -229,6 +401,30 @@ class _AbstractLoop:
                     # timers in the heap.
                     return
 
+    def _compact_timers(self):
+        timers = self._timers
+        live_timers = [entry for entry in timers if not entry[1].canceled]
+        if len(live_timers) <= len(timers) // 2:
+            # Rebuilding the heap is linear, and it is done
+            # only when at least half of it consists of
+            # canceled timers.
+            heapify(live_timers)
+            self._timers = timers = live_timers
+
+        self._timers_compaction_size = max(_TIMERS_COMPACTION_MIN_SIZE, 2 * len(timers))
+
+    def timer_counts(self):
+        """Returns the number of live and canceled timers that are
+        waiting to expire.
+
+        Returns:
+            tuple[int, int]: Live and canceled timer counts.
+        """
+        timers = list(self._timers)
+        timers.extend(self._new_timers)
+        canceled = sum(1 for _, timer in timers if timer.canceled)
+        return len(timers) - canceled, canceled
+
     def _cleanup_all_timers(self):
         timers = self._timers
         new_timers = self._new_timers
@@ -244,12 +440,22 @@ class _AbstractLoop:
             _, timer = new_timers.popleft()
             timer.timer_ended_cb()
 
+    def schedule_write(self, dispatcher):
+        """Makes sure that the loop writes the queued data of the
+        dispatcher."""
+        self.wake_loop()
+
     def check_loop(self):
         raise NotImplementedError("check_loop")
 
     def run_loop(self):
         raise NotImplementedError("run_loop")
 
+    def run_profiled_loop(self):
+        """Same as the run_loop, but returns the time spent waiting for
+        the events, in seconds."""
+        raise NotImplementedError("run_profiled_loop")
+
     def wake_loop(self):
         raise NotImplementedError("wake_loop")
 
@@ -263,20 +469,49 @@ class _WakeableLoop(_AbstractLoop):
     def __init__(self, map):
         _AbstractLoop.__init__(self, map)
         self.waker = self._waker_class(map)
+        # Set while the loop might be blocked on polling
+        self._polling = False
 
     def check_loop(self):
         assert not self.waker.awake
-        self.wake_loop()
+        self.waker.wake()
         assert self.waker.awake
         self.run_loop()
         assert not self.waker.awake
 
     def run_loop(self):
-        asyncore.loop(timeout=0.01, use_poll=True, map=self._map, count=1)
+        # The flag must be set before the dispatchers are asked
+        # whether they are writable. That way, a write that does
+        # not wake the loop up is always seen by the next poll.
+        self._polling = True
+        try:
+            asyncore.loop(timeout=0.01, use_poll=True, map=self._map, count=1)
+        finally:
+            self._polling = False
+
+    def run_profiled_loop(self):
+        if not hasattr(select, "poll"):
+            # asyncore falls back to the select, whose wait time
+            # is counted as a part of the iteration.
+            self.run_loop()
+            return 0.0
+
+        self._polling = True
+        try:
+            return _poll(self._map, 0.01)
+        finally:
+            self._polling = False
 
     def wake_loop(self):
-        if self._ident != get_ident():
-            self.waker.wake()
+        if self._ident == get_ident():
+            return
+
+        # If the loop is not polling, it will pick the
+        # new writes up on its next iteration anyway.
+        if self._polling and self.waker.wake():
+            self.wakes_issued += 1
+        else:
+            self.wakes_suppressed += 1
 
     def shutdown(self):
         if not self._is_live:
@@ -303,6 +538,156 @@ class _WakeableLoop(_AbstractLoop):
         self._map.clear()
 
 
+class _SelectorMap(dict):
+    """Dispatchers map that keeps a selector in sync with its items.
+
+    asyncore adds and removes the dispatchers from the map as their
+    sockets are set and closed, so the registrations follow them
+    without scanning the map.
+    """
+
+    def __init__(self):
+        super(_SelectorMap, self).__init__()
+        self.selector = selectors.DefaultSelector()
+
+    def __setitem__(self, fd, dispatcher):
+        super(_SelectorMap, self).__setitem__(fd, dispatcher)
+        events = selectors.EVENT_READ
+        if dispatcher.writable():
+            events |= selectors.EVENT_WRITE
+        self.selector.register(fd, events, dispatcher)
+
+    def __delitem__(self, fd):
+        super(_SelectorMap, self).__delitem__(fd)
+        try:
+            self.selector.unregister(fd)
+        except (KeyError, ValueError):
+            pass
+
+    def clear(self):
+        for fd in list(self.keys()):
+            del self[fd]
+
+    def set_events(self, fd, events):
+        try:
+            key = self.selector.get_key(fd)
+        except (KeyError, ValueError):
+            # Already closed
+            return
+
+        if key.events != events:
+            self.selector.modify(fd, events, key.data)
+
+    def has_write_interest(self, fd):
+        try:
+            return self.selector.get_key(fd).events & selectors.EVENT_WRITE
+        except (KeyError, ValueError):
+            return True
+
+
+class _SelectorLoop(_WakeableLoop):
+    """Loop that waits on a selector (e.g. epoll) instead of polling
+    every dispatcher on each iteration.
+
+    Every dispatcher is registered for reads. The interest for writes
+    is only changed when the write queue of a dispatcher transitions
+    between empty and non-empty, and always from the reactor thread.
+    """
+
+    def __init__(self, map):
+        _WakeableLoop.__init__(self, map)
+        # Dispatchers that have queued data while not being registered
+        # for writes. Appended from the user threads.
+        self._pending_writers = deque()
+
+    def run_loop(self):
+        self._polling = True
+        try:
+            self._register_pending_writers()
+            events = self._map.selector.select(0.01)
+        finally:
+            self._polling = False
+
+        self._handle_events(events)
+
+    def run_profiled_loop(self):
+        self._polling = True
+        try:
+            self._register_pending_writers()
+            start = time.perf_counter()
+            events = self._map.selector.select(0.01)
+            waited = time.perf_counter() - start
+        finally:
+            self._polling = False
+
+        self._handle_events(events)
+        return waited
+
+    def schedule_write(self, dispatcher):
+        fd = dispatcher._fileno
+        if fd is None or self._map.has_write_interest(fd):
+            return
+
+        if self._ident == get_ident():
+            self._map.set_events(fd, _READ_WRITE_EVENTS)
+        else:
+            self._pending_writers.append(dispatcher)
+            self.wake_loop()
+
+    def shutdown(self):
+        if not self._is_live:
+            return
+
+        _WakeableLoop.shutdown(self)
+        self._map.selector.close()
+
+    def _handle_events(self, events):
+        for key, mask in events:
+            dispatcher = key.data
+            self._readwrite(dispatcher, mask)
+            if mask & selectors.EVENT_WRITE:
+                self._unregister_drained_writer(dispatcher)
+
+    def _register_pending_writers(self):
+        pending_writers = self._pending_writers
+        while pending_writers:
+            dispatcher = pending_writers.popleft()
+            fd = dispatcher._fileno
+            if fd is not None and dispatcher.writable():
+                self._map.set_events(fd, _READ_WRITE_EVENTS)
+
+    def _unregister_drained_writer(self, dispatcher):
+        fd = dispatcher._fileno
+        if fd is None or dispatcher.writable():
+            return
+
+        self._map.set_events(fd, selectors.EVENT_READ)
+        # A user thread might have queued some data after the check
+        # above, but before the interest is changed. It would not
+        # schedule the write since the dispatcher was registered for
+        # writes at that time, so we should check it once more.
+        if dispatcher.writable():
+            self._map.set_events(fd, _READ_WRITE_EVENTS)
+
+    @staticmethod
+    def _readwrite(dispatcher, mask):
+        # Counterpart of the asyncore.readwrite
+        try:
+            if mask & selectors.EVENT_READ:
+                dispatcher.handle_read_event()
+            if mask & selectors.EVENT_WRITE and dispatcher._fileno is not None:
+                dispatcher.handle_write_event()
+        except socket.error as e:
+            if e.args[0] not in _DISCONNECTED_ERROR_CODES:
+                dispatcher.handle_error()
+            else:
+                dispatcher.handle_close()
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except:
+            dispatcher.handle_error()
+
+
 class _BasicLoop(_AbstractLoop):
     def check_loop(self):
         pass
@@ -310,6 +695,14 @@ class _BasicLoop(_AbstractLoop):
     def run_loop(self):
         asyncore.loop(timeout=0.001, use_poll=True, map=self._map, count=1)
 
+    def run_profiled_loop(self):
+        if not hasattr(select, "poll"):
+            # See _WakeableLoop.run_profiled_loop
+            self.run_loop()
+            return 0.0
+
+        return _poll(self._map, 0.001)
+
     def wake_loop(self):
         pass
 
@@ -334,29 +727,56 @@ class _BasicLoop(_AbstractLoop):
         self._map.clear()
 
 
-class AsyncoreReactor:
-    def __init__(self):
-        self.map = {}
-        loop = None
-        try:
-            loop = _WakeableLoop(self.map)
-            loop.check_loop()
-        except:
-            _logger.exception(
-                "Failed to initialize the wakeable loop. "
-                "Using the basic loop instead. "
-                "When used in the blocking mode, client"
-                "may have sub-optimal performance."
-            )
-            if loop:
-                loop.shutdown()
-            loop = _BasicLoop(self.map)
+class _ReactorShard:
+    """Subset of the connections whose I/O events are handled by
+    one of the loops of the reactor.
+
+    The connections only interact with their shard, so the counters
+    are only updated from the thread of its loop.
+    """
+
+    def __init__(self, reactor, loop):
+        self._reactor = reactor
         self._loop = loop
+        self.map = loop._map
         self.bytes_sent = 0
         self.bytes_received = 0
 
+    def add_timer(self, delay, callback):
+        return self._reactor.add_timer(delay, callback)
+
+    def schedule_write(self, connection):
+        self._loop.schedule_write(connection)
+
+
+class AsyncoreReactor:
+    def __init__(self, config=None):
+        self._loop = self._create_loop(config)
+        self.map = self._loop._map
+        self.profiler = None
+        if config is not None and config.reactor_slow_call_threshold != -1:
+            self.profiler = ReactorProfiler(config.reactor_slow_call_threshold)
+            self._loop.profiler = self.profiler
+
+        self._io_loops = []
+        reactor_count = config.reactor_count if config is not None else 1
+        if reactor_count > 1:
+            # Connections are distributed across the I/O loops,
+            # the main loop is left for the timers only.
+            for i in range(reactor_count):
+                loop = self._create_loop(config)
+                loop.name = "hazelcast-reactor-io-%d" % i
+                loop.profiler = self.profiler
+                self._io_loops.append(loop)
+
+            self._shards = [_ReactorShard(self, loop) for loop in self._io_loops]
+        else:
+            self._shards = [_ReactorShard(self, self._loop)]
+
     def start(self):
         self._loop.start()
+        for loop in self._io_loops:
+            loop.start()
 
     def add_timer(self, delay, callback):
         return self._loop.add_timer(delay, callback)
@@ -364,25 +784,130 @@ class AsyncoreReactor:
     def wake_loop(self):
         self._loop.wake_loop()
 
+    @property
+    def bytes_sent(self):
+        """Number of bytes sent over all the connections."""
+        return sum(shard.bytes_sent for shard in self._shards)
+
+    @property
+    def bytes_received(self):
+        """Number of bytes received over all the connections."""
+        return sum(shard.bytes_received for shard in self._shards)
+
+    @property
+    def wakes_issued(self):
+        """Number of times the loops are woken up to handle writes."""
+        return self._loop.wakes_issued + sum(loop.wakes_issued for loop in self._io_loops)
+
+    @property
+    def wakes_suppressed(self):
+        """Number of wake up requests that are not needed, as the loop
+        is already awake or busy."""
+        return self._loop.wakes_suppressed + sum(loop.wakes_suppressed for loop in self._io_loops)
+
+    def timer_counts(self):
+        """Returns the number of live and canceled timers that are
+        waiting to expire.
+
+        Returns:
+            tuple[int, int]: Live and canceled timer counts.
+        """
+        # Timers are only run on the main loop
+        return self._loop.timer_counts()
+
     def shutdown(self):
+        # Connections are closed before the timers are cleaned up,
+        # as it is done when there is a single loop.
+        for loop in self._io_loops:
+            loop.shutdown()
         self._loop.shutdown()
 
     def connection_factory(
-        self, connection_manager, connection_id, address, network_config, message_callback
+        self,
+        connection_manager,
+        connection_id,
+        address,
+        network_config,
+        message_callback,
+        member_uuid=None,
     ):
+        shard = self._get_shard(member_uuid if member_uuid is not None else address)
         return AsyncoreConnection(
-            self, connection_manager, connection_id, address, network_config, message_callback
+            shard, connection_manager, connection_id, address, network_config, message_callback
         )
 
+    def _get_shard(self, key):
+        shards = self._shards
+        if len(shards) == 1:
+            return shards[0]
+
+        # Connections to the same member always end up in the same
+        # shard, so that the reconnections do not move them around.
+        return shards[hash(key) % len(shards)]
+
+    def _create_loop(self, config):
+        loop = None
+        if config is not None and config.reactor_loop == ReactorLoop.SELECTOR:
+            loop = self._create_selector_loop()
+
+        if not loop:
+            loop = self._create_poll_loop()
+
+        return loop
+
+    @staticmethod
+    def _create_selector_loop():
+        map = _SelectorMap()
+        loop = None
+        try:
+            loop = _SelectorLoop(map)
+            loop.check_loop()
+            return loop
+        except:
+            _logger.exception(
+                "Failed to initialize the selector loop. Using the poll based loop instead."
+            )
+            if loop:
+                loop.waker.close()
+            map.selector.close()
+            return None
+
+    @staticmethod
+    def _create_poll_loop():
+        map = {}
+        loop = None
+        try:
+            loop = _WakeableLoop(map)
+            loop.check_loop()
+        except:
+            _logger.exception(
+                "Failed to initialize the wakeable loop. "
+                "Using the basic loop instead. "
+                "When used in the blocking mode, client"
+                "may have sub-optimal performance."
+            )
+            if loop:
+                loop.shutdown()
+            loop = _BasicLoop(map)
+        return loop
+
 
 _BUFFER_SIZE = 128000
 
+# Available in UNIX.
+_SENDMSG_EXISTS = hasattr(socket.socket, "sendmsg")
+
+# Maximum number of buffers passed to a single sendmsg call.
+# It is 1024 on Linux and macOS, exceeding it fails the call.
+_IOV_MAX = 1024
+
 
 class AsyncoreConnection(Connection, asyncore.dispatcher):
     sent_protocol_bytes = False
     receive_buffer_size = _BUFFER_SIZE
     send_buffer_size = _BUFFER_SIZE
     _close_timer = None
+    _high_watermark = -1
 
     def __init__(
         self, reactor, connection_manager, connection_id, address, config, message_callback
@@ -395,6 +920,8 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
         self._write_queue = deque()
         self._write_buf = io.BytesIO()
 
+        self.receive_buffer_size = config.receive_buffer_size
+
         self.create_socket(socket.AF_INET, socket.SOCK_STREAM)
         # set the socket timeout to 0 explicitly
         self.socket.settimeout(0)
@@ -403,6 +930,24 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
         if config.ssl_enabled:
             self._wrap_as_ssl_socket(config, address.host)
 
+        # SSL sockets do not support scatter/gather writes
+        self._vectored_write = _SENDMSG_EXISTS and not config.ssl_enabled
+
+        high_watermark = config.write_queue_high_watermark
+        self._high_watermark = high_watermark
+        if high_watermark != -1:
+            low_watermark = config.write_queue_low_watermark
+            if low_watermark == -1:
+                low_watermark = high_watermark // 2
+            self._low_watermark = min(low_watermark, high_watermark)
+            # Number of queued bytes that are not yet sent. Updated from
+            # the user threads and the reactor thread, under the lock of
+            # the condition.
+            self._write_queue_size = 0
+            self._write_queue_condition = threading.Condition(threading.Lock())
+            self._write = self._write_bounded
+            self._write_many = self._write_many_bounded
+
         try:
             self.connect((address.host, address.port))
         except socket.error as e:
@@ -417,7 +962,7 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
             self._close_timer = reactor.add_timer(timeout, self._close_timer_cb)
 
         self.local_address = Address(*self.socket.getsockname())
-        self._write_queue.append(b"CP2")
+        self._write(b"CP2")
 
     def handle_connect(self):
         if self._close_timer:
@@ -431,12 +976,14 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
         receive_buffer_size = self.receive_buffer_size
         try:
             while True:
-                data = self.recv(receive_buffer_size)
-                bytes_received = len(data)
+                # Receive directly into the reader's buffer, so that
+                # no intermediate bytes object is created per read.
+                buf = reader.get_buffer(receive_buffer_size)
+                bytes_received = self._recv_into(buf)
                 self._reactor.bytes_received += bytes_received
-                reader.read(data)
+                reader.buffer_updated(bytes_received)
                 self.last_read_time = time.time()
-                if bytes_received < receive_buffer_size:
+                if bytes_received < len(buf):
                     break
         except socket.error as err:
             if err.args[0] not in _RETRYABLE_ERROR_CODES:
@@ -447,6 +994,12 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
             reader.process()
 
     def handle_write(self):
+        if self._vectored_write:
+            self._write_vectored()
+        else:
+            self._write_coalesced()
+
+    def _write_coalesced(self):
         write_queue = self._write_queue
         send_buffer_size = self.send_buffer_size
         write_batch = []
@@ -488,9 +1041,84 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
             self.last_write_time = time.time()
             self.sent_protocol_bytes = True
             self._reactor.bytes_sent += bytes_sent
+            if self._high_watermark != -1:
+                self._release_write_queue(bytes_sent)
             if bytes_sent < len(bytes_):
                 write_queue.appendleft(bytes_[bytes_sent:])
 
+    def _recv_into(self, buf):
+        # Counterpart of the asyncore.dispatcher.recv
+        try:
+            bytes_received = self.socket.recv_into(buf)
+            if not bytes_received:
+                # a closed connection is indicated by signaling
+                # a read condition, and having recv_into() return 0.
+                self.handle_close()
+            return bytes_received
+        except socket.error as err:
+            if err.args[0] in _DISCONNECTED_ERROR_CODES:
+                self.handle_close()
+                return 0
+            raise
+
+    def _write_vectored(self):
+        # Sends the queued buffers as they are with a single
+        # sendmsg call, without concatenating them.
+        write_queue = self._write_queue
+        send_buffer_size = self.send_buffer_size
+        write_batch = []
+        total_length = 0
+
+        while write_queue and len(write_batch) < _IOV_MAX:
+            message_bytes = write_queue.popleft()
+            write_batch.append(message_bytes)
+            total_length += len(message_bytes)
+
+            if total_length >= send_buffer_size:
+                break
+
+        try:
+            bytes_sent = self._sendmsg(write_batch)
+        except socket.error as err:
+            if err.args[0] in _RETRYABLE_ERROR_CODES:
+                # Couldn't write the bytes but we should
+                # retry it.
+                write_queue.extendleft(reversed(write_batch))
+            else:
+                # Other error codes are fatal, should close the connection
+                self.close_connection(None, err)
+        else:
+            # No exception is thrown during the send
+            self.last_write_time = time.time()
+            self.sent_protocol_bytes = True
+            self._reactor.bytes_sent += bytes_sent
+            if self._high_watermark != -1:
+                self._release_write_queue(bytes_sent)
+            if bytes_sent < total_length:
+                # Put back the unsent buffers, starting with the
+                # unsent part of the partially sent one, if any.
+                for i, message_bytes in enumerate(write_batch):
+                    length = len(message_bytes)
+                    if bytes_sent < length:
+                        unsent = write_batch[i + 1 :]
+                        unsent.insert(0, memoryview(message_bytes)[bytes_sent:])
+                        write_queue.extendleft(reversed(unsent))
+                        break
+
+                    bytes_sent -= length
+
+    def _sendmsg(self, buffers):
+        # Counterpart of the asyncore.dispatcher.send
+        try:
+            return self.socket.sendmsg(buffers)
+        except socket.error as err:
+            if err.args[0] == errno.EWOULDBLOCK:
+                return 0
+            elif err.args[0] in _DISCONNECTED_ERROR_CODES:
+                self.handle_close()
+                return 0
+            raise
+
     def handle_close(self):
         _logger.warning("Connection closed by server")
         self.close_connection(None, IOError("Connection closed by server"))
@@ -507,7 +1135,54 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
 
     def _write(self, buf):
         self._write_queue.append(buf)
-        self._reactor.wake_loop()
+        self._reactor.schedule_write(self)
+
+    def _write_bounded(self, buf):
+        with self._write_queue_condition:
+            self._write_queue_size += len(buf)
+            if self._write_queue_size >= self._high_watermark:
+                self.overloaded = True
+
+        self._write_queue.append(buf)
+        self._reactor.schedule_write(self)
+
+    def _write_many(self, bufs):
+        # The buffers are queued at once, and the reactor
+        # is notified once, so that they are sent together.
+        self._write_queue.extend(bufs)
+        self._reactor.schedule_write(self)
+
+    def _write_many_bounded(self, bufs):
+        with self._write_queue_condition:
+            self._write_queue_size += sum(len(buf) for buf in bufs)
+            if self._write_queue_size >= self._high_watermark:
+                self.overloaded = True
+
+        self._write_queue.extend(bufs)
+        self._reactor.schedule_write(self)
+
+    def _release_write_queue(self, bytes_sent):
+        condition = self._write_queue_condition
+        with condition:
+            self._write_queue_size -= bytes_sent
+            if self.overloaded and self._write_queue_size <= self._low_watermark:
+                self.overloaded = False
+                condition.notify_all()
+
+    @property
+    def write_queue_size(self):
+        if self._high_watermark == -1:
+            return sum(len(buf) for buf in list(self._write_queue))
+
+        return self._write_queue_size
+
+    def wait_until_writable(self, timeout):
+        if self._high_watermark == -1:
+            return True
+
+        condition = self._write_queue_condition
+        with condition:
+            return condition.wait_for(lambda: not (self.overloaded and self.live), timeout)
 
     def writable(self):
         return len(self._write_queue) > 0
@@ -520,6 +1195,12 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
             # no effects.
             self._close_timer.cancel()
 
+        if self._high_watermark != -1:
+            # Wake the callers waiting for the queue to drain up
+            condition = self._write_queue_condition
+            with condition:
+                condition.notify_all()
+
         self.close()
         self._write_buf.close()
 
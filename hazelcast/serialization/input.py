@@ -148,7 +148,7 @@ class _ObjectDataInput(ObjectDataInput):
         if length == NULL_ARRAY_LENGTH:
             return None
         self._check_available(self._pos, length)
-        result = self._buffer[self._pos : self._pos + length].decode("utf-8")
+        result = str(self._buffer[self._pos : self._pos + length], "utf-8")
         self._pos += length
         return result
 
@@ -27,17 +27,34 @@ _NEAR_CACHE_DESCRIPTOR_PREFIX = "nearcache"
 _NEAR_CACHE_DESCRIPTOR_DISCRIMINATOR = "name"
 
 _TCP_METRICS_PREFIX = "tcp"
+_REACTOR_METRICS_PREFIX = "reactor"
+_PARTITION_ID_CACHE_METRICS_PREFIX = "partitionIdCache"
+_EVENT_METRICS_PREFIX = "event"
+
+# Upper bounds of the latency histogram buckets in milliseconds,
+# matching the _LATENCY_BUCKET_BOUNDS of the reactor.
+_LATENCY_BUCKET_LABELS = ("0.1", "1", "10", "100", "1000", "inf")
 
 
 class Statistics:
     def __init__(
-        self, client, config, reactor, connection_manager, invocation_service, near_cache_manager
+        self,
+        client,
+        config,
+        reactor,
+        connection_manager,
+        invocation_service,
+        near_cache_manager,
+        partition_service,
+        listener_service=None,
     ):
         self._client = client
         self._reactor = reactor
         self._connection_manager = connection_manager
         self._invocation_service = invocation_service
         self._near_cache_manager = near_cache_manager
+        self._partition_service = partition_service
+        self._listener_service = listener_service
         self._enabled = config.statistics_enabled
         self._period = config.statistics_period
         self._statistics_timer = None
@@ -161,6 +178,9 @@ class Statistics:
         self._add_near_cache_metrics(attributes, compressor)
         self._add_system_and_process_metrics(attributes, compressor)
         self._add_tcp_metrics(compressor)
+        self._add_reactor_metrics(compressor)
+        self._add_partition_id_cache_metrics(compressor)
+        self._add_event_metrics(compressor)
         self._send_stats(
             collection_timestamp, "".join(attributes), compressor.generate_blob(), connection
         )
@@ -353,18 +373,133 @@ class Statistics:
         self._add_tcp_metric(compressor, "bytesSend", self._reactor.bytes_sent)
         self._add_tcp_metric(compressor, "bytesReceived", self._reactor.bytes_received)
 
+        connections = list(self._connection_manager.active_connections.values())
+        write_queue_size = sum(connection.write_queue_size for connection in connections)
+        overloaded = sum(1 for connection in connections if connection.overloaded)
+        self._add_tcp_metric(compressor, "writeQueueSize", write_queue_size)
+        self._add_tcp_metric(
+            compressor, "overloadedConnectionCount", overloaded, unit=ProbeUnit.COUNT
+        )
+
     def _add_tcp_metric(
         self, compressor, metric, value, value_type=ValueType.LONG, unit=ProbeUnit.BYTES
+    ):
+        self._add_prefixed_metric(compressor, _TCP_METRICS_PREFIX, metric, value, value_type, unit)
+
+    def _add_reactor_metrics(self, compressor):
+        reactor = self._reactor
+        self._add_reactor_metric(compressor, "wakesIssued", reactor.wakes_issued)
+        self._add_reactor_metric(compressor, "wakesSuppressed", reactor.wakes_suppressed)
+        live_timers, canceled_timers = reactor.timer_counts()
+        self._add_reactor_metric(compressor, "liveTimers", live_timers)
+        self._add_reactor_metric(compressor, "canceledTimers", canceled_timers)
+        invocation_service = self._invocation_service
+        self._add_reactor_metric(
+            compressor,
+            "responseHandlerTime",
+            invocation_service.response_handler_time // 1_000_000,
+            unit=ProbeUnit.MS,
+        )
+        self._add_reactor_metric(
+            compressor, "offloadedResponses", invocation_service.offloaded_response_count
+        )
+        profiler = reactor.profiler
+        if profiler is not None:
+            self._add_reactor_metric(compressor, "slowCalls", profiler.slow_calls)
+            self._add_latency_histogram(
+                compressor, "loopIterationLatency", profiler.loop_iterations
+            )
+            self._add_latency_histogram(compressor, "callbackLatency", profiler.callbacks)
+            self._add_latency_histogram(compressor, "eventHandlerLatency", profiler.event_handlers)
+
+    def _add_latency_histogram(self, compressor, metric, histogram):
+        # Each bucket is sent as a separate metric, tagged with its
+        # upper bound in milliseconds.
+        for bound, count in zip(_LATENCY_BUCKET_LABELS, histogram.buckets):
+            self._add_prefixed_metric(
+                compressor,
+                _REACTOR_METRICS_PREFIX,
+                metric,
+                count,
+                ValueType.LONG,
+                ProbeUnit.COUNT,
+                "le",
+                bound,
+            )
+        self._add_reactor_metric(
+            compressor,
+            metric + "Max",
+            histogram.max_duration * 1000,
+            ValueType.DOUBLE,
+            ProbeUnit.MS,
+        )
+
+    def _add_reactor_metric(
+        self, compressor, metric, value, value_type=ValueType.LONG, unit=ProbeUnit.COUNT
+    ):
+        self._add_prefixed_metric(
+            compressor, _REACTOR_METRICS_PREFIX, metric, value, value_type, unit
+        )
+
+    def _add_partition_id_cache_metrics(self, compressor):
+        cache = self._partition_service.key_cache
+        if cache is None:
+            return
+
+        self._add_partition_id_cache_metric(compressor, "hits", cache.hits)
+        self._add_partition_id_cache_metric(compressor, "misses", cache.misses)
+        self._add_partition_id_cache_metric(compressor, "size", cache.size)
+        self._add_partition_id_cache_metric(
+            compressor, "hitRatio", 100 * cache.hit_ratio, ValueType.DOUBLE, ProbeUnit.PERCENT
+        )
+
+    def _add_partition_id_cache_metric(
+        self, compressor, metric, value, value_type=ValueType.LONG, unit=ProbeUnit.COUNT
+    ):
+        self._add_prefixed_metric(
+            compressor, _PARTITION_ID_CACHE_METRICS_PREFIX, metric, value, value_type, unit
+        )
+
+    def _add_event_metrics(self, compressor):
+        if self._listener_service is None:
+            return
+
+        executor = self._listener_service.event_executor
+        if executor is None:
+            return
+
+        self._add_event_metric(compressor, "queueSize", executor.queue_size)
+        self._add_event_metric(compressor, "droppedEvents", executor.dropped_events)
+
+    def _add_event_metric(
+        self, compressor, metric, value, value_type=ValueType.LONG, unit=ProbeUnit.COUNT
+    ):
+        self._add_prefixed_metric(
+            compressor, _EVENT_METRICS_PREFIX, metric, value, value_type, unit
+        )
+
+    def _add_prefixed_metric(
+        self,
+        compressor,
+        prefix,
+        metric,
+        value,
+        value_type,
+        unit,
+        discriminator=None,
+        discriminator_value=None,
     ):
         descriptor = MetricDescriptor(
             metric=metric,
-            prefix=_TCP_METRICS_PREFIX,
+            prefix=prefix,
+            discriminator=discriminator,
+            discriminator_value=discriminator_value,
             unit=unit,
         )
         try:
             self._add_metric(compressor, descriptor, value, value_type)
         except:
-            _logger.exception("Error while collecting '%s.%s'.", _TCP_METRICS_PREFIX, metric)
+            _logger.exception("Error while collecting '%s.%s'.", prefix, metric)
 
     def _add_metric(self, compressor, descriptor, value, value_type):
         if value_type == ValueType.LONG:
@@ -1,5 +1,8 @@
+import logging
 import random
 import threading
+from collections import deque
+from collections.abc import Mapping, Sequence
 import time
 import typing
 import uuid
@@ -9,6 +12,8 @@ from hazelcast.serialization import UUID_MSB_SHIFT, UUID_LSB_MASK, UUID_MSB_MASK
 if typing.TYPE_CHECKING:
     from hazelcast.serialization.data import Data
 
+_logger = logging.getLogger(__name__)
+
 DEFAULT_ADDRESS = "127.0.0.1"
 DEFAULT_PORT = 5701
 
@@ -156,6 +161,271 @@ def deserialize_entry_list_in_place(
     return entry_data_list
 
 
+_NOT_DESERIALIZED = object()
+
+
+class LazyList(Sequence):
+    """Read-only list over the serialized items, which deserializes
+    the items on their first access and caches them afterwards.
+    """
+
+    __slots__ = ("_data_list", "_objects", "_to_object")
+
+    def __init__(
+        self, data_list: typing.List["Data"], to_object_fn: typing.Callable[["Data"], typing.Any]
+    ):
+        self._data_list = data_list
+        self._objects = [_NOT_DESERIALIZED] * len(data_list)
+        self._to_object = to_object_fn
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._objects)))]
+
+        obj = self._objects[index]
+        if obj is _NOT_DESERIALIZED:
+            obj = self._objects[index] = self._deserialize(self._data_list[index])
+        return obj
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __iter__(self):
+        for i in range(len(self._objects)):
+            yield self[i]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def _deserialize(self, data):
+        return self._to_object(data)
+
+
+class LazyEntryList(LazyList):
+    """Read-only list over the serialized entries, which deserializes
+    the entries, as key-value tuples, on their first access and caches
+    them afterwards.
+    """
+
+    __slots__ = ()
+
+    def _deserialize(self, entry):
+        return self._to_object(entry[0]), self._to_object(entry[1])
+
+
+class LazyDict(Mapping):
+    """Read-only dictionary over the serialized entries.
+
+    The keys are deserialized all at once, when they are first needed,
+    as the lookups require them. The values are deserialized on their
+    first access and cached afterwards.
+    """
+
+    __slots__ = ("_entry_data_list", "_values", "_indexes", "_to_object")
+
+    def __init__(
+        self,
+        entry_data_list: typing.List[typing.Tuple["Data", "Data"]],
+        to_object_fn: typing.Callable[["Data"], typing.Any],
+    ):
+        self._entry_data_list = entry_data_list
+        self._values = LazyList([entry[1] for entry in entry_data_list], to_object_fn)
+        self._indexes: typing.Optional[typing.Dict[typing.Any, int]] = None
+        self._to_object = to_object_fn
+
+    def __getitem__(self, key):
+        return self._values[self._get_indexes()[key]]
+
+    def __contains__(self, key):
+        return key in self._get_indexes()
+
+    def __len__(self):
+        return len(self._entry_data_list)
+
+    def __iter__(self):
+        return iter(self._get_indexes())
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def _get_indexes(self):
+        indexes = self._indexes
+        if indexes is None:
+            to_object = self._to_object
+            indexes = {to_object(entry[0]): i for i, entry in enumerate(self._entry_data_list)}
+            self._indexes = indexes
+        return indexes
+
+
+def split_into_chunks(
+    items: typing.List,
+    max_count: int,
+    max_size: int,
+    size_fn: typing.Callable[[typing.Any], int],
+) -> typing.List[typing.List]:
+    """Splits the items into consecutive chunks of at most ``max_count``
+    items, whose total size is at most ``max_size``.
+
+    ``-1`` disables the corresponding limit. An item larger than the
+    ``max_size`` is put into a chunk of its own.
+    """
+    if max_count == -1 and max_size == -1:
+        return [items]
+
+    chunks = []
+    chunk: typing.List = []
+    chunk_size = 0
+    for item in items:
+        item_size = size_fn(item) if max_size != -1 else 0
+        if chunk and (
+            len(chunk) == max_count or (max_size != -1 and chunk_size + item_size > max_size)
+        ):
+            chunks.append(chunk)
+            chunk = []
+            chunk_size = 0
+
+        chunk.append(item)
+        chunk_size += item_size
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+class EventBatcher:
+    """Collects the events, and passes them to the ``batch_func`` as a
+    list, once ``batch_size`` of them are collected or ``max_delay``
+    seconds after the first one of the batch is collected, whichever
+    comes first.
+
+    The events may be added from multiple threads. The batches are
+    passed to the ``batch_func`` in the order they are collected, one
+    at a time. The ``batch_func`` is called without holding the lock
+    that guards the collected events, so the events keep being collected
+    while a batch is being passed.
+
+    A thread that completes a batch while another one is passing the
+    batches does not wait for it, and the batch is passed by the other
+    thread instead. So, the timer never blocks the reactor thread behind
+    a slow ``batch_func`` running on an event thread.
+
+    Once closed, the collected events are discarded, and no batch is
+    passed to the ``batch_func`` anymore, other than the one that may
+    already be being passed.
+    """
+
+    __slots__ = (
+        "_batch_func",
+        "_batch_size",
+        "_max_delay",
+        "_add_timer",
+        "_events",
+        "_batches",
+        "_timer",
+        "_closed",
+        "_lock",
+        "_delivery_lock",
+    )
+
+    def __init__(
+        self,
+        batch_func: typing.Callable[[typing.List[typing.Any]], None],
+        batch_size: int,
+        max_delay: float,
+        add_timer: typing.Callable[[float, typing.Callable[[], None]], typing.Any],
+    ):
+        self._batch_func = batch_func
+        self._batch_size = batch_size
+        self._max_delay = max_delay
+        self._add_timer = add_timer
+        self._events: typing.List[typing.Any] = []
+        # Completed batches, waiting to be passed to the batch_func
+        self._batches: typing.Deque[typing.List[typing.Any]] = deque()
+        self._timer: typing.Any = None
+        self._closed = False
+        self._lock = threading.Lock()
+        # Held by the thread that passes the batches, one at a time and
+        # in order. It is never waited for.
+        self._delivery_lock = threading.Lock()
+
+    def add(self, event: typing.Any) -> None:
+        with self._lock:
+            if self._closed:
+                return
+
+            events = self._events
+            events.append(event)
+            if len(events) < self._batch_size:
+                if self._timer is None:
+                    self._timer = self._add_timer(self._max_delay, self._flush_on_timer)
+                return
+
+            self._complete_batch()
+
+        self._deliver()
+
+    def close(self) -> None:
+        """Discards the collected events, and stops passing the batches
+        to the ``batch_func``."""
+        with self._lock:
+            self._closed = True
+            self._events = []
+            self._batches.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _flush_on_timer(self):
+        with self._lock:
+            self._timer = None
+            if self._closed or not self._events:
+                return
+
+            self._complete_batch()
+
+        self._deliver()
+
+    def _complete_batch(self):
+        # Must be called with the lock held
+        self._batches.append(self._events)
+        self._events = []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _deliver(self):
+        delivery_lock = self._delivery_lock
+        batches = self._batches
+        while delivery_lock.acquire(blocking=False):
+            try:
+                while True:
+                    with self._lock:
+                        if not batches:
+                            break
+
+                        events = batches.popleft()
+
+                    try:
+                        self._batch_func(events)
+                    except:
+                        # It might be called on the reactor thread, by the timer
+                        _logger.exception("Exception when invoking the batch function")
+            finally:
+                delivery_lock.release()
+
+            with self._lock:
+                # A batch might be completed after the last check, by a
+                # thread that could not acquire the delivery lock.
+                if not batches:
+                    return
+
+
 # Version utilities
 UNKNOWN_VERSION = -1
 MAJOR_VERSION_MULTIPLIER = 10000
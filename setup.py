@@ -14,8 +14,13 @@ stats_requirements = [
     "psutil",
 ]
 
+hash_requirements = [
+    "mmh3>=5.0",
+]
+
 extras = {
     "stats": stats_requirements,
+    "hash": hash_requirements,
 }
 
 setup(
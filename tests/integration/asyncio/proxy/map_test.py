@@ -436,6 +436,28 @@ class MapTest(SingleMemberTestCase):
     async def test_put_all_when_no_keys(self):
         self.assertIsNone(await self.map.put_all({}))
 
+    async def test_set_many(self):
+        entries = (("key-%d" % x, "value-%d" % x) for x in range(1000))
+        self.assertEqual(1000, await self.map.set_many(entries, batch_size=10, max_in_flight=4))
+        self.assertEqual(1000, await self.map.size())
+        self.assertEqual("value-42", await self.map.get("key-42"))
+
+    async def test_get_many(self):
+        expected = await self.fill_map(1000)
+        keys = iter(list(expected.keys()) + ["missing"])
+        actual = {k: v async for k, v in self.map.get_many(keys, batch_size=10, max_in_flight=4)}
+        self.assertEqual(expected, actual)
+
+    async def test_iterator(self):
+        expected = await self.fill_map(1000)
+        self.assertEqual(expected, {k: v async for k, v in self.map.iterator(page_size=7)})
+
+    async def test_iterator_with_predicate(self):
+        await self.fill_map(1000)
+        predicate = sql("this == 'value-1'")
+        actual = {k: v async for k, v in self.map.iterator(page_size=7, predicate=predicate)}
+        self.assertEqual({"key-1": "value-1"}, actual)
+
     async def test_put_if_absent_when_missing_value(self):
         returned_value = await self.map.put_if_absent("key", "new_value")
 
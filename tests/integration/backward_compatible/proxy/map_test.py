@@ -122,6 +122,31 @@ class MapTest(SingleMemberTestCase):
     def tearDown(self):
         self.map.destroy()
 
+    def test_add_entry_batch_listener(self):
+        batches = []
+        self.map.add_entry_batch_listener(
+            batches.append,
+            include_value=True,
+            event_types=[EntryEventType.ADDED],
+            batch_size=3,
+            max_delay=0.5,
+        )
+        for i in range(4):
+            self.map.put("key-%d" % i, "value-%d" % i)
+        self.map.remove("key-0")
+
+        def assert_batches():
+            self.assertEqual([3, 1], [len(batch) for batch in batches])
+            events = [event for batch in batches for event in batch]
+            self.assertEqual(
+                {("key-%d" % i, "value-%d" % i) for i in range(4)},
+                {(event.key, event.value) for event in events},
+            )
+            for event in events:
+                self.assertEqual(EntryEventType.ADDED, event.event_type)
+
+        self.assertTrueEventually(assert_batches, 5)
+
     def test_add_entry_listener_item_added(self):
         collector = event_collector()
         self.map.add_entry_listener(include_value=True, added_func=collector)
@@ -442,6 +467,27 @@ class MapTest(SingleMemberTestCase):
     def test_put_all_when_no_keys(self):
         self.assertIsNone(self.map.put_all({}))
 
+    def test_set_many(self):
+        entries = (("key-%d" % x, "value-%d" % x) for x in range(1000))
+        self.assertEqual(1000, self.map.set_many(entries, batch_size=10, max_in_flight=4))
+        self.assertEqual(1000, self.map.size())
+        self.assertEqual("value-42", self.map.get("key-42"))
+
+    def test_get_many(self):
+        expected = self.fill_map(1000)
+        keys = iter(list(expected.keys()) + ["missing"])
+        actual = dict(self.map.get_many(keys, batch_size=10, max_in_flight=4))
+        self.assertEqual(expected, actual)
+
+    def test_iterator(self):
+        expected = self.fill_map(1000)
+        self.assertEqual(expected, dict(self.map.iterator(page_size=7)))
+
+    def test_iterator_with_predicate(self):
+        self.fill_map(1000)
+        actual = dict(self.map.iterator(page_size=7, predicate=sql("this == 'value-1'")))
+        self.assertEqual({"key-1": "value-1"}, actual)
+
     def test_put_if_absent_when_missing_value(self):
         returned_value = self.map.put_if_absent("key", "new_value")
 
@@ -288,7 +288,7 @@ class StatisticsTest(HazelcastTestCase):
         raise AssertionError
 
     def get_runtime_and_system_metrics(self, client):
-        s = Statistics(client, client._config, None, None, None, None)
+        s = Statistics(client, client._config, None, None, None, None, None)
         try:
             # Compatibility for <4.2.1 clients
             return s._get_os_and_runtime_stats()
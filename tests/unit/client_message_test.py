@@ -12,6 +12,9 @@ from hazelcast.protocol.builtin import (
     DataCodec,
     EntryListCodec,
     StringCodec,
+    EntryListIntegerIntegerCodec,
+    EntryListIntegerLongCodec,
+    EntryListIntegerUUIDCodec,
     EntryListUUIDListIntegerCodec,
     EntryListUUIDLongCodec,
     ListMultiFrameCodec,
@@ -22,7 +25,10 @@ from hazelcast.protocol.builtin import (
     SetUUIDCodec,
 )
 from hazelcast.protocol.client_message import *
-from hazelcast.protocol.codec import client_authentication_codec
+from hazelcast.protocol.codec import (
+    client_authentication_codec,
+    map_fetch_near_cache_invalidation_metadata_codec,
+)
 from hazelcast.protocol.codec.custom.error_holder_codec import ErrorHolderCodec
 from hazelcast.serialization.data import Data
 
@@ -146,6 +152,12 @@ class InboundMessageTest(unittest.TestCase):
         CodecUtil.fast_forward_to_end_frame(message)
         self.assertFalse(message.has_next_frame())
 
+    def test_partition_id(self):
+        buf = bytearray(EVENT_HEADER_SIZE)
+        LE_INT.pack_into(buf, EVENT_HEADER_SIZE - INT_SIZE_IN_BYTES, 42)
+        message = InboundMessage(Frame(buf, 0))
+        self.assertEqual(42, message.get_partition_id())
+
 
 class EncodeDecodeTest(unittest.TestCase):
     @classmethod
@@ -239,6 +251,14 @@ class EncodeDecodeTest(unittest.TestCase):
             EntryListCodec.decode_nullable(message, StringCodec.decode, StringCodec.decode)
         )
 
+    def test_integer_integer_entry_list(self):
+        self.mark_initial_frame_as_non_final()
+        entries = [(2147483647, -1), (0, 3), (-5, 0xCAFE)]
+        EntryListIntegerIntegerCodec.encode(self.buf, entries, True)
+        message = self.write_and_decode()
+        message.next_frame()  # initial frame
+        self.assertEqual(entries, EntryListIntegerIntegerCodec.decode(message))
+
     def test_uuid_integer_list_entry_list(self):
         self.mark_initial_frame_as_non_final()
         entries = [(uuid.uuid4(), [1, 2]), (uuid.uuid4(), [3, 4]), (uuid.uuid4(), [5, 6])]
@@ -255,6 +275,35 @@ class EncodeDecodeTest(unittest.TestCase):
         message.next_frame()  # initial frame
         self.assertEqual(entries, EntryListUUIDLongCodec.decode(message))
 
+    def test_integer_long_entry_list(self):
+        self.mark_initial_frame_as_non_final()
+        entries = [(1, 0xCAFE), (2, -0xBABE), (270, 56789123123123)]
+        EntryListIntegerLongCodec.encode(self.buf, entries, True)
+        message = self.write_and_decode()
+        message.next_frame()  # initial frame
+        self.assertEqual(entries, EntryListIntegerLongCodec.decode(message))
+
+    def test_integer_uuid_entry_list(self):
+        self.mark_initial_frame_as_non_final()
+        entries = [(1, uuid.uuid4()), (2, uuid.uuid4()), (270, uuid.uuid4())]
+        EntryListIntegerUUIDCodec.encode(self.buf, entries, True)
+        message = self.write_and_decode()
+        message.next_frame()  # initial frame
+        self.assertEqual(entries, EntryListIntegerUUIDCodec.decode(message))
+
+    def test_fetch_near_cache_invalidation_metadata_response(self):
+        self.mark_initial_frame_as_non_final()
+        sequences = [("a", [(1, 10), (2, 20)]), ("b", [(1, 3)])]
+        uuids = [(1, uuid.uuid4()), (2, uuid.uuid4())]
+        EntryListCodec.encode(
+            self.buf, sequences, StringCodec.encode, EntryListIntegerLongCodec.encode
+        )
+        EntryListIntegerUUIDCodec.encode(self.buf, uuids, True)
+        message = self.write_and_decode()
+        response = map_fetch_near_cache_invalidation_metadata_codec.decode_response(message)
+        self.assertEqual(sequences, response["name_partition_sequence_list"])
+        self.assertEqual(uuids, response["partition_uuid_list"])
+
     def test_errors(self):
         self.mark_initial_frame_as_non_final()
         holder = ErrorHolder(-12345, "class", "message", [])
@@ -402,7 +451,7 @@ class ClientMessageBuilderTest(unittest.TestCase):
         self.assertEqual(1, len(self.builder._fragmented_messages))
         fragmented_message = self.builder._fragmented_messages[fragmentation_id]
         self.assertIsNotNone(fragmented_message)
-        self.assertEqual("a", fragmented_message.end_frame.buf.decode("utf-8"))
+        self.assertEqual("a", str(fragmented_message.end_frame.buf, "utf-8"))
 
         self.reader.read(middle_buf)
         middle_message = self.reader._read_message()
@@ -411,10 +460,63 @@ class ClientMessageBuilderTest(unittest.TestCase):
         self.assertEqual(1, len(self.builder._fragmented_messages))
         fragmented_message = self.builder._fragmented_messages[fragmentation_id]
         self.assertIsNotNone(fragmented_message)
-        self.assertEqual("b", fragmented_message.end_frame.buf.decode("utf-8"))
+        self.assertEqual("b", str(fragmented_message.end_frame.buf, "utf-8"))
 
         self.reader.read(end_buf)
         end_message = self.reader._read_message()
         self.builder.on_message(end_message)
         self.assertEqual(1, self.counter.value)
         self.assertEqual(0, len(self.builder._fragmented_messages))
+
+
+class ReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.messages = []
+        self.builder = ClientMessageBuilder(self.messages.append)
+
+    def create_message(self, value):
+        buf = create_initial_buffer(REQUEST_HEADER_SIZE, 0)
+        StringCodec.encode(buf, value, True)
+        return buf
+
+    def decode_values(self):
+        values = []
+        for message in self.messages:
+            message.next_frame()  # initial frame
+            values.append(StringCodec.decode(message))
+        return values
+
+    def test_frames_are_views_over_the_buffer(self):
+        reader = _Reader(self.builder)
+        reader.read(self.create_message("a"))
+        reader.process()
+        self.assertEqual(1, len(self.messages))
+        self.assertIsInstance(self.messages[0].start_frame.buf, memoryview)
+
+    def test_frame_spanning_over_the_buffer_end(self):
+        message = self.create_message("x" * 20)
+        reader = _Reader(self.builder, len(message) + 10)
+        reader.read(message)
+        reader.read(message[:10])
+        reader.process()
+        reader.read(message[10:])
+        reader.process()
+        self.assertEqual(["x" * 20, "x" * 20], self.decode_values())
+
+    def test_frame_larger_than_the_buffer(self):
+        message = self.create_message("x" * 1000)
+        reader = _Reader(self.builder, 16)
+        for i in range(0, len(message), 10):
+            reader.read(message[i : i + 10])
+            reader.process()
+
+        self.assertEqual(["x" * 1000], self.decode_values())
+
+    def test_frames_are_not_overwritten(self):
+        reader = _Reader(self.builder, 64)
+        values = [str(i) * 10 for i in range(10)]
+        for value in values:
+            reader.read(self.create_message(value))
+            reader.process()
+
+        self.assertEqual(values, self.decode_values())
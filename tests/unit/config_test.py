@@ -1,14 +1,21 @@
 import socket
 import typing
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from hazelcast.config import (
     Config,
     SSLProtocol,
     ReconnectMode,
+    ReactorLoop,
+    InvocationOverloadPolicy,
+    WriteQueueOverloadPolicy,
+    EventQueueOverloadPolicy,
     IntType,
     InMemoryFormat,
     EvictionPolicy,
+    EvictionStrategy,
+    EvictionMaxSizePolicy,
     IndexConfig,
     IndexType,
     UniqueKeyTransformation,
@@ -43,12 +50,21 @@ class ConfigTest(unittest.TestCase):
         self.config = Config()
 
     def test_from_dict(self):
+        executor = ThreadPoolExecutor(1)
         config_dict = {
             "cluster_members": ["192.168.1.1:5704"],
             "cluster_name": "not-dev",
             "client_name": "client0",
             "connection_timeout": 1.0,
             "socket_options": [(socket.IPPROTO_IP, socket.IP_HDRINCL, 1)],
+            "receive_buffer_size": 1024,
+            "reactor_loop": ReactorLoop.SELECTOR,
+            "reactor_count": 4,
+            "write_queue_high_watermark": 2048,
+            "write_queue_low_watermark": 1024,
+            "write_queue_overload_policy": "REROUTE",
+            "max_concurrent_invocations": 100,
+            "invocation_overload_policy": "BLOCK",
             "redo_operation": True,
             "smart_routing": False,
             "ssl_enabled": True,
@@ -86,6 +102,9 @@ class ConfigTest(unittest.TestCase):
                     "eviction_max_size": 999,
                     "eviction_sampling_count": 9,
                     "eviction_sampling_pool_size": 99,
+                    "eviction_strategy": EvictionStrategy.EXACT,
+                    "eviction_max_size_policy": EvictionMaxSizePolicy.USED_MEMORY_SIZE,
+                    "object_sizer": len,
                 }
             },
             "load_balancer": RandomLB(),
@@ -114,6 +133,19 @@ class ConfigTest(unittest.TestCase):
             "backup_ack_to_client_enabled": False,
             "operation_backup_timeout": 99.9,
             "fail_on_indeterminate_operation_state": True,
+            "partition_id_cache_size": 1000,
+            "bulk_request_max_entries": 500,
+            "bulk_request_max_bytes": 65536,
+            "bulk_request_member_grouping": True,
+            "lazy_deserialization": True,
+            "response_offload_threshold": 1048576,
+            "response_offload_executor": executor,
+            "reactor_slow_call_threshold": 0.05,
+            "event_thread_count": 4,
+            "event_queue_capacity": 1024,
+            "event_queue_overload_policy": "DROP",
+            "near_cache_reconciliation_interval": 30,
+            "near_cache_max_tolerated_miss_count": 100,
             "creds_username": "user",
             "creds_password": "pass",
             "token_provider": SomeTokenProvider(),
@@ -126,6 +158,14 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual("client0", config.client_name)
         self.assertEqual(1.0, config.connection_timeout)
         self.assertEqual([(socket.IPPROTO_IP, socket.IP_HDRINCL, 1)], config.socket_options)
+        self.assertEqual(1024, config.receive_buffer_size)
+        self.assertEqual(ReactorLoop.SELECTOR, config.reactor_loop)
+        self.assertEqual(4, config.reactor_count)
+        self.assertEqual(2048, config.write_queue_high_watermark)
+        self.assertEqual(1024, config.write_queue_low_watermark)
+        self.assertEqual(WriteQueueOverloadPolicy.REROUTE, config.write_queue_overload_policy)
+        self.assertEqual(100, config.max_concurrent_invocations)
+        self.assertEqual(InvocationOverloadPolicy.BLOCK, config.invocation_overload_policy)
         self.assertTrue(config.redo_operation)
         self.assertFalse(config.smart_routing)
         self.assertTrue(config.ssl_enabled)
@@ -164,6 +204,9 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(999, nc_config.eviction_max_size)
         self.assertEqual(9, nc_config.eviction_sampling_count)
         self.assertEqual(99, nc_config.eviction_sampling_pool_size)
+        self.assertEqual(EvictionStrategy.EXACT, nc_config.eviction_strategy)
+        self.assertEqual(EvictionMaxSizePolicy.USED_MEMORY_SIZE, nc_config.eviction_max_size_policy)
+        self.assertIs(len, nc_config.object_sizer)
 
         self.assertIsInstance(config.load_balancer, RandomLB)
 
@@ -195,6 +238,19 @@ class ConfigTest(unittest.TestCase):
         self.assertFalse(config.backup_ack_to_client_enabled)
         self.assertEqual(99.9, config.operation_backup_timeout)
         self.assertTrue(config.fail_on_indeterminate_operation_state)
+        self.assertEqual(1000, config.partition_id_cache_size)
+        self.assertEqual(500, config.bulk_request_max_entries)
+        self.assertEqual(65536, config.bulk_request_max_bytes)
+        self.assertTrue(config.bulk_request_member_grouping)
+        self.assertTrue(config.lazy_deserialization)
+        self.assertEqual(1048576, config.response_offload_threshold)
+        self.assertIs(executor, config.response_offload_executor)
+        self.assertEqual(0.05, config.reactor_slow_call_threshold)
+        self.assertEqual(4, config.event_thread_count)
+        self.assertEqual(1024, config.event_queue_capacity)
+        self.assertEqual(EventQueueOverloadPolicy.DROP, config.event_queue_overload_policy)
+        self.assertEqual(30, config.near_cache_reconciliation_interval)
+        self.assertEqual(100, config.near_cache_max_tolerated_miss_count)
         self.assertEqual("user", config.creds_username)
         self.assertEqual("pass", config.creds_password)
         self.assertIsInstance(config.token_provider, SomeTokenProvider)
@@ -285,6 +341,90 @@ class ConfigTest(unittest.TestCase):
         config.socket_options = options
         self.assertEqual(options, config.socket_options)
 
+    def test_receive_buffer_size(self):
+        config = self.config
+        self.assertEqual(128000, config.receive_buffer_size)
+
+        with self.assertRaises(ValueError):
+            config.receive_buffer_size = 0
+
+        with self.assertRaises(TypeError):
+            config.receive_buffer_size = 1.5
+
+        config.receive_buffer_size = 1024
+        self.assertEqual(1024, config.receive_buffer_size)
+
+    def test_reactor_loop(self):
+        config = self.config
+        self.assertEqual(ReactorLoop.POLL, config.reactor_loop)
+
+        with self.assertRaises(TypeError):
+            config.reactor_loop = None
+
+        config.reactor_loop = ReactorLoop.SELECTOR
+        self.assertEqual(ReactorLoop.SELECTOR, config.reactor_loop)
+
+        config.reactor_loop = 0
+        self.assertEqual(ReactorLoop.POLL, config.reactor_loop)
+
+        config.reactor_loop = "SELECTOR"
+        self.assertEqual(ReactorLoop.SELECTOR, config.reactor_loop)
+
+    def test_reactor_count(self):
+        config = self.config
+        self.assertEqual(1, config.reactor_count)
+
+        with self.assertRaises(TypeError):
+            config.reactor_count = None
+
+        with self.assertRaises(ValueError):
+            config.reactor_count = 0
+
+        config.reactor_count = 4
+        self.assertEqual(4, config.reactor_count)
+
+    def test_write_queue_high_watermark(self):
+        config = self.config
+        self.assertEqual(-1, config.write_queue_high_watermark)
+
+        with self.assertRaises(TypeError):
+            config.write_queue_high_watermark = 1.5
+
+        with self.assertRaises(ValueError):
+            config.write_queue_high_watermark = 0
+
+        config.write_queue_high_watermark = 1024
+        self.assertEqual(1024, config.write_queue_high_watermark)
+
+        config.write_queue_high_watermark = -1
+        self.assertEqual(-1, config.write_queue_high_watermark)
+
+    def test_write_queue_low_watermark(self):
+        config = self.config
+        self.assertEqual(-1, config.write_queue_low_watermark)
+
+        with self.assertRaises(TypeError):
+            config.write_queue_low_watermark = None
+
+        with self.assertRaises(ValueError):
+            config.write_queue_low_watermark = -2
+
+        config.write_queue_low_watermark = 0
+        self.assertEqual(0, config.write_queue_low_watermark)
+
+    def test_write_queue_overload_policy(self):
+        config = self.config
+        self.assertEqual(WriteQueueOverloadPolicy.BLOCK, config.write_queue_overload_policy)
+
+        with self.assertRaises(TypeError):
+            config.write_queue_overload_policy = None
+
+        config.write_queue_overload_policy = WriteQueueOverloadPolicy.ERROR
+        self.assertEqual(WriteQueueOverloadPolicy.ERROR, config.write_queue_overload_policy)
+
+        config.write_queue_overload_policy = "REROUTE"
+        self.assertEqual(WriteQueueOverloadPolicy.REROUTE, config.write_queue_overload_policy)
+
     def test_redo_operation(self):
         config = self.config
         self.assertFalse(config.redo_operation)
@@ -688,6 +828,9 @@ class ConfigTest(unittest.TestCase):
             ({"x": {"eviction_sampling_count": 0}}, ValueError),
             ({"x": {"eviction_sampling_pool_size": None}}, TypeError),
             ({"x": {"eviction_sampling_pool_size": -10}}, ValueError),
+            ({"x": {"eviction_strategy": None}}, TypeError),
+            ({"x": {"eviction_max_size_policy": None}}, TypeError),
+            ({"x": {"object_sizer": None}}, TypeError),
             ({"x": {"invalid_option": -10}}, InvalidConfigurationError),
         ]
 
@@ -707,6 +850,9 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(10000, nc_config.eviction_max_size)
         self.assertEqual(8, nc_config.eviction_sampling_count)
         self.assertEqual(16, nc_config.eviction_sampling_pool_size)
+        self.assertEqual(EvictionStrategy.SAMPLING, nc_config.eviction_strategy)
+        self.assertEqual(EvictionMaxSizePolicy.ENTRY_COUNT, nc_config.eviction_max_size_policy)
+        self.assertIsNone(nc_config.object_sizer)
 
     def test_near_caches_with_a_few_changes(self):
         config = self.config
@@ -720,6 +866,9 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(10000, nc_config.eviction_max_size)
         self.assertEqual(8, nc_config.eviction_sampling_count)
         self.assertEqual(16, nc_config.eviction_sampling_pool_size)
+        self.assertEqual(EvictionStrategy.SAMPLING, nc_config.eviction_strategy)
+        self.assertEqual(EvictionMaxSizePolicy.ENTRY_COUNT, nc_config.eviction_max_size_policy)
+        self.assertIsNone(nc_config.object_sizer)
 
     def test_near_caches(self):
         config = self.config
@@ -733,6 +882,8 @@ class ConfigTest(unittest.TestCase):
                 "eviction_max_size": 1000,
                 "eviction_sampling_count": 20,
                 "eviction_sampling_pool_size": 15,
+                "eviction_strategy": "EXACT",
+                "eviction_max_size_policy": "USED_MEMORY_SIZE",
             }
         }
         nc_config = config.near_caches["a"]
@@ -744,6 +895,8 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(1000, nc_config.eviction_max_size)
         self.assertEqual(20, nc_config.eviction_sampling_count)
         self.assertEqual(15, nc_config.eviction_sampling_pool_size)
+        self.assertEqual(EvictionStrategy.EXACT, nc_config.eviction_strategy)
+        self.assertEqual(EvictionMaxSizePolicy.USED_MEMORY_SIZE, nc_config.eviction_max_size_policy)
 
     def test_near_cache_config_from_dict(self):
         nc_config_dict = {
@@ -1003,6 +1156,29 @@ class ConfigTest(unittest.TestCase):
         config.invocation_retry_pause = 11
         self.assertEqual(11, config.invocation_retry_pause)
 
+    def test_max_concurrent_invocations(self):
+        config = self.config
+        self.assertEqual(-1, config.max_concurrent_invocations)
+
+        with self.assertRaises(TypeError):
+            config.max_concurrent_invocations = 1.5
+
+        with self.assertRaises(ValueError):
+            config.max_concurrent_invocations = 0
+
+        config.max_concurrent_invocations = 100
+        self.assertEqual(100, config.max_concurrent_invocations)
+
+    def test_invocation_overload_policy(self):
+        config = self.config
+        self.assertEqual(InvocationOverloadPolicy.ERROR, config.invocation_overload_policy)
+
+        with self.assertRaises(TypeError):
+            config.invocation_overload_policy = None
+
+        config.invocation_overload_policy = InvocationOverloadPolicy.BLOCK
+        self.assertEqual(InvocationOverloadPolicy.BLOCK, config.invocation_overload_policy)
+
     def test_statistics_enabled(self):
         config = self.config
         self.assertFalse(config.statistics_enabled)
@@ -1069,6 +1245,173 @@ class ConfigTest(unittest.TestCase):
         config.fail_on_indeterminate_operation_state = True
         self.assertTrue(config.fail_on_indeterminate_operation_state)
 
+    def test_partition_id_cache_size(self):
+        config = self.config
+        self.assertEqual(0, config.partition_id_cache_size)
+
+        with self.assertRaises(TypeError):
+            config.partition_id_cache_size = None
+
+        with self.assertRaises(ValueError):
+            config.partition_id_cache_size = -1
+
+        config.partition_id_cache_size = 1000
+        self.assertEqual(1000, config.partition_id_cache_size)
+
+    def test_bulk_request_max_entries(self):
+        config = self.config
+        self.assertEqual(-1, config.bulk_request_max_entries)
+
+        with self.assertRaises(TypeError):
+            config.bulk_request_max_entries = None
+
+        with self.assertRaises(ValueError):
+            config.bulk_request_max_entries = 0
+
+        config.bulk_request_max_entries = 500
+        self.assertEqual(500, config.bulk_request_max_entries)
+
+    def test_bulk_request_max_bytes(self):
+        config = self.config
+        self.assertEqual(-1, config.bulk_request_max_bytes)
+
+        with self.assertRaises(TypeError):
+            config.bulk_request_max_bytes = 1.5
+
+        with self.assertRaises(ValueError):
+            config.bulk_request_max_bytes = -2
+
+        config.bulk_request_max_bytes = 65536
+        self.assertEqual(65536, config.bulk_request_max_bytes)
+
+    def test_bulk_request_member_grouping(self):
+        config = self.config
+        self.assertFalse(config.bulk_request_member_grouping)
+
+        with self.assertRaises(TypeError):
+            config.bulk_request_member_grouping = None
+
+        config.bulk_request_member_grouping = True
+        self.assertTrue(config.bulk_request_member_grouping)
+
+    def test_lazy_deserialization(self):
+        config = self.config
+        self.assertFalse(config.lazy_deserialization)
+
+        with self.assertRaises(TypeError):
+            config.lazy_deserialization = 1
+
+        config.lazy_deserialization = True
+        self.assertTrue(config.lazy_deserialization)
+
+    def test_response_offload_threshold(self):
+        config = self.config
+        self.assertEqual(-1, config.response_offload_threshold)
+
+        with self.assertRaises(TypeError):
+            config.response_offload_threshold = None
+
+        with self.assertRaises(ValueError):
+            config.response_offload_threshold = 0
+
+        config.response_offload_threshold = 65536
+        self.assertEqual(65536, config.response_offload_threshold)
+
+    def test_response_offload_executor(self):
+        config = self.config
+        self.assertIsNone(config.response_offload_executor)
+
+        with self.assertRaises(TypeError):
+            config.response_offload_executor = 4
+
+        executor = ThreadPoolExecutor(1)
+        config.response_offload_executor = executor
+        self.assertIs(executor, config.response_offload_executor)
+
+        config.response_offload_executor = None
+        self.assertIsNone(config.response_offload_executor)
+
+    def test_reactor_slow_call_threshold(self):
+        config = self.config
+        self.assertEqual(-1, config.reactor_slow_call_threshold)
+
+        with self.assertRaises(TypeError):
+            config.reactor_slow_call_threshold = None
+
+        with self.assertRaises(ValueError):
+            config.reactor_slow_call_threshold = -0.5
+
+        config.reactor_slow_call_threshold = 0.1
+        self.assertEqual(0.1, config.reactor_slow_call_threshold)
+
+    def test_event_thread_count(self):
+        config = self.config
+        self.assertEqual(0, config.event_thread_count)
+
+        with self.assertRaises(TypeError):
+            config.event_thread_count = None
+
+        with self.assertRaises(ValueError):
+            config.event_thread_count = -1
+
+        config.event_thread_count = 8
+        self.assertEqual(8, config.event_thread_count)
+
+    def test_event_queue_capacity(self):
+        config = self.config
+        self.assertEqual(1000000, config.event_queue_capacity)
+
+        with self.assertRaises(TypeError):
+            config.event_queue_capacity = None
+
+        with self.assertRaises(ValueError):
+            config.event_queue_capacity = 0
+
+        config.event_queue_capacity = 100
+        self.assertEqual(100, config.event_queue_capacity)
+
+    def test_event_queue_overload_policy(self):
+        config = self.config
+        self.assertEqual(EventQueueOverloadPolicy.DROP, config.event_queue_overload_policy)
+
+        with self.assertRaises(TypeError):
+            config.event_queue_overload_policy = None
+
+        with self.assertRaises(TypeError):
+            config.event_queue_overload_policy = "BLOCK"
+
+        config.event_queue_overload_policy = "DROP"
+        self.assertEqual(EventQueueOverloadPolicy.DROP, config.event_queue_overload_policy)
+
+    def test_near_cache_reconciliation_interval(self):
+        config = self.config
+        self.assertEqual(60, config.near_cache_reconciliation_interval)
+
+        with self.assertRaises(TypeError):
+            config.near_cache_reconciliation_interval = None
+
+        with self.assertRaises(ValueError):
+            config.near_cache_reconciliation_interval = -1
+
+        config.near_cache_reconciliation_interval = 0
+        self.assertEqual(0, config.near_cache_reconciliation_interval)
+
+        config.near_cache_reconciliation_interval = 0.5
+        self.assertEqual(0.5, config.near_cache_reconciliation_interval)
+
+    def test_near_cache_max_tolerated_miss_count(self):
+        config = self.config
+        self.assertEqual(10, config.near_cache_max_tolerated_miss_count)
+
+        with self.assertRaises(TypeError):
+            config.near_cache_max_tolerated_miss_count = None
+
+        with self.assertRaises(ValueError):
+            config.near_cache_max_tolerated_miss_count = -1
+
+        config.near_cache_max_tolerated_miss_count = 0
+        self.assertEqual(0, config.near_cache_max_tolerated_miss_count)
+
     def test_auth_fromdict(self):
         tp = BasicTokenProvider("tok")
         cfg = Config().from_dict(
@@ -3,6 +3,8 @@ import traceback
 import unittest
 from threading import Thread, Event
 
+from mock import MagicMock
+
 from hazelcast.future import (
     Future,
     ImmediateFuture,
@@ -295,6 +297,26 @@ class FutureTest(unittest.TestCase):
         self.assertFalse(n.is_success())
         self.assertEqual(n.exception(), e)
 
+    def test_callbacks_are_run_by_the_profiler_of_the_thread(self):
+        f = Future()
+        profiler = MagicMock()
+        calls = []
+
+        def run():
+            Future._threading_locals.profiler = profiler
+            f.add_done_callback(calls.append)
+            f.set_result("done")
+            f.add_done_callback(calls.append)
+
+        thread = Thread(target=run)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(2, profiler.run_callback.call_count)
+        profiler.run_callback.assert_called_with(f._invoke_cb, calls.append)
+        # Not set on the other threads
+        self.assertIsNone(Future._threading_locals.profiler)
+
 
 class ImmediateFutureTest(unittest.TestCase):
     f = None
@@ -1,11 +1,21 @@
+import asyncio
 import itertools
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from mock import MagicMock, patch
 from parameterized import parameterized
 
-from hazelcast.config import Config
-from hazelcast.errors import IndeterminateOperationStateError
+from hazelcast.config import Config, InvocationOverloadPolicy, WriteQueueOverloadPolicy
+from hazelcast.errors import (
+    HazelcastOverloadError,
+    IndeterminateOperationStateError,
+    OperationTimeoutError,
+    WriteQueueOverloadError,
+)
+from hazelcast.internal import asyncio_invocation
 from hazelcast.invocation import Invocation, InvocationService
 from hazelcast.protocol.codec import set_add_codec, client_ping_codec
 from hazelcast.serialization.data import Data
@@ -104,6 +114,20 @@ class InvocationTest(unittest.TestCase):
         invocation.future.set_result.assert_called_once_with(42)
         self.assertEqual(2, invocation.backup_acks_received)
 
+    def test_backup_handler_after_all_acks_are_received(self):
+        _, service = self._start_service()
+        invocation = MagicMock(
+            backup_acks_received=1,
+            backup_acks_expected=2,
+            pending_response="x",
+            pending_response_received_time=40,
+        )
+        invocation.response_handler = MagicMock(return_value=42)
+        service._notify_backup_complete(invocation)
+        # The invocation should not be completed once more
+        service._detect_and_handle_backup_timeout(invocation, 46)
+        invocation.future.set_result.assert_called_once_with(42)
+
     def test_backup_handler_when_all_acks_are_received(self):
         _, service = self._start_service()
         invocation = MagicMock(backup_acks_received=1, backup_acks_expected=1, pending_response="x")
@@ -186,6 +210,253 @@ class InvocationTest(unittest.TestCase):
                 # Urgent invocations without data should always be sent
                 self.assertIsNotNone(without_data.sent_connection)
 
+    def test_send_over_overloaded_connection_with_error_policy(self):
+        _, service = self._start_service(self._write_queue_config(WriteQueueOverloadPolicy.ERROR))
+        connection = MagicMock(overloaded=True)
+        invocation = Invocation(client_ping_codec.encode_request())
+        with self.assertRaises(WriteQueueOverloadError):
+            service._send(invocation, connection)
+        connection.send_message.assert_not_called()
+
+    def test_send_over_overloaded_connection_with_reroute_policy(self):
+        client, service = self._start_service(
+            self._write_queue_config(WriteQueueOverloadPolicy.REROUTE)
+        )
+        connection = MagicMock(overloaded=True)
+        other = MagicMock(live=True, overloaded=False)
+        client.connection_manager.active_connections = {"a": connection, "b": other}
+        invocation = Invocation(client_ping_codec.encode_request())
+        self.assertTrue(service._send(invocation, connection))
+        connection.send_message.assert_not_called()
+        other.send_message.assert_called_once()
+        self.assertIs(other, invocation.sent_connection)
+
+    def test_send_over_overloaded_connection_with_block_policy(self):
+        _, service = self._start_service(self._write_queue_config(WriteQueueOverloadPolicy.BLOCK))
+        connection = MagicMock(overloaded=True)
+        connection.wait_until_writable.return_value = True
+        invocation = Invocation(client_ping_codec.encode_request(), timeout=time.time() + 10)
+        self.assertTrue(service._send(invocation, connection))
+        connection.send_message.assert_called_once()
+
+        connection.wait_until_writable.return_value = False
+        invocation = Invocation(client_ping_codec.encode_request(), timeout=time.time() + 10)
+        with self.assertRaises(OperationTimeoutError):
+            service._send(invocation, connection)
+
+    def test_urgent_send_over_overloaded_connection(self):
+        _, service = self._start_service(self._write_queue_config(WriteQueueOverloadPolicy.ERROR))
+        connection = MagicMock(overloaded=True)
+        invocation = Invocation(client_ping_codec.encode_request(), urgent=True)
+        self.assertTrue(service._send(invocation, connection))
+        connection.send_message.assert_called_once()
+
+    def test_invoke_all_sends_the_requests_of_the_same_connection_together(self):
+        _, service = self._start_service()
+        first = MagicMock(overloaded=False)
+        second = MagicMock(overloaded=False)
+        invocations = [
+            Invocation(client_ping_codec.encode_request(), connection=connection)
+            for connection in (first, second, first)
+        ]
+
+        service.invoke_all(invocations)
+
+        first.send_message.assert_not_called()
+        second.send_message.assert_not_called()
+        first.send_messages.assert_called_once_with(
+            [invocations[0].request, invocations[2].request]
+        )
+        second.send_messages.assert_called_once_with([invocations[1].request])
+        for invocation in invocations:
+            self.assertFalse(invocation.future.done())
+
+    def test_invoke_all_when_the_requests_cannot_be_sent(self):
+        _, service = self._start_service()
+        connection = MagicMock(overloaded=False)
+        connection.send_messages.return_value = False
+        invocations = [
+            Invocation(client_ping_codec.encode_request(), connection=connection) for _ in range(2)
+        ]
+
+        service.invoke_all(invocations)
+
+        for invocation in invocations:
+            self.assertIsInstance(invocation.future.exception(), IOError)
+
+    def test_invoke_after_invoke_all(self):
+        _, service = self._start_service()
+        connection = MagicMock(overloaded=False)
+        service.invoke_all([Invocation(client_ping_codec.encode_request(), connection=connection)])
+        service.invoke(Invocation(client_ping_codec.encode_request(), connection=connection))
+        connection.send_messages.assert_called_once()
+        connection.send_message.assert_called_once()
+
+    def test_large_response_is_handled_on_the_offload_executor(self):
+        executor = MagicMock(spec=ThreadPoolExecutor)
+        _, service = self._start_service(self._response_offload_config(executor))
+        invocation = self._pending_invocation(service)
+        message = self._response(invocation, 100)
+
+        service.handle_client_message(message)
+
+        executor.submit.assert_called_once_with(service._notify, invocation, message)
+        self.assertFalse(invocation.future.done())
+        self.assertEqual(1, service.offloaded_response_count)
+
+    def test_small_response_is_handled_inline(self):
+        executor = MagicMock(spec=ThreadPoolExecutor)
+        _, service = self._start_service(self._response_offload_config(executor))
+        invocation = self._pending_invocation(service)
+
+        service.handle_client_message(self._response(invocation, 99))
+
+        executor.submit.assert_not_called()
+        self.assertEqual(42, invocation.future.result())
+        self.assertEqual(0, service.offloaded_response_count)
+        self.assertGreater(service.response_handler_time, 0)
+
+    def test_response_is_handled_inline_when_the_offload_executor_is_shut_down(self):
+        executor = MagicMock(spec=ThreadPoolExecutor)
+        executor.submit.side_effect = RuntimeError("shut down")
+        _, service = self._start_service(self._response_offload_config(executor))
+        invocation = self._pending_invocation(service)
+
+        service.handle_client_message(self._response(invocation, 100))
+
+        self.assertEqual(42, invocation.future.result())
+        self.assertEqual(0, service.offloaded_response_count)
+
+    def test_offloaded_response_completes_the_invocation(self):
+        config = Config()
+        config.response_offload_threshold = 1
+        _, service = self._start_service(config)
+        invocation = self._pending_invocation(service)
+
+        done = threading.Event()
+        invocation.future.add_done_callback(lambda _: done.set())
+
+        service.handle_client_message(self._response(invocation, 100))
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual(42, invocation.future.result())
+        self.assertEqual(1, service.offloaded_response_count)
+
+    def test_max_concurrent_invocations_with_error_policy(self):
+        _, service = self._start_service(
+            self._concurrent_invocations_config(InvocationOverloadPolicy.ERROR)
+        )
+        service._do_invoke = MagicMock()
+        first = Invocation(client_ping_codec.encode_request())
+        service.invoke(first)
+        service._do_invoke.assert_called_once_with(first)
+
+        second = Invocation(client_ping_codec.encode_request())
+        service.invoke(second)
+        self.assertIsInstance(second.future.exception(), HazelcastOverloadError)
+        service._do_invoke.assert_called_once_with(first)
+
+        # Urgent invocations are not limited
+        urgent = Invocation(client_ping_codec.encode_request(), urgent=True)
+        service.invoke(urgent)
+        service._do_invoke.assert_called_with(urgent)
+
+        service._complete_with_error(first, IOError())
+        third = Invocation(client_ping_codec.encode_request())
+        service.invoke(third)
+        service._do_invoke.assert_called_with(third)
+
+    def test_max_concurrent_invocations_with_block_policy(self):
+        _, service = self._start_service(
+            self._concurrent_invocations_config(InvocationOverloadPolicy.BLOCK)
+        )
+        service._do_invoke = MagicMock()
+        first = Invocation(client_ping_codec.encode_request())
+        service.invoke(first)
+
+        second = Invocation(client_ping_codec.encode_request())
+        thread = threading.Thread(target=service.invoke, args=(second,))
+        thread.start()
+        thread.join(0.1)
+        self.assertTrue(thread.is_alive())
+
+        service._complete(first, MagicMock())
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        service._do_invoke.assert_called_with(second)
+        self.assertFalse(second.future.done())
+
+    def test_max_concurrent_invocations_with_block_policy_and_timeout(self):
+        _, service = self._start_service(
+            self._concurrent_invocations_config(InvocationOverloadPolicy.BLOCK)
+        )
+        service._do_invoke = MagicMock()
+        service.invoke(Invocation(client_ping_codec.encode_request()))
+
+        invocation = Invocation(client_ping_codec.encode_request(), timeout=time.time() + 0.1)
+        service.invoke(invocation)
+        self.assertIsInstance(invocation.future.exception(), HazelcastOverloadError)
+
+    def test_invocation_permit_is_released_once(self):
+        _, service = self._start_service(
+            self._concurrent_invocations_config(InvocationOverloadPolicy.ERROR)
+        )
+        service._do_invoke = MagicMock()
+        first = Invocation(client_ping_codec.encode_request())
+        service.invoke(first)
+        self.assertTrue(first.has_permit)
+
+        # Completed by the response, and by the shutdown at the same time
+        service._complete(first, MagicMock())
+        service._complete_with_error(first, IOError())
+        self.assertFalse(first.has_permit)
+        self.assertEqual(0, service._concurrent_invocations)
+
+        second = Invocation(client_ping_codec.encode_request())
+        service.invoke(second)
+        third = Invocation(client_ping_codec.encode_request())
+        service.invoke(third)
+        self.assertIsInstance(third.future.exception(), HazelcastOverloadError)
+        self.assertFalse(third.has_permit)
+        self.assertEqual(1, service._concurrent_invocations)
+
+    @staticmethod
+    def _concurrent_invocations_config(policy):
+        config = Config()
+        config.max_concurrent_invocations = 1
+        config.invocation_overload_policy = policy
+        return config
+
+    @staticmethod
+    def _response_offload_config(executor):
+        config = Config()
+        config.response_offload_threshold = 100
+        config.response_offload_executor = executor
+        return config
+
+    @staticmethod
+    def _pending_invocation(service):
+        invocation = Invocation(client_ping_codec.encode_request(), response_handler=lambda _: 42)
+        invocation.request.set_correlation_id(1)
+        service._pending[1] = invocation
+        return invocation
+
+    @staticmethod
+    def _response(invocation, size):
+        message = MagicMock(size=size)
+        message.get_correlation_id.return_value = invocation.request.get_correlation_id()
+        message.start_frame.has_event_flag.return_value = False
+        message.start_frame.has_backup_event_flag.return_value = False
+        message.get_number_of_backup_acks.return_value = 0
+        return message
+
+    @staticmethod
+    def _write_queue_config(policy):
+        config = Config()
+        config.write_queue_high_watermark = 1024
+        config.write_queue_overload_policy = policy
+        return config
+
     def _send_urgent_invocation_with_data(self, service):
         request = set_add_codec.encode_request("foo", Data(bytearray(25)))
         self.assertTrue(request.contains_data)
@@ -215,3 +486,71 @@ class InvocationTest(unittest.TestCase):
         invocation_service.start()
         invocation_service.add_backup_listener()
         return c, invocation_service
+
+
+class AsyncioInvocationLimiterTest(unittest.IsolatedAsyncioTestCase):
+    async def test_max_concurrent_invocations_with_error_policy(self):
+        service = self._create_service(InvocationOverloadPolicy.ERROR)
+        first = asyncio_invocation.Invocation(client_ping_codec.encode_request())
+        second = asyncio_invocation.Invocation(client_ping_codec.encode_request())
+        service.invoke(first)
+        service.invoke(second)
+        await asyncio.sleep(0)
+
+        service._do_invoke.assert_called_once_with(first)
+        with self.assertRaises(HazelcastOverloadError):
+            await second.future
+
+        service._complete_with_error(first, IOError())
+        third = asyncio_invocation.Invocation(client_ping_codec.encode_request())
+        service.invoke(third)
+        await asyncio.sleep(0)
+        service._do_invoke.assert_called_with(third)
+
+    async def test_max_concurrent_invocations_with_block_policy(self):
+        service = self._create_service(InvocationOverloadPolicy.BLOCK)
+        first = asyncio_invocation.Invocation(client_ping_codec.encode_request())
+        second = asyncio_invocation.Invocation(client_ping_codec.encode_request())
+        service.invoke(first)
+        service.invoke(second)
+        await asyncio.sleep(0)
+        service._do_invoke.assert_called_once_with(first)
+
+        service._complete_with_error(first, IOError())
+        await asyncio.sleep(0.01)
+        service._do_invoke.assert_called_with(second)
+        self.assertFalse(second.future.done())
+
+    async def test_invocation_permit_is_released_once(self):
+        service = self._create_service(InvocationOverloadPolicy.ERROR)
+        first = asyncio_invocation.Invocation(client_ping_codec.encode_request())
+        service.invoke(first)
+        self.assertEqual(1, len(service._permit_tasks))
+        await asyncio.sleep(0)
+        self.assertTrue(first.has_permit)
+        await asyncio.sleep(0)
+        self.assertEqual(0, len(service._permit_tasks))
+
+        service._complete(first, MagicMock())
+        # Completed again, e.g. by the shutdown
+        service._release_invocation_permit(first)
+        self.assertFalse(first.has_permit)
+
+        second = asyncio_invocation.Invocation(client_ping_codec.encode_request())
+        third = asyncio_invocation.Invocation(client_ping_codec.encode_request())
+        service.invoke(second)
+        service.invoke(third)
+        await asyncio.sleep(0)
+        service._do_invoke.assert_called_with(second)
+        with self.assertRaises(HazelcastOverloadError):
+            await third.future
+
+    @staticmethod
+    def _create_service(policy):
+        config = Config()
+        config.max_concurrent_invocations = 1
+        config.invocation_overload_policy = policy
+        c = MagicMock()
+        service = asyncio_invocation.InvocationService(c, config, c.reactor)
+        service._do_invoke = MagicMock()
+        return service
@@ -0,0 +1,202 @@
+import threading
+import unittest
+
+from mock import MagicMock
+
+from hazelcast.config import Config
+from hazelcast.listener import ListenerService, _StripedEventExecutor, _StripedEventHandler
+from tests.base import HazelcastTestCase
+
+
+class StripedEventExecutorTest(HazelcastTestCase):
+    def setUp(self):
+        self.executor = None
+
+    def tearDown(self):
+        if self.executor:
+            self.executor.shutdown()
+
+    def test_events_of_the_same_partition_are_handled_in_order(self):
+        events = []
+
+        def handle_event(handler, message):
+            events.append((threading.current_thread().name, message))
+
+        executor = self._start_executor(2, handle_event=handle_event)
+        for i in range(100):
+            executor.execute(i % 4, None, i)
+
+        def assertion():
+            self.assertEqual(100, len(events))
+
+        self.assertTrueEventually(assertion)
+        for partition_id in range(4):
+            handled = [(name, message) for name, message in events if message % 4 == partition_id]
+            self.assertEqual(list(range(partition_id, 100, 4)), [m for _, m in handled])
+            self.assertEqual(
+                {"hazelcast-event-%d" % (partition_id % 2)}, {name for name, _ in handled}
+            )
+
+    def test_events_are_dropped_when_the_queue_is_full(self):
+        executor, release = self._start_blocked_executor(3)
+
+        for i in range(3):
+            executor.execute(0, None, "queued-%d" % i)
+        with self.assertLogs("hazelcast.listener", "WARNING"):
+            executor.execute(0, None, "dropped")
+            executor.execute(0, None, "dropped")
+
+        self.assertEqual(3, executor.queue_size)
+        self.assertEqual(2, executor.dropped_events)
+        release.set()
+
+        def assertion():
+            self.assertEqual(0, executor.queue_size)
+
+        self.assertTrueEventually(assertion)
+        executor.execute(0, None, "queued")
+        self.assertEqual(2, executor.dropped_events)
+
+    def test_events_without_partition_id_are_spread(self):
+        events = []
+
+        def handle_event(handler, message):
+            events.append(threading.current_thread().name)
+
+        executor = self._start_executor(3, handle_event=handle_event)
+        for _ in range(6):
+            executor.execute(-1, None, "event")
+
+        def assertion():
+            self.assertEqual(6, len(events))
+
+        self.assertTrueEventually(assertion)
+        self.assertEqual({"hazelcast-event-%d" % i for i in range(3)}, set(events))
+
+    def test_failing_handler_does_not_stop_the_thread(self):
+        handled = []
+
+        def handle_event(handler, message):
+            if message == "fail":
+                raise RuntimeError("expected")
+            handled.append(message)
+
+        executor = self._start_executor(1, handle_event=handle_event)
+        with self.assertLogs("hazelcast.listener", "ERROR"):
+            executor.execute(0, None, "fail")
+            executor.execute(0, None, "event")
+
+            def assertion():
+                self.assertEqual(["event"], handled)
+
+            self.assertTrueEventually(assertion)
+
+    def _start_blocked_executor(self, queue_capacity):
+        started = threading.Event()
+        release = threading.Event()
+
+        def handle_event(handler, message):
+            started.set()
+            release.wait()
+
+        executor = self._start_executor(1, queue_capacity, handle_event)
+        executor.execute(0, None, "handling")
+        self.assertTrue(started.wait(5))
+        return executor, release
+
+    def _start_executor(self, thread_count, queue_capacity=1000, handle_event=None):
+        self.executor = _StripedEventExecutor(thread_count, queue_capacity, handle_event)
+        self.executor.start()
+        return self.executor
+
+
+class ListenerServiceTest(unittest.TestCase):
+    def test_events_are_handled_inline_by_default(self):
+        service = self._create_service(Config())
+        handler = MagicMock()
+        service.add_event_handler(1, handler)
+        message = self._message(backup_event=False)
+
+        service.handle_client_message(message, 1)
+
+        self.assertIsNone(service.event_executor)
+        handler.assert_called_once_with(message)
+
+    def test_events_are_routed_to_the_event_threads_by_partition_id(self):
+        config = Config()
+        config.event_thread_count = 2
+        service = self._create_service(config)
+        service._event_executor = MagicMock()
+        handler = MagicMock()
+        service.add_event_handler(1, _StripedEventHandler(handler))
+        message = self._message(backup_event=False)
+
+        service.handle_client_message(message, 1)
+
+        service.event_executor.execute.assert_called_once_with(42, handler, message)
+        handler.assert_not_called()
+
+    def test_events_of_internal_listeners_are_handled_inline(self):
+        config = Config()
+        config.event_thread_count = 2
+        service = self._create_service(config)
+        service._event_executor = MagicMock()
+        handler = MagicMock()
+        service.add_event_handler(1, handler)
+        message = self._message(backup_event=False)
+
+        service.handle_client_message(message, 1)
+
+        service.event_executor.execute.assert_not_called()
+        handler.assert_called_once_with(message)
+
+    def test_striped_listener_registration(self):
+        config = Config()
+        config.event_thread_count = 2
+        service = self._create_service(config)
+        service._connection_manager.active_connections = {}
+        handler = MagicMock()
+
+        registration_id = service.register_listener(
+            MagicMock(), MagicMock(), MagicMock(), handler, striped=True
+        ).result()
+
+        registration = service._active_registrations[registration_id]
+        self.assertIsInstance(registration.handler, _StripedEventHandler)
+        self.assertIs(handler, registration.handler.handler)
+
+    def test_striped_listener_registration_without_event_threads(self):
+        service = self._create_service(Config())
+        service._connection_manager.active_connections = {}
+        handler = MagicMock()
+
+        registration_id = service.register_listener(
+            MagicMock(), MagicMock(), MagicMock(), handler, striped=True
+        ).result()
+
+        self.assertIs(handler, service._active_registrations[registration_id].handler)
+
+    def test_backup_events_are_handled_inline(self):
+        config = Config()
+        config.event_thread_count = 2
+        service = self._create_service(config)
+        service._event_executor = MagicMock()
+        handler = MagicMock()
+        service.add_event_handler(1, handler)
+        message = self._message(backup_event=True)
+
+        service.handle_client_message(message, 1)
+
+        service.event_executor.execute.assert_not_called()
+        handler.assert_called_once_with(message)
+
+    @staticmethod
+    def _create_service(config):
+        return ListenerService(MagicMock(), config, MagicMock(), MagicMock(), MagicMock())
+
+    @staticmethod
+    def _message(backup_event):
+        message = MagicMock()
+        message.start_frame.has_backup_event_flag.return_value = backup_event
+        message.get_partition_id.return_value = 42
+        return message
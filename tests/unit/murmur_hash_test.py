@@ -1,6 +1,18 @@
+import random
 import unittest
 
-from hazelcast.hash import murmur_hash3_x86_32, hash_to_index
+from hazelcast.config import Config
+from hazelcast.errors import ClientOfflineError
+from hazelcast.hash import (
+    _MMH3_ENABLED,
+    _mmh3_murmur_hash3_x86_32,
+    _murmur_hash3_x86_32,
+    hash_to_index,
+    murmur_hash3_x86_32,
+)
+from hazelcast.partition import _InternalPartitionService
+from hazelcast.serialization import BE_INT, LE_UINT, SerializationServiceV1
+from hazelcast.serialization.data import Data
 
 
 class HashTest(unittest.TestCase):
@@ -31,3 +43,91 @@ class HashTest(unittest.TestCase):
             p = hash_to_index(h, 271)
             self.assertEqual(h, mm_hash)
             self.assertEqual(p, partition_id)
+
+    def test_pure_python_hash_against_reference(self):
+        for data in _random_inputs():
+            self.assertEqual(_reference_murmur_hash3_x86_32(data), _murmur_hash3_x86_32(data))
+
+    @unittest.skipUnless(_MMH3_ENABLED, "mmh3 is not installed")
+    def test_mmh3_hash_against_reference(self):
+        for data in _random_inputs():
+            self.assertEqual(_reference_murmur_hash3_x86_32(data), _mmh3_murmur_hash3_x86_32(data))
+
+
+class PartitionIdsTest(unittest.TestCase):
+    def setUp(self):
+        self.service = _InternalPartitionService(None, Config(), SerializationServiceV1(Config()))
+        self.service.check_and_set_partition_count(271)
+
+    def test_get_partition_ids(self):
+        keys = [Data(data) for data in _random_inputs() if len(data) >= 8]
+        self.assertEqual(
+            [self.service.get_partition_id(key) for key in keys],
+            self.service.get_partition_ids(keys),
+        )
+
+    def test_get_partition_ids_with_partition_hash(self):
+        buf = bytearray(12)
+        BE_INT.pack_into(buf, 0, 42)
+        self.assertEqual([42, 42], self.service.get_partition_ids([Data(buf), Data(buf)]))
+
+    def test_get_partition_ids_without_partition_count(self):
+        service = _InternalPartitionService(None, Config(), SerializationServiceV1(Config()))
+        with self.assertRaises(ClientOfflineError):
+            service.get_partition_ids([Data(bytearray(12))])
+
+
+def _random_inputs():
+    rnd = random.Random(42)
+    for length in range(64):
+        for _ in range(20):
+            yield bytearray(rnd.getrandbits(8) for _ in range(length))
+    for _ in range(20):
+        yield bytes(rnd.getrandbits(8) for _ in range(rnd.randint(64, 4096)))
+
+
+def _reference_murmur_hash3_x86_32(data):
+    # The original, block by block implementation
+    length = max(len(data) - 8, 0)
+    nblocks = length // 4
+
+    h1 = 0x01000193
+
+    c1 = 0xCC9E2D51
+    c2 = 0x1B873593
+
+    for block_start in range(0, nblocks * 4, 4):
+        k1 = LE_UINT.unpack_from(data, block_start + 8)[0]
+
+        k1 = c1 * k1 & 0xFFFFFFFF
+        k1 = (k1 << 15 | k1 >> 17) & 0xFFFFFFFF
+        k1 = (c2 * k1) & 0xFFFFFFFF
+
+        h1 ^= k1
+        h1 = (h1 << 13 | h1 >> 19) & 0xFFFFFFFF
+        h1 = (h1 * 5 + 0xE6546B64) & 0xFFFFFFFF
+
+    tail_index = nblocks * 4
+    k1 = 0
+    tail_size = length & 3
+
+    if tail_size >= 3:
+        k1 ^= data[tail_index + 10] << 16
+    if tail_size >= 2:
+        k1 ^= data[tail_index + 9] << 8
+    if tail_size >= 1:
+        k1 ^= data[tail_index + 8]
+
+    if tail_size != 0:
+        k1 = (k1 * c1) & 0xFFFFFFFF
+        k1 = (k1 << 15 | k1 >> 17) & 0xFFFFFFFF
+        k1 = (k1 * c2) & 0xFFFFFFFF
+        h1 ^= k1
+
+    h1 ^= length
+    h1 ^= h1 >> 16
+    h1 = (h1 * 0x85EBCA6B) & 0xFFFFFFFF
+    h1 ^= h1 >> 13
+    h1 = (h1 * 0xC2B2AE35) & 0xFFFFFFFF
+    h1 ^= h1 >> 16
+    return -(h1 & 0x80000000) | (h1 & 0x7FFFFFFF)
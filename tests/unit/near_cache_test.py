@@ -1,6 +1,11 @@
+import sys
+import threading
 import unittest
+import uuid
 from time import sleep
 
+from mock import MagicMock
+
 from hazelcast.config import Config
 from hazelcast.near_cache import *
 from hazelcast.serialization import SerializationServiceV1
@@ -14,17 +19,96 @@ class NearCacheTestCase(unittest.TestCase):
         self.service.destroy()
 
     def test_DataRecord_expire_time(self):
-        now = current_time()
+        now = current_time_in_millis()
         data_rec = DataRecord("key", "value", create_time=now, ttl_seconds=0.05)
         sleep(0.1)
         self.assertTrue(data_rec.is_expired(max_idle_seconds=1000))
 
     def test_DataRecord_max_idle_seconds(self):
-        now = current_time()
+        now = current_time_in_millis()
         data_rec = DataRecord("key", "value", create_time=now, ttl_seconds=1000)
         sleep(0.1)
         self.assertTrue(data_rec.is_expired(max_idle_seconds=0.05))
 
+    def test_DataRecord_slots(self):
+        data_rec = DataRecord("key", "value")
+        with self.assertRaises(AttributeError):
+            data_rec.__dict__
+
+    def test_DataRecord_timestamps_in_millis(self):
+        data_rec = DataRecord("key", "value", create_time=1000, ttl_seconds=1.5)
+        self.assertEqual(1000, data_rec.create_time)
+        self.assertEqual(1000, data_rec.last_access_time)
+        self.assertEqual(2500, data_rec.expiration_time)
+
+    def test_DataRecord_repr(self):
+        data_rec = DataRecord("key", "value", create_time=1000, ttl_seconds=1.5)
+        self.assertEqual(
+            "DataRecord(key=key, value=value, create_time=1000, "
+            "expiration_time=2500, last_access_time=1000, access_hit=0)",
+            repr(data_rec),
+        )
+
+        data_rec = DataRecord("key", "value", create_time=0)
+        self.assertEqual("DataRecord(key=key, value=value, access_hit=0)", repr(data_rec))
+
+    def test_no_time_bookkeeping_without_expiration(self):
+        near_cache = self.create_near_cache(
+            self.service,
+            InMemoryFormat.OBJECT,
+            None,
+            None,
+            EvictionPolicy.LRU,
+            100,
+            eviction_strategy=EvictionStrategy.EXACT,
+        )
+        near_cache["key"] = "value"
+        self.assertEqual("value", near_cache["key"])
+        record = dict.__getitem__(near_cache, "key")
+        self.assertEqual(0, record.create_time)
+        self.assertEqual(0, record.last_access_time)
+        self.assertEqual(0, record.access_hit)
+        self.assertIsNone(record.expiration_time)
+
+    def test_access_time_tracked_with_max_idle(self):
+        near_cache = self.create_near_cache(
+            self.service, InMemoryFormat.OBJECT, None, 1000, EvictionPolicy.LFU, 100
+        )
+        near_cache["key"] = "value"
+        record = dict.__getitem__(near_cache, "key")
+        record.last_access_time -= 100
+        last_access_time = record.last_access_time
+        self.assertEqual("value", near_cache["key"])
+        self.assertGreater(record.last_access_time, last_access_time)
+        self.assertEqual(1, record.access_hit)
+
+    def test_owned_entry_memory_cost(self):
+        near_cache = self.create_near_cache(
+            self.service, InMemoryFormat.BINARY, None, None, EvictionPolicy.LRU, 1000
+        )
+        empty_cost = near_cache.get_statistics()["owned_entry_memory_cost"]
+        keys = [self.service.to_data("key-%d" % i) for i in range(100)]
+        for key in keys:
+            near_cache[key] = "x" * 1000
+
+        cost = near_cache.get_statistics()["owned_entry_memory_cost"]
+        self.assertGreater(cost - empty_cost, 100 * 1000)
+
+        # Overwriting the entries does not change the cost
+        for key in keys:
+            near_cache[key] = "x" * 1000
+        self.assertEqual(cost, near_cache.get_statistics()["owned_entry_memory_cost"])
+
+        for key in keys[:50]:
+            near_cache._invalidate(key)
+        half_cost = near_cache.get_statistics()["owned_entry_memory_cost"]
+        self.assertLess(half_cost - empty_cost, (cost - empty_cost) * 0.6)
+
+        near_cache._clear()
+        self.assertGreaterEqual(
+            empty_cost * 1.1, near_cache.get_statistics()["owned_entry_memory_cost"]
+        )
+
     def test_put_get_data(self):
         near_cache = self.create_near_cache(
             self.service, InMemoryFormat.BINARY, 1000, 1000, EvictionPolicy.LRU, 1000
@@ -151,6 +235,391 @@ class NearCacheTestCase(unittest.TestCase):
         self.assertEqual(expire, 0)
         self.assertGreaterEqual(evict, 100)
 
+    def test_exact_LRU(self):
+        near_cache = self.create_near_cache(
+            self.service,
+            InMemoryFormat.BINARY,
+            None,
+            None,
+            EvictionPolicy.LRU,
+            100,
+            eviction_strategy=EvictionStrategy.EXACT,
+        )
+        keys = [self.service.to_data("key-%d" % i) for i in range(200)]
+        for i in range(100):
+            near_cache[keys[i]] = "value-%d" % i
+
+        # Access the first half, so that the second half is evicted first
+        for i in range(50):
+            self.assertEqual("value-%d" % i, near_cache[keys[i]])
+
+        for i in range(100, 150):
+            near_cache[keys[i]] = "value-%d" % i
+
+        self.assertEqual(100, len(near_cache))
+        self.assertEqual(50, near_cache.get_statistics()["evictions"])
+        for i in range(50):
+            self.assertIn(keys[i], near_cache)
+        for i in range(50, 100):
+            self.assertNotIn(keys[i], near_cache)
+
+    def test_exact_LFU(self):
+        near_cache = self.create_near_cache(
+            self.service,
+            InMemoryFormat.OBJECT,
+            None,
+            None,
+            EvictionPolicy.LFU,
+            100,
+            eviction_strategy=EvictionStrategy.EXACT,
+        )
+        for i in range(100):
+            near_cache["key-%d" % i] = "value-%d" % i
+            for _ in range(i % 10):
+                near_cache["key-%d" % i]
+
+        # Each put evicts one of the least frequently used entries,
+        # including the previously put ones that are never accessed.
+        for i in range(100, 110):
+            near_cache["key-%d" % i] = "value-%d" % i
+
+        self.assertEqual(100, len(near_cache))
+        self.assertEqual(10, near_cache.get_statistics()["evictions"])
+        for i in range(100):
+            self.assertEqual(i % 10 != 0, "key-%d" % i in near_cache)
+
+    def test_exact_eviction_after_invalidations(self):
+        near_cache = self.create_near_cache(
+            self.service,
+            InMemoryFormat.OBJECT,
+            None,
+            None,
+            EvictionPolicy.LFU,
+            10,
+            eviction_strategy=EvictionStrategy.EXACT,
+        )
+        for i in range(10):
+            near_cache["key-%d" % i] = "value-%d" % i
+            for _ in range(i):
+                near_cache["key-%d" % i]
+
+        near_cache._invalidate("key-0")
+        near_cache["key-10"] = "value-10"
+        near_cache["key-11"] = "value-11"
+        self.assertNotIn("key-10", near_cache)
+        for i in range(1, 10):
+            self.assertIn("key-%d" % i, near_cache)
+
+        near_cache.clear()
+        near_cache["key-11"] = "value-11"
+        self.assertEqual("value-11", near_cache["key-11"])
+
+    def test_exact_eviction_of_expired_record(self):
+        near_cache = self.create_near_cache(
+            self.service,
+            InMemoryFormat.OBJECT,
+            0.05,
+            None,
+            EvictionPolicy.LRU,
+            10,
+            eviction_strategy=EvictionStrategy.EXACT,
+        )
+        for i in range(10):
+            near_cache["key-%d" % i] = "value-%d" % i
+
+        sleep(0.1)
+        near_cache["key-10"] = "value-10"
+        stats = near_cache.get_statistics()
+        self.assertEqual(0, stats["evictions"])
+        self.assertEqual(1, stats["expirations"])
+        self.assertNotIn("key-0", near_cache)
+
+    def test_concurrent_exact_eviction_and_invalidations(self):
+        near_cache = self.create_near_cache(
+            self.service,
+            InMemoryFormat.OBJECT,
+            None,
+            None,
+            EvictionPolicy.LRU,
+            50,
+            eviction_strategy=EvictionStrategy.EXACT,
+        )
+        errors = []
+
+        def run(op):
+            try:
+                for i in range(5000):
+                    op("key-%d" % (i % 200))
+            except Exception as e:
+                errors.append(e)
+
+        def put(key):
+            near_cache[key] = key
+
+        def get(key):
+            try:
+                near_cache[key]
+            except KeyError:
+                pass
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [
+                threading.Thread(target=run, args=(op,))
+                for op in (put, put, get, near_cache._invalidate)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual([], errors)
+        self.assertLessEqual(len(near_cache), 50)
+        self.assertEqual(set(near_cache.keys()), set(near_cache._eviction_index._keys))
+        self.assertEqual(
+            sum(record.size for record in near_cache.values()),
+            near_cache._used_memory_size,
+        )
+
+    def test_used_memory_size_of_binary_entries(self):
+        near_cache = self.create_near_cache(
+            self.service, InMemoryFormat.BINARY, None, None, EvictionPolicy.LRU, 1000
+        )
+        key = self.service.to_data("key")
+        value = self.service.to_data("x" * 100)
+        near_cache[key] = "x" * 100
+        entry_size = key.total_size() + value.total_size()
+        self.assertEqual(entry_size, near_cache.get_statistics()["used_memory_size"])
+
+        near_cache[key] = "x" * 100
+        self.assertEqual(entry_size, near_cache.get_statistics()["used_memory_size"])
+
+        near_cache._invalidate(key)
+        self.assertEqual(0, near_cache.get_statistics()["used_memory_size"])
+
+    def test_used_memory_size_eviction(self):
+        for strategy in (EvictionStrategy.SAMPLING, EvictionStrategy.EXACT):
+            near_cache = self.create_near_cache(
+                self.service,
+                InMemoryFormat.BINARY,
+                None,
+                None,
+                EvictionPolicy.LRU,
+                10000,
+                eviction_strategy=strategy,
+                eviction_max_size_policy=EvictionMaxSizePolicy.USED_MEMORY_SIZE,
+            )
+            for i in range(100):
+                near_cache[self.service.to_data(i)] = "x" * (100 + i * 10)
+                self.assertLessEqual(near_cache.get_statistics()["used_memory_size"], 10000)
+
+            stats = near_cache.get_statistics()
+            self.assertGreater(stats["evictions"], 0)
+            self.assertGreater(stats["used_memory_size"], 10000 - 2000)
+            self.assertEqual(
+                sum(
+                    record.key.total_size() + record.value.total_size()
+                    for record in near_cache.values()
+                ),
+                stats["used_memory_size"],
+            )
+
+    def test_used_memory_size_eviction_of_large_entry(self):
+        near_cache = self.create_near_cache(
+            self.service,
+            InMemoryFormat.OBJECT,
+            None,
+            None,
+            EvictionPolicy.LFU,
+            100,
+            eviction_strategy=EvictionStrategy.EXACT,
+            eviction_max_size_policy=EvictionMaxSizePolicy.USED_MEMORY_SIZE,
+            object_sizer=len,
+        )
+        for i in range(10):
+            near_cache["k%d" % i] = "x" * 8
+        self.assertEqual(100, near_cache.get_statistics()["used_memory_size"])
+
+        near_cache["large"] = "x" * 60
+        self.assertEqual(4, len(near_cache))
+        self.assertEqual(3 * 10 + 5 + 60, near_cache.get_statistics()["used_memory_size"])
+        for i in range(7):
+            self.assertNotIn("k%d" % i, near_cache)
+
+    def test_used_memory_size_entry_larger_than_max_size(self):
+        near_cache = self.create_near_cache(
+            self.service,
+            InMemoryFormat.OBJECT,
+            None,
+            None,
+            EvictionPolicy.LRU,
+            100,
+            eviction_strategy=EvictionStrategy.EXACT,
+            eviction_max_size_policy=EvictionMaxSizePolicy.USED_MEMORY_SIZE,
+            object_sizer=len,
+        )
+        for i in range(10):
+            near_cache["k%d" % i] = "x" * 8
+
+        near_cache["large"] = "x" * 100
+        self.assertNotIn("large", near_cache)
+        self.assertEqual(10, len(near_cache))
+        self.assertEqual(100, near_cache.get_statistics()["used_memory_size"])
+
+        # The previous value is removed
+        near_cache["k0"] = "x" * 100
+        self.assertNotIn("k0", near_cache)
+        self.assertEqual(9, len(near_cache))
+        self.assertEqual(90, near_cache.get_statistics()["used_memory_size"])
+        self.assertEqual(0, near_cache.get_statistics()["evictions"])
+
+    def test_used_memory_size_overwrite(self):
+        near_cache = self.create_near_cache(
+            self.service,
+            InMemoryFormat.OBJECT,
+            None,
+            None,
+            EvictionPolicy.LRU,
+            100,
+            eviction_strategy=EvictionStrategy.EXACT,
+            eviction_max_size_policy=EvictionMaxSizePolicy.USED_MEMORY_SIZE,
+            object_sizer=len,
+        )
+        for i in range(10):
+            near_cache["k%d" % i] = "x" * 8
+
+        # Replaces the previous value of the same size, without evicting
+        near_cache["k0"] = "y" * 8
+        self.assertEqual(10, len(near_cache))
+        self.assertEqual(0, near_cache.get_statistics()["evictions"])
+        self.assertEqual("y" * 8, near_cache["k0"])
+
+        # Evicts only the least recently used entry to make room for the
+        # difference of the sizes
+        near_cache["k9"] = "y" * 10
+        self.assertEqual(9, len(near_cache))
+        self.assertEqual(1, near_cache.get_statistics()["evictions"])
+        self.assertNotIn("k1", near_cache)
+        self.assertEqual(100 - 10 - 10 + 12, near_cache.get_statistics()["used_memory_size"])
+
+    def test_object_sizer(self):
+        sizes = []
+
+        def sizer(obj):
+            sizes.append(obj)
+            return 10
+
+        near_cache = self.create_near_cache(
+            self.service,
+            InMemoryFormat.OBJECT,
+            None,
+            None,
+            EvictionPolicy.LRU,
+            1000,
+            object_sizer=sizer,
+        )
+        key = self.service.to_data("key")
+        near_cache[key] = "value"
+        self.assertEqual(["value"], sizes)
+        self.assertEqual(key.total_size() + 10, near_cache.get_statistics()["used_memory_size"])
+
+    def test_sizes_of_mutated_values(self):
+        near_cache = self.create_near_cache(
+            self.service, InMemoryFormat.OBJECT, None, None, EvictionPolicy.LRU, 1000
+        )
+        key = self.service.to_data("key")
+        near_cache[key] = []
+        empty_cost = near_cache.get_statistics()["owned_entry_memory_cost"]
+        near_cache[key].extend(range(1000))
+        near_cache["other-key"] = []
+
+        # The sizes put are subtracted, not the sizes of the mutated value
+        near_cache._invalidate(key)
+        self.assertEqual(
+            near_cache._get_size("other-key") + near_cache._get_size([]),
+            near_cache.get_statistics()["used_memory_size"],
+        )
+        near_cache._invalidate("other-key")
+        stats = near_cache.get_statistics()
+        self.assertEqual(0, stats["used_memory_size"])
+        self.assertLess(stats["owned_entry_memory_cost"], empty_cost)
+        self.assertEqual(0, near_cache._entries_memory_cost)
+
+    def test_incremental_expiration(self):
+        near_cache = self.create_near_cache(
+            self.service, InMemoryFormat.OBJECT, 0.05, None, EvictionPolicy.LRU, 1000
+        )
+        for i in range(100):
+            near_cache["key-%d" % i] = "value-%d" % i
+
+        sleep(0.1)
+        near_cache["fresh"] = "value"
+        near_cache._do_expiration(40)
+        self.assertEqual(40, near_cache.get_statistics()["expirations"])
+        self.assertEqual(61, len(near_cache))
+
+        near_cache._do_expiration(40)
+        near_cache._do_expiration(40)
+        self.assertEqual(100, near_cache.get_statistics()["expirations"])
+        self.assertEqual(["fresh"], list(near_cache.keys()))
+
+        # Starts a new sweep after the previous one is completed
+        near_cache._do_expiration(40)
+        self.assertEqual(["fresh"], list(near_cache.keys()))
+
+    def test_incremental_expiration_without_expiry(self):
+        near_cache = self.create_near_cache(
+            self.service, InMemoryFormat.OBJECT, None, None, EvictionPolicy.LRU, 1000
+        )
+        near_cache["key"] = "value"
+        near_cache._do_expiration(10)
+        self.assertEqual(1, len(near_cache))
+        self.assertIsNone(near_cache._expiration_keys)
+
+    def test_incremental_expiration_after_changes(self):
+        near_cache = self.create_near_cache(
+            self.service, InMemoryFormat.OBJECT, 0.05, None, EvictionPolicy.LRU, 1000
+        )
+        for i in range(10):
+            near_cache["key-%d" % i] = "value-%d" % i
+
+        sleep(0.1)
+        near_cache._do_expiration(2)
+        near_cache._invalidate("key-5")
+        near_cache["key-6"] = "value-6"  # Replaced with a fresh record
+        near_cache._do_expiration(100)
+        self.assertEqual(["key-6"], list(near_cache.keys()))
+        self.assertEqual(8, near_cache.get_statistics()["expirations"])
+
+    def test_expiration_snapshot_is_released(self):
+        near_cache = self.create_near_cache(
+            self.service, InMemoryFormat.OBJECT, 1000, None, EvictionPolicy.LRU, 1000
+        )
+        for i in range(10):
+            near_cache["key-%d" % i] = "value-%d" % i
+
+        near_cache._do_expiration(4)
+        keys = near_cache._expiration_keys
+        self.assertEqual([None] * 4, keys[:4])
+        self.assertEqual(["key-%d" % i for i in range(4, 10)], keys[4:])
+
+        near_cache._clear()
+        self.assertIsNone(near_cache._expiration_keys)
+
+        near_cache["key"] = "value"
+        near_cache._do_expiration(4)
+        self.assertIsNone(near_cache._expiration_keys)
+
+        for i in range(10):
+            near_cache["key-%d" % i] = "value-%d" % i
+        near_cache._do_expiration(4)
+        self.assertIsNotNone(near_cache._expiration_keys)
+        near_cache.clear()
+        self.assertIsNone(near_cache._expiration_keys)
+
     def create_near_cache(
         self,
         service,
@@ -161,6 +630,9 @@ class NearCacheTestCase(unittest.TestCase):
         max_size,
         eviction_sampling_count=None,
         eviction_sampling_pool_size=None,
+        eviction_strategy=EvictionStrategy.SAMPLING,
+        eviction_max_size_policy=EvictionMaxSizePolicy.ENTRY_COUNT,
+        object_sizer=None,
     ):
         return NearCache(
             "default",
@@ -173,4 +645,186 @@ class NearCacheTestCase(unittest.TestCase):
             max_size,
             eviction_sampling_count,
             eviction_sampling_pool_size,
+            eviction_strategy,
+            eviction_max_size_policy,
+            object_sizer,
+        )
+
+
+class RepairingTaskTest(unittest.TestCase):
+    def setUp(self):
+        self.service = SerializationServiceV1(Config())
+        self.partition_service = MagicMock()
+        self.partition_service.get_partition_id.return_value = 0
+        self.reactor = MagicMock()
+        self.invocation_service = MagicMock()
+        self.cluster_service = MagicMock()
+        self.cluster_service.get_members.return_value = []
+        config = Config()
+        config.near_cache_max_tolerated_miss_count = 2
+        self.task = RepairingTask(
+            config,
+            self.reactor,
+            self.invocation_service,
+            self.cluster_service,
+            self.partition_service,
+            self.service,
+        )
+        self.handler = self.task.register_and_get_handler("default")
+        self.near_cache = NearCache(
+            "default",
+            self.service,
+            InMemoryFormat.BINARY,
+            None,
+            None,
+            True,
+            EvictionPolicy.LRU,
+            100,
         )
+        self.near_cache.repairing_handler = self.handler
+        self.key = self.service.to_data("key")
+
+    def tearDown(self):
+        self.service.destroy()
+
+    def test_register_schedules_task(self):
+        self.assertIs(self.handler, self.task.register_and_get_handler("default"))
+        self.reactor.add_timer.assert_called_once()
+
+    def test_deregister_cancels_task(self):
+        timer = self.reactor.add_timer.return_value
+        self.task.deregister_handler("default")
+        timer.cancel.assert_called_once()
+
+    def test_record_is_stamped(self):
+        partition_uuid = uuid.uuid4()
+        self.handler.handle(self.service.to_data("other"), partition_uuid, 5)
+        self.near_cache[self.key] = "value"
+        record = dict.__getitem__(self.near_cache, self.key)
+        self.assertEqual(0, record.partition_id)
+        self.assertEqual(5, record.invalidation_sequence)
+        self.assertEqual(partition_uuid, record.uuid)
+        self.assertEqual("value", self.near_cache[self.key])
+
+    def test_partition_uuid_change_makes_record_stale(self):
+        self.handler.handle(self.service.to_data("other"), uuid.uuid4(), 1)
+        self.near_cache[self.key] = "value"
+        self.handler.handle(self.service.to_data("other"), uuid.uuid4(), 1)
+        with self.assertRaises(KeyError):
+            self.near_cache[self.key]
+        self.assertEqual(0, len(self.near_cache))
+        self.assertEqual(1, self.near_cache.get_statistics()["invalidations"])
+
+    def test_tolerated_missed_sequences(self):
+        partition_uuid = uuid.uuid4()
+        self.handler.handle(self.service.to_data("other"), partition_uuid, 1)
+        self.near_cache[self.key] = "value"
+        self.handler.handle(self.service.to_data("other"), partition_uuid, 3)
+        self.assertEqual(1, self.handler.get_missed_sequence_count())
+        self.task._run()
+        self.assertEqual("value", self.near_cache[self.key])
+
+    def test_missed_sequences_above_tolerated_count_make_record_stale(self):
+        partition_uuid = uuid.uuid4()
+        self.handler.handle(self.service.to_data("other"), partition_uuid, 1)
+        self.near_cache[self.key] = "value"
+        self.handler.handle(self.service.to_data("other"), partition_uuid, 5)
+        self.assertEqual(3, self.handler.get_missed_sequence_count())
+        self.task._run()
+        self.assertEqual(0, self.handler.get_missed_sequence_count())
+        with self.assertRaises(KeyError):
+            self.near_cache[self.key]
+
+        # The records put after the repair are not stale
+        self.near_cache[self.key] = "value"
+        self.assertEqual("value", self.near_cache[self.key])
+
+    def test_initial_metadata(self):
+        partition_uuid = uuid.uuid4()
+        future = MagicMock()
+        future.result.return_value = {
+            "name_partition_sequence_list": [("default", [(0, 42)])],
+            "partition_uuid_list": [(0, partition_uuid)],
+        }
+        self.task._handle_metadata(future, [self.handler], True)
+        container = self.handler.get_meta_data_container(0)
+        self.assertEqual(partition_uuid, container.uuid)
+        self.assertEqual(42, container.sequence)
+        self.assertEqual(0, container.missed_sequence_count)
+
+    def test_anti_entropy_metadata(self):
+        partition_uuid = uuid.uuid4()
+        self.handler.handle(self.service.to_data("other"), partition_uuid, 1)
+        self.near_cache[self.key] = "value"
+        future = MagicMock()
+        future.result.return_value = {
+            "name_partition_sequence_list": [("default", [(0, 4)])],
+            "partition_uuid_list": [(0, partition_uuid)],
+        }
+        self.task._handle_metadata(future, [self.handler], False)
+        self.assertEqual(3, self.handler.get_missed_sequence_count())
+        self.task._run()
+        with self.assertRaises(KeyError):
+            self.near_cache[self.key]
+
+    def test_fetch_metadata_from_data_members(self):
+        data_member = MagicMock(lite_member=False, uuid=uuid.uuid4())
+        self.cluster_service.get_members.side_effect = lambda selector: [
+            m for m in [data_member, MagicMock(lite_member=True)] if selector(m)
+        ]
+        self.task._fetch_metadata([self.handler], False)
+        self.invocation_service.invoke.assert_called_once()
+        invocation = self.invocation_service.invoke.call_args[0][0]
+        self.assertEqual(data_member.uuid, invocation.uuid)
+
+
+class ExpirationTaskTest(unittest.TestCase):
+    def setUp(self):
+        self.service = SerializationServiceV1(Config())
+        self.reactor = MagicMock()
+        self.task = ExpirationTask(self.reactor)
+
+    def tearDown(self):
+        self.service.destroy()
+
+    def test_register_schedules_task(self):
+        near_cache = MagicMock()
+        self.task.register(near_cache)
+        self.task.register(MagicMock())
+        self.reactor.add_timer.assert_called_once_with(ExpirationTask._RUN_PERIOD, self.task._run)
+
+        self.task._run()
+        near_cache._do_expiration.assert_called_once_with(ExpirationTask._MAX_RECORDS_PER_RUN)
+        self.assertEqual(2, self.reactor.add_timer.call_count)
+
+    def test_deregister_cancels_task(self):
+        near_cache = MagicMock()
+        near_cache.name = "a"
+        self.task.register(near_cache)
+        timer = self.reactor.add_timer.return_value
+        self.task.deregister("a")
+        timer.cancel.assert_called_once()
+
+    def test_run_survives_errors(self):
+        near_cache = MagicMock()
+        near_cache._do_expiration.side_effect = RuntimeError("expected")
+        self.task.register(near_cache)
+        self.task._run()
+        self.assertEqual(2, self.reactor.add_timer.call_count)
+
+    def test_manager_registers_expirable_near_caches(self):
+        config = Config()
+        config.near_caches = {
+            "expirable": {"time_to_live": 10, "invalidate_on_change": False},
+            "idle": {"max_idle": 10, "invalidate_on_change": False},
+            "other": {"invalidate_on_change": False},
+        }
+        manager = NearCacheManager(config, self.service)
+        manager.init(self.reactor, MagicMock(), MagicMock(), MagicMock())
+        for name in ("expirable", "idle", "other"):
+            manager.get_or_create_near_cache(name)
+
+        self.assertEqual({"expirable", "idle"}, set(manager._expiration_task._near_caches.keys()))
+
+        manager.destroy_near_caches()
+        self.reactor.add_timer.return_value.cancel.assert_called_once()
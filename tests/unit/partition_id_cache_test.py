@@ -0,0 +1,83 @@
+import unittest
+import uuid
+
+from hazelcast.config import Config
+from hazelcast.partition import PartitionService, _InternalPartitionService, _KeyData
+from hazelcast.serialization import SerializationServiceV1
+
+
+class PartitionIdCacheTest(unittest.TestCase):
+    def setUp(self):
+        config = Config()
+        config.partition_id_cache_size = 3
+        self.serialization_service = SerializationServiceV1(config)
+        self.service = _InternalPartitionService(None, config, self.serialization_service)
+        self.service.check_and_set_partition_count(271)
+        self.cache = self.service.key_cache
+
+    def test_cacheable_keys(self):
+        for key in ("key", 42, b"key", uuid.uuid4()):
+            key_data = self.service.to_key_data(key)
+            self.assertIsInstance(key_data, _KeyData)
+            self.assertIs(key_data, self.service.to_key_data(key))
+            self.assertEqual(self.serialization_service.to_data(key), key_data)
+            self.assertEqual(hash(self.serialization_service.to_data(key)), hash(key_data))
+
+        self.assertEqual(4, self.cache.hits)
+        self.assertEqual(4, self.cache.misses)
+        self.assertEqual(0.5, self.cache.hit_ratio)
+
+    def test_non_cacheable_keys(self):
+        for key in (True, 1.5, ("a", "b")):
+            key_data = self.service.to_key_data(key)
+            self.assertNotIsInstance(key_data, _KeyData)
+
+        self.assertEqual(0, self.cache.size)
+        self.assertEqual(0, self.cache.hits + self.cache.misses)
+
+    def test_bool_does_not_hit_int(self):
+        int_data = self.service.to_key_data(1)
+        bool_data = self.service.to_key_data(True)
+        self.assertNotEqual(int_data, bool_data)
+
+    def test_partition_ids(self):
+        for i in range(100):
+            key = "key-%s" % i
+            expected = self.service.get_partition_id(self.serialization_service.to_data(key))
+            self.assertEqual(expected, self.service.get_partition_id(self.service.to_key_data(key)))
+            self.assertEqual(expected, self.service.get_partition_id(self.service.to_key_data(key)))
+
+    def test_least_recently_used_key_is_evicted(self):
+        for key in ("a", "b", "c"):
+            self.service.to_key_data(key)
+
+        self.service.to_key_data("a")  # "b" becomes the least recently used key
+        self.service.to_key_data("d")
+
+        self.assertEqual(3, self.cache.size)
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
+        self.assertIsNotNone(self.cache.get("d"))
+
+    def test_cache_is_cleared_when_partition_count_changes(self):
+        config = Config()
+        config.partition_id_cache_size = 3
+        service = _InternalPartitionService(None, config, self.serialization_service)
+        service.to_key_data("a")
+        self.assertEqual(1, service.key_cache.size)
+
+        service.check_and_set_partition_count(271)
+        self.assertEqual(0, service.key_cache.size)
+
+    def test_public_service_uses_cache(self):
+        public_service = PartitionService(self.service, self.serialization_service, None)
+        partition_id = public_service.get_partition_id("a")
+        self.assertEqual(partition_id, public_service.get_partition_id("a"))
+        self.assertEqual([partition_id], public_service.get_partition_ids(["a"]))
+        self.assertEqual(2, self.cache.hits)
+
+    def test_disabled(self):
+        service = _InternalPartitionService(None, Config(), self.serialization_service)
+        self.assertIsNone(service.key_cache)
+        self.assertNotIsInstance(service.to_key_data("a"), _KeyData)
@@ -0,0 +1,565 @@
+import asyncio
+import threading
+import unittest
+import uuid
+
+from mock import MagicMock, patch
+
+from hazelcast.config import Config
+from hazelcast.connection import _Reader
+from hazelcast.future import Future, ImmediateExceptionFuture, ImmediateFuture
+from hazelcast.internal.asyncio_proxy.map import Map as AsyncioMap
+from hazelcast.partition import _InternalPartitionService
+from hazelcast.predicate import equal, paging
+from hazelcast.protocol.builtin import (
+    DataCodec,
+    EntryListCodec,
+    EntryListIntegerIntegerCodec,
+    FixSizedTypesCodec,
+    ListMultiFrameCodec,
+    StringCodec,
+)
+from hazelcast.protocol.client_message import (
+    REQUEST_HEADER_SIZE,
+    SIZE_OF_FRAME_LENGTH_AND_FLAGS,
+    create_initial_buffer,
+)
+from hazelcast.protocol.codec import (
+    map_add_entry_listener_codec,
+    map_fetch_entries_codec,
+    map_fetch_with_query_codec,
+)
+from hazelcast.proxy.base import EntryEventType
+from hazelcast.proxy.map import Map
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.util import LazyDict
+
+PARTITION_COUNT = 7
+
+
+def _create_context(config=None):
+    config = config or Config()
+    serialization_service = SerializationServiceV1(config)
+    partition_service = _InternalPartitionService(None, config, serialization_service)
+    partition_service.check_and_set_partition_count(PARTITION_COUNT)
+    return MagicMock(
+        config=config,
+        serialization_service=serialization_service,
+        partition_service=partition_service,
+    )
+
+
+def _to_inbound_message(buf):
+    reader = _Reader(None)
+    reader.read(buf)
+    return reader._read_message()
+
+
+class _FakePartitions:
+    """Responds to the fetch entries requests from the given entries,
+    using the indexes of the entries as the iteration pointers."""
+
+    def __init__(self, serialization_service, entries_per_partition):
+        to_data = serialization_service.to_data
+        self.partitions = [
+            [(to_data(key), to_data(value)) for key, value in entries]
+            for entries in entries_per_partition
+        ]
+        self.requests = []
+
+    def respond(self, request, partition_id):
+        message = _to_inbound_message(request.buf)
+        message_type = message.get_message_type()
+        page_size = FixSizedTypesCodec.decode_int(
+            message.next_frame().buf, REQUEST_HEADER_SIZE - SIZE_OF_FRAME_LENGTH_AND_FLAGS
+        )
+        StringCodec.decode(message)
+        pointers = EntryListIntegerIntegerCodec.decode(message)
+        self.requests.append((message_type, partition_id, pointers))
+
+        index = pointers[-1][0]
+        start = 0 if index == 2147483647 else index
+        entries = self.partitions[partition_id][start : start + page_size]
+        end = start + len(entries)
+        next_index = end if end < len(self.partitions[partition_id]) else -1
+
+        buf = create_initial_buffer(REQUEST_HEADER_SIZE, 0)
+        if message_type == map_fetch_entries_codec._REQUEST_MESSAGE_TYPE:
+            EntryListIntegerIntegerCodec.encode(buf, [(next_index, -1)])
+            EntryListCodec.encode(buf, entries, DataCodec.encode, DataCodec.encode, True)
+        else:
+            ListMultiFrameCodec.encode(buf, [], DataCodec.encode)
+            EntryListIntegerIntegerCodec.encode(buf, [(next_index, -1)], True)
+        return _to_inbound_message(buf)
+
+
+class _InFlightCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.current = 0
+        self.max = 0
+
+    def increment(self):
+        with self._lock:
+            self.current += 1
+            self.max = max(self.max, self.current)
+
+    def decrement(self):
+        with self._lock:
+            self.current -= 1
+
+
+class MapStreamingTest(unittest.TestCase):
+    def setUp(self):
+        self.map = Map("hz:impl:mapService", "map", _create_context())
+        self.in_flight = _InFlightCounter()
+        self.batches = []
+
+    def complete_later(self, result):
+        self.in_flight.increment()
+        future = Future()
+
+        def complete():
+            self.in_flight.decrement()
+            future.set_result(result)
+
+        threading.Timer(0.001, complete).start()
+        return future
+
+    def test_set_many(self):
+        def put_all(partition_id, entry_list):
+            self.batches.append((partition_id, entry_list))
+            return self.complete_later(None)
+
+        self.map._put_all_internal = put_all
+        entries = (("key-%s" % i, i) for i in range(1000))
+
+        stored = self.map.set_many(entries, batch_size=10, max_in_flight=3).result()
+
+        self.assertEqual(1000, stored)
+        self.assertLessEqual(self.in_flight.max, 3)
+        self.assertEqual(1000, sum(len(entry_list) for _, entry_list in self.batches))
+        partition_service = self.map._context.partition_service
+        for partition_id, entry_list in self.batches:
+            self.assertLessEqual(len(entry_list), 10)
+            for key_data, _ in entry_list:
+                self.assertEqual(partition_id, partition_service.get_partition_id(key_data))
+
+    def test_set_many_reports_batches(self):
+        error = RuntimeError("expected")
+
+        def put_all(partition_id, entry_list):
+            if partition_id == 0:
+                return ImmediateExceptionFuture(error)
+            return self.complete_later(None)
+
+        self.map._put_all_internal = put_all
+        reported = []
+        entries = [("key-%s" % i, i) for i in range(100)]
+
+        future = self.map.set_many(
+            entries, batch_size=5, batch_func=lambda keys, e: reported.append((keys, e))
+        )
+
+        with self.assertRaises(RuntimeError):
+            future.result()
+
+        self.assertCountEqual(
+            [key for key, _ in entries], [k for keys, _ in reported for k in keys]
+        )
+        failed = [k for keys, e in reported if e is error for k in keys]
+        self.assertTrue(failed)
+        self.assertEqual(100 - len(failed), sum(len(keys) for keys, e in reported if e is None))
+
+    def test_set_many_when_no_entries(self):
+        self.assertEqual(0, self.map.set_many(iter([])).result())
+
+    def test_get_many(self):
+        def get_all(partition_to_keys):
+            self.assertEqual(1, len(partition_to_keys))
+            keys = next(iter(partition_to_keys.values()))
+            self.assertLessEqual(len(keys), 10)
+            # Odd keys are missing
+            return self.complete_later({key: key * 2 for key in keys if key % 2 == 0})
+
+        self.map._get_all_internal = get_all
+
+        entries = list(self.map.get_many(iter(range(1000)), batch_size=10, max_in_flight=3))
+
+        self.assertCountEqual([(key, key * 2) for key in range(0, 1000, 2)], entries)
+        self.assertLessEqual(self.in_flight.max, 3)
+
+    def test_get_many_error(self):
+        self.map._get_all_internal = lambda _: ImmediateExceptionFuture(RuntimeError("expected"))
+        with self.assertRaises(RuntimeError):
+            list(self.map.get_many(range(10)))
+
+
+class MapBulkRequestChunkingTest(unittest.TestCase):
+    def create_map(self, max_entries=-1, max_bytes=-1):
+        config = Config()
+        config.bulk_request_max_entries = max_entries
+        config.bulk_request_max_bytes = max_bytes
+        return Map("hz:impl:mapService", "map", _create_context(config))
+
+    def put_all(self, m, entries):
+        requests = []
+
+        def put_all_internal(partition_id, entry_list):
+            requests.append((partition_id, entry_list))
+            return ImmediateFuture(None)
+
+        m._put_all_internal = put_all_internal
+        m.put_all(entries).result()
+        return requests
+
+    def test_put_all_without_limits(self):
+        requests = self.put_all(self.create_map(), {i: i for i in range(100)})
+        self.assertEqual(PARTITION_COUNT, len(requests))
+
+    def test_put_all_with_max_entries(self):
+        requests = self.put_all(self.create_map(max_entries=3), {i: i for i in range(100)})
+        self.assertEqual(100, sum(len(entry_list) for _, entry_list in requests))
+        self.assertTrue(all(len(entry_list) <= 3 for _, entry_list in requests))
+        self.assertGreater(len(requests), PARTITION_COUNT)
+
+    def test_put_all_with_max_bytes(self):
+        entries = {i: "x" * 100 for i in range(100)}
+        requests = self.put_all(self.create_map(max_bytes=500), entries)
+        self.assertEqual(100, sum(len(entry_list) for _, entry_list in requests))
+        for _, entry_list in requests:
+            size = sum(k.total_size() + v.total_size() for k, v in entry_list)
+            self.assertLessEqual(size, 500)
+
+    def test_get_all_with_max_entries(self):
+        m = self.create_map(max_entries=3)
+        partitions = []
+
+        def invoke(invocation):
+            partitions.append(invocation.partition_id)
+            invocation.future.set_result([(invocation.partition_id, invocation.partition_id)])
+
+        m._invocation_service = MagicMock(invoke=invoke)
+        result = m.get_all(list(range(100))).result()
+
+        self.assertGreaterEqual(len(partitions), 100 // 3)
+        self.assertEqual(set(partitions), set(result.keys()))
+
+    def test_get_all_with_member_grouping(self):
+        config = Config()
+        config.bulk_request_member_grouping = True
+        m = Map("hz:impl:mapService", "map", _create_context(config))
+        calls = []
+
+        def invoke_all(invocations):
+            calls.append([invocation.partition_id for invocation in invocations])
+            for invocation in invocations:
+                invocation.future.set_result([(invocation.partition_id, invocation.partition_id)])
+
+        m._invocation_service = MagicMock(invoke_all=invoke_all)
+        result = m.get_all(list(range(100))).result()
+
+        self.assertEqual(1, len(calls))
+        self.assertCountEqual(calls[0], result.keys())
+
+
+class MapLazyDeserializationTest(unittest.TestCase):
+    def get_all(self, lazy):
+        config = Config()
+        config.lazy_deserialization = lazy
+        context = _create_context(config)
+        m = Map("hz:impl:mapService", "map", context)
+        to_data = context.serialization_service.to_data
+
+        def invoke(invocation):
+            p = invocation.partition_id
+            invocation.future.set_result([(to_data(p), to_data("value-%s" % p))])
+
+        m._invocation_service = MagicMock(invoke=invoke)
+        return m.get_all(list(range(20))).result()
+
+    def test_get_all(self):
+        result = self.get_all(False)
+        self.assertIsInstance(result, dict)
+        self.assertEqual({p: "value-%s" % p for p in range(PARTITION_COUNT)}, result)
+
+    def test_get_all_with_lazy_deserialization(self):
+        result = self.get_all(True)
+        self.assertIsInstance(result, LazyDict)
+        self.assertEqual("value-3", result[3])
+        self.assertEqual({p: "value-%s" % p for p in range(PARTITION_COUNT)}, result)
+
+
+class MapIteratorTest(unittest.TestCase):
+    def setUp(self):
+        context = _create_context()
+        self.map = Map("hz:impl:mapService", "map", context)
+        entries = [[(p * 100 + i, "value-%s" % i) for i in range(p * 3)] for p in range(7)]
+        self.expected = [entry for partition in entries for entry in partition]
+        self.partitions = _FakePartitions(context.serialization_service, entries)
+
+        def invoke_on_partition(request, partition_id, handler):
+            return ImmediateFuture(handler(self.partitions.respond(request, partition_id)))
+
+        self.map._invoke_on_partition = invoke_on_partition
+
+    def test_iterator(self):
+        self.assertEqual(self.expected, list(self.map.iterator(page_size=4)))
+        # Partition 0 is empty, partition 6 has 18 entries
+        self.assertEqual(
+            [(2147483647, -1)], self.partitions.requests[0][2], "starts from the beginning"
+        )
+        self.assertEqual(
+            sum(max(1, (p * 3 + 3) // 4) for p in range(7)), len(self.partitions.requests)
+        )
+
+    def test_iterator_is_lazy(self):
+        iterator = self.map.iterator(page_size=2)
+        self.assertEqual([], self.partitions.requests)
+        # First partition is empty
+        self.assertEqual(self.expected[0], next(iterator))
+        # Only the next page is fetched
+        self.assertEqual(3, len(self.partitions.requests))
+
+    def test_iterator_with_predicate(self):
+        self.assertEqual([], list(self.map.iterator(predicate=equal("this", 1))))
+        self.assertEqual(7, len(self.partitions.requests))
+        for message_type, _, _ in self.partitions.requests:
+            self.assertEqual(map_fetch_with_query_codec._REQUEST_MESSAGE_TYPE, message_type)
+
+    def test_iterator_with_paging_predicate(self):
+        with self.assertRaises(AssertionError):
+            self.map.iterator(predicate=paging(None, 10))
+
+    def test_iterator_with_invalid_page_size(self):
+        with self.assertRaises(AssertionError):
+            self.map.iterator(page_size=0)
+
+
+class _EventSource:
+    """Collects the entry events handlers registered with a map, and
+    passes the given events to them as if they are decoded from the
+    event messages."""
+
+    def __init__(self, serialization_service, to_object_fn):
+        self._to_data = serialization_service.to_data
+        self.to_object_calls = 0
+        self.handlers = []
+
+        def to_object(data):
+            self.to_object_calls += 1
+            return to_object_fn(data)
+
+        self.to_object = to_object
+
+    def register_listener(
+        self, request, decode_response, encode_deregister_request, handler, striped=False
+    ):
+        self.handlers.append(handler)
+        return ImmediateFuture("registration-id")
+
+    def fire(self, codec, key, value, event_type=EntryEventType.ADDED):
+        def handle(message, handle_entry_event):
+            handle_entry_event(
+                self._to_data(key), self._to_data(value), None, None, event_type, uuid.uuid4(), 1
+            )
+
+        with patch.object(codec, "handle", handle):
+            for handler in self.handlers:
+                handler(None)
+
+
+class MapEntryBatchListenerTest(unittest.TestCase):
+    def setUp(self):
+        self.context = _create_context()
+        self.map = Map("hz:impl:mapService", "map", self.context)
+        self.events = _EventSource(self.context.serialization_service, self.map._to_object)
+        self.map._to_object = self.events.to_object
+        self.map._register_listener = self.events.register_listener
+        self.batches = []
+
+    def test_events_are_delivered_in_batches_of_the_given_size(self):
+        self.map.add_entry_batch_listener(self.batches.append, batch_size=3)
+        for i in range(7):
+            self.events.fire(map_add_entry_listener_codec, i, "value-%s" % i)
+
+        self.assertEqual(2, len(self.batches))
+        self.assertEqual([[0, 1, 2], [3, 4, 5]], [[e.key for e in b] for b in self.batches])
+        self.assertEqual(["value-3", "value-4", "value-5"], [e.value for e in self.batches[1]])
+
+    def test_partial_batch_is_delivered_after_the_max_delay(self):
+        add_timer = self.context.reactor.add_timer
+        self.map.add_entry_batch_listener(self.batches.append, batch_size=10, max_delay=0.5)
+        self.events.fire(map_add_entry_listener_codec, 1, "value")
+        self.events.fire(map_add_entry_listener_codec, 2, "value")
+
+        add_timer.assert_called_once()
+        delay, flush = add_timer.call_args[0]
+        self.assertEqual(0.5, delay)
+        self.assertEqual([], self.batches)
+
+        flush()
+        self.assertEqual([[1, 2]], [[e.key for e in b] for b in self.batches])
+
+    def test_events_are_deserialized_lazily(self):
+        self.map.add_entry_batch_listener(self.batches.append, batch_size=1)
+        self.events.fire(map_add_entry_listener_codec, "key", "value", EntryEventType.UPDATED)
+
+        event = self.batches[0][0]
+        self.assertEqual(EntryEventType.UPDATED, event.event_type)
+        self.assertEqual(0, self.events.to_object_calls)
+        self.assertEqual("key", event.key)
+        self.assertEqual("key", event.key)
+        self.assertEqual(1, self.events.to_object_calls)
+        self.assertIsNone(event.old_value)
+
+    def test_event_types(self):
+        encode = MagicMock(wraps=self.map._encode_entry_listener_request)
+        self.map._encode_entry_listener_request = encode
+        self.map.add_entry_batch_listener(
+            self.batches.append,
+            key="key",
+            event_types=[EntryEventType.ADDED, EntryEventType.REMOVED],
+        )
+        self.map.add_entry_batch_listener(self.batches.append)
+
+        self.assertEqual(
+            EntryEventType.ADDED | EntryEventType.REMOVED, encode.call_args_list[0][0][3]
+        )
+        # All, but the INVALIDATION
+        self.assertEqual(0x2FF, encode.call_args_list[1][0][3])
+
+    def test_pending_events_are_discarded_on_removal(self):
+        add_timer = self.context.reactor.add_timer
+        registration_id = self.map.add_entry_batch_listener(
+            self.batches.append, batch_size=10
+        ).result()
+        self.events.fire(map_add_entry_listener_codec, 1, "value")
+
+        self.map._deregister_listener = MagicMock(return_value=ImmediateFuture(True))
+        self.assertTrue(self.map.remove_entry_listener(registration_id).result())
+        self.map._deregister_listener.assert_called_once_with(registration_id)
+        add_timer.return_value.cancel.assert_called_once()
+
+        # Events received before the deregistration is completed
+        self.events.fire(map_add_entry_listener_codec, 2, "value")
+        add_timer.call_args[0][1]()
+        self.assertEqual([], self.batches)
+        self.assertEqual({}, self.map._event_batchers)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(AssertionError):
+            self.map.add_entry_batch_listener(None)
+
+        with self.assertRaises(AssertionError):
+            self.map.add_entry_batch_listener(self.batches.append, batch_size=0)
+
+        with self.assertRaises(AssertionError):
+            self.map.add_entry_batch_listener(self.batches.append, max_delay=0)
+
+
+class AsyncioMapStreamingTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.map = AsyncioMap("hz:impl:mapService", "map", _create_context())
+        self.in_flight = _InFlightCounter()
+
+    async def test_set_many(self):
+        async def put_all(partition_id, entry_list):
+            self.in_flight.increment()
+            await asyncio.sleep(0.001)
+            self.in_flight.decrement()
+            if partition_id == 0:
+                raise RuntimeError("expected")
+
+        self.map._put_all_internal = put_all
+        reported = []
+        entries = (("key-%s" % i, i) for i in range(1000))
+
+        with self.assertRaises(RuntimeError):
+            await self.map.set_many(
+                entries,
+                batch_size=10,
+                max_in_flight=3,
+                batch_func=lambda keys, e: reported.append((keys, e)),
+            )
+
+        self.assertLessEqual(self.in_flight.max, 3)
+        self.assertEqual(1000, sum(len(keys) for keys, _ in reported))
+
+    async def test_get_many(self):
+        async def get_all(partition_to_keys):
+            self.in_flight.increment()
+            await asyncio.sleep(0.001)
+            self.in_flight.decrement()
+            keys = next(iter(partition_to_keys.values()))
+            return {key: key * 2 for key in keys if key % 2 == 0}
+
+        self.map._get_all_internal = get_all
+
+        entries = [entry async for entry in self.map.get_many(range(1000), 10, 3)]
+
+        self.assertCountEqual([(key, key * 2) for key in range(0, 1000, 2)], entries)
+        self.assertLessEqual(self.in_flight.max, 3)
+
+    async def test_put_all_with_max_entries(self):
+        config = Config()
+        config.bulk_request_max_entries = 3
+        m = AsyncioMap("hz:impl:mapService", "map", _create_context(config))
+        requests = []
+
+        async def put_all(partition_id, entry_list):
+            requests.append(entry_list)
+
+        m._put_all_internal = put_all
+        await m.put_all({i: i for i in range(100)})
+
+        self.assertEqual(100, sum(len(entry_list) for entry_list in requests))
+        self.assertTrue(all(len(entry_list) <= 3 for entry_list in requests))
+
+    async def test_iterator(self):
+        context = _create_context()
+        m = AsyncioMap("hz:impl:mapService", "map", context)
+        entries = [[(p * 100 + i, i) for i in range(p * 3)] for p in range(7)]
+        partitions = _FakePartitions(context.serialization_service, entries)
+
+        def invoke_on_partition(request, partition_id, handler):
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(handler(partitions.respond(request, partition_id)))
+            return future
+
+        m._invoke_on_partition = invoke_on_partition
+
+        result = [entry async for entry in m.iterator(page_size=4)]
+
+        self.assertEqual([entry for partition in entries for entry in partition], result)
+
+    async def test_add_entry_batch_listener(self):
+        context = _create_context()
+        m = AsyncioMap("hz:impl:mapService", "map", context)
+        events = _EventSource(context.serialization_service, m._to_object)
+
+        async def register_listener(*args):
+            return events.register_listener(*args).result()
+
+        m._register_listener = register_listener
+        batches = []
+
+        self.assertEqual(
+            "registration-id", await m.add_entry_batch_listener(batches.append, batch_size=2)
+        )
+        for i in range(3):
+            events.fire(map_add_entry_listener_codec, i, i)
+
+        self.assertEqual([[0, 1]], [[e.key for e in batch] for batch in batches])
+        context.reactor.add_timer.call_args[0][1]()
+        self.assertEqual([[0, 1], [2]], [[e.key for e in batch] for batch in batches])
+
+        async def deregister_listener(registration_id):
+            return True
+
+        m._deregister_listener = deregister_listener
+        events.fire(map_add_entry_listener_codec, 3, 3)
+        self.assertTrue(await m.remove_entry_listener("registration-id"))
+        events.fire(map_add_entry_listener_codec, 4, 4)
+        context.reactor.add_timer.call_args[0][1]()
+        self.assertEqual([[0, 1], [2]], [[e.key for e in batch] for batch in batches])
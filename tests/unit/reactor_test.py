@@ -3,20 +3,28 @@ import select
 import socket
 import threading
 import unittest
+import uuid
+import time
 from collections import OrderedDict
 
 from mock import MagicMock
 from parameterized import parameterized
 
-from hazelcast.config import Config
+from hazelcast.config import Config, ReactorLoop
 from hazelcast.core import Address
+from hazelcast.future import Future
+from hazelcast.protocol.codec import client_ping_codec
 from hazelcast.reactor import (
     AsyncoreReactor,
     _WakeableLoop,
     _SocketedWaker,
     _PipedWaker,
     _BasicLoop,
+    _SelectorLoop,
+    _SelectorMap,
     AsyncoreConnection,
+    ReactorProfiler,
+    _LatencyHistogram,
 )
 from hazelcast.util import AtomicInteger
 from tests.base import HazelcastTestCase
@@ -38,6 +46,65 @@ class ReactorTest(unittest.TestCase):
             reactor.shutdown()
         self.assertEqual(t_count, threading.active_count())
 
+    def test_selector_loop(self):
+        config = Config()
+        config.reactor_loop = ReactorLoop.SELECTOR
+        reactor = AsyncoreReactor(config)
+        try:
+            self.assertIsInstance(reactor._loop, _SelectorLoop)
+            self.assertIsInstance(reactor.map, _SelectorMap)
+        finally:
+            reactor._loop.waker.close()
+
+    def test_multiple_reactors_lifetime(self):
+        config = Config()
+        config.reactor_count = 3
+        t_count = threading.active_count()
+        reactor = AsyncoreReactor(config)
+        reactor.start()
+        try:
+            # One thread for the timers and one for each I/O loop
+            self.assertEqual(t_count + 4, threading.active_count())
+        finally:
+            reactor.shutdown()
+        self.assertEqual(t_count, threading.active_count())
+
+    def test_profiler_is_created_when_slow_call_threshold_is_set(self):
+        self.assertIsNone(AsyncoreReactor(Config()).profiler)
+
+        config = Config()
+        config.reactor_count = 2
+        config.reactor_slow_call_threshold = 0.1
+        reactor = AsyncoreReactor(config)
+        self.assertIsInstance(reactor.profiler, ReactorProfiler)
+        self.assertEqual(0.1, reactor.profiler.threshold)
+        for loop in [reactor._loop] + reactor._io_loops:
+            self.assertIs(reactor.profiler, loop.profiler)
+            loop.waker.close()
+
+    def test_connections_are_sharded_by_member_uuid(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("localhost", 0))
+        server.listen(2)
+        address = Address(*server.getsockname())
+        config = Config()
+        config.reactor_count = 3
+        reactor = AsyncoreReactor(config)
+        reactor.start()
+        try:
+            member_uuid = uuid.uuid4()
+            first = reactor.connection_factory(MagicMock(), 1, address, config, None, member_uuid)
+            second = reactor.connection_factory(MagicMock(), 2, address, config, None, member_uuid)
+            shard = first._reactor
+            self.assertIs(shard, second._reactor)
+            self.assertIn(first._fileno, shard.map)
+            self.assertIn(second._fileno, shard.map)
+            # Connections are not handled by the timer loop
+            self.assertNotIn(first._fileno, reactor.map)
+        finally:
+            reactor.shutdown()
+            server.close()
+
 
 LOOP_CLASSES = [
     (
@@ -48,6 +115,10 @@ LOOP_CLASSES = [
         "basic",
         _BasicLoop,
     ),
+    (
+        "selector",
+        lambda _: _SelectorLoop(_SelectorMap()),
+    ),
 ]
 
 
@@ -79,6 +150,27 @@ class LoopTest(HazelcastTestCase):
 
         loop.shutdown()
 
+    def test_wakeable_loop_wake_suppression(self):
+        loop = _WakeableLoop({})
+        try:
+            # Loop is not polling, it will see the writes anyway
+            loop.wake_loop()
+            self.assertEqual(0, loop.wakes_issued)
+            self.assertEqual(1, loop.wakes_suppressed)
+            self.assertFalse(loop.waker.awake)
+
+            loop._polling = True
+            loop.wake_loop()
+            self.assertEqual(1, loop.wakes_issued)
+            self.assertTrue(loop.waker.awake)
+
+            # There is already a pending wake up
+            loop.wake_loop()
+            self.assertEqual(1, loop.wakes_issued)
+            self.assertEqual(2, loop.wakes_suppressed)
+        finally:
+            loop.waker.close()
+
     @parameterized.expand(LOOP_CLASSES)
     def test_check_loop(self, _, cls):
         loop = cls({})
@@ -151,6 +243,30 @@ class LoopTest(HazelcastTestCase):
 
         self.assertTrueEventually(assertion)
 
+    def test_canceled_timers_are_compacted(self):
+        loop = _BasicLoop({})
+        timers = [loop.add_timer(float("inf"), lambda: None) for _ in range(1000)]
+        for timer in timers[:900]:
+            timer.cancel()
+
+        self.assertEqual((100, 900), loop.timer_counts())
+        loop._check_timers()
+        self.assertEqual(100, len(loop._timers))
+        self.assertEqual((100, 0), loop.timer_counts())
+
+    def test_mostly_live_timers_are_not_compacted(self):
+        loop = _BasicLoop({})
+        timers = [loop.add_timer(3600 + i, lambda: None) for i in range(1000)]
+        # Canceled timers at the root of the heap are removed anyway
+        for timer in timers[-100:]:
+            timer.cancel()
+
+        loop._check_timers()
+        self.assertEqual(1000, len(loop._timers))
+        self.assertEqual((900, 100), loop.timer_counts())
+        # The heap should not be scanned again until it doubles
+        self.assertEqual(2000, loop._timers_compaction_size)
+
     @parameterized.expand(LOOP_CLASSES)
     def test_timer_that_shuts_down_loop(self, _, cls):
         # It may be the case that, we want to shutdown the client(hence, the loop) in timers
@@ -168,6 +284,69 @@ class LoopTest(HazelcastTestCase):
             loop.shutdown()  # Should be no op
 
 
+class ReactorProfilerTest(HazelcastTestCase):
+    def test_latency_histogram(self):
+        histogram = _LatencyHistogram()
+        for duration in (0.00005, 0.0001, 0.0005, 0.05, 0.05, 2.5):
+            histogram.record(duration)
+
+        self.assertEqual([2, 1, 0, 2, 0, 1], histogram.buckets)
+        self.assertEqual(6, histogram.count)
+        self.assertEqual(2.5, histogram.max_duration)
+
+    def test_slow_callback_is_logged_with_its_qualified_name(self):
+        profiler = ReactorProfiler(0.01)
+
+        def slow_callback(_):
+            time.sleep(0.02)
+
+        with self.assertLogs("hazelcast.reactor", "WARNING") as logs:
+            profiler.run_callback(lambda callback: callback(None), slow_callback)
+
+        self.assertEqual(1, profiler.callbacks.count)
+        self.assertEqual(1, profiler.slow_calls)
+        self.assertIn(
+            "%s.ReactorProfilerTest.test_slow_callback_is_logged_with_its_qualified_name."
+            "<locals>.slow_callback" % __name__,
+            logs.output[0],
+        )
+
+    def test_fast_event_handler_is_not_logged(self):
+        profiler = ReactorProfiler(1)
+        handler = MagicMock(__qualname__="handler")
+        profiler.run_event_handler(handler, "message")
+
+        handler.assert_called_once_with("message")
+        self.assertEqual(1, profiler.event_handlers.count)
+        self.assertEqual(0, profiler.slow_calls)
+
+    @parameterized.expand(LOOP_CLASSES + [("selector", _SelectorLoop)])
+    def test_profiled_loop(self, _, cls):
+        loop = cls(_SelectorMap() if cls is _SelectorLoop else {})
+        profiler = ReactorProfiler(0.01)
+        loop.profiler = profiler
+        future = Future()
+        future.add_done_callback(lambda _: time.sleep(0.02))
+        loop.start()
+        loop.add_timer(0, lambda: future.set_result(None))
+
+        def assertion():
+            self.assertEqual(1, profiler.callbacks.count)
+            self.assertGreaterEqual(profiler.callbacks.max_duration, 0.02)
+            self.assertGreaterEqual(profiler.loop_iterations.max_duration, 0.02)
+            self.assertGreaterEqual(profiler.slow_calls, 2)
+
+        try:
+            self.assertTrueEventually(assertion)
+        finally:
+            loop.shutdown()
+
+        # The idle iterations do not include the time spent waiting for the
+        # events, which would fall into the 10 ms bucket otherwise.
+        buckets = profiler.loop_iterations.buckets
+        self.assertGreater(buckets[0] + buckets[1], buckets[2])
+
+
 class SocketedWakerTest(unittest.TestCase):
     def setUp(self):
         self.waker = _SocketedWaker({})
@@ -343,6 +522,129 @@ class AsyncoreConnectionTest(unittest.TestCase):
         finally:
             conn._inner_close()
 
+    def test_receive_buffer_size_from_config(self):
+        self.server = MockServer()
+        config = Config()
+        config.receive_buffer_size = 32 * 1024
+        conn = AsyncoreConnection(
+            MagicMock(map=dict()), None, None, self.server.get_address(), config, None
+        )
+
+        try:
+            self.assertEqual(32 * 1024, conn.receive_buffer_size)
+        finally:
+            conn._inner_close()
+
+    def test_handle_read(self):
+        messages = []
+        conn, local, remote = self._create_connection_with_socket_pair(messages.append)
+        conn.receive_buffer_size = 16
+        try:
+            request = client_ping_codec.encode_request()
+            remote.sendall(request.buf * 3)
+            conn.handle_read()
+            self.assertEqual(3, len(messages))
+            self.assertEqual(3 * len(request.buf), conn._reactor.bytes_received)
+        finally:
+            local.close()
+            remote.close()
+
+    def test_vectored_write(self):
+        conn, local, remote = self._create_connection_with_socket_pair()
+        try:
+            conn._vectored_write = True
+            conn._write_queue.clear()
+            for message in (b"foo", bytearray(b"bar"), b"baz"):
+                conn._write_queue.append(message)
+
+            conn.handle_write()
+            self.assertEqual(0, len(conn._write_queue))
+            self.assertEqual(b"foobarbaz", remote.recv(100))
+            self.assertEqual(9, conn._reactor.bytes_sent)
+        finally:
+            local.close()
+            remote.close()
+
+    def test_vectored_write_with_partial_send(self):
+        conn, local, remote = self._create_connection_with_socket_pair()
+        local.close()
+        remote.close()
+
+        conn._vectored_write = True
+        conn._write_queue.clear()
+        for message in (b"foo", b"bar", b"baz"):
+            conn._write_queue.append(message)
+
+        conn.socket = MagicMock()
+        conn.socket.sendmsg.return_value = 4
+        conn.handle_write()
+        self.assertEqual([b"ar", b"baz"], [bytes(m) for m in conn._write_queue])
+
+        conn.socket.sendmsg.return_value = 3
+        conn.handle_write()
+        self.assertEqual([b"az"], [bytes(m) for m in conn._write_queue])
+
+    def test_write_queue_watermarks(self):
+        config = Config()
+        config.write_queue_high_watermark = 10
+        config.write_queue_low_watermark = 4
+        conn, local, remote = self._create_connection_with_socket_pair(config=config)
+        try:
+            # Protocol bytes are queued by the constructor
+            self.assertEqual(3, conn.write_queue_size)
+            self.assertFalse(conn.overloaded)
+
+            conn._write(b"x" * 7)
+            self.assertEqual(10, conn.write_queue_size)
+            self.assertTrue(conn.overloaded)
+            self.assertFalse(conn.wait_until_writable(0))
+
+            conn.handle_write()
+            self.assertEqual(0, conn.write_queue_size)
+            self.assertFalse(conn.overloaded)
+            self.assertTrue(conn.wait_until_writable(0))
+            self.assertEqual(b"CP2" + b"x" * 7, remote.recv(100))
+        finally:
+            local.close()
+            remote.close()
+
+    def test_write_many(self):
+        config = Config()
+        config.write_queue_high_watermark = 10
+        config.write_queue_low_watermark = 4
+        conn, local, remote = self._create_connection_with_socket_pair(config=config)
+        try:
+            conn._reactor.schedule_write.reset_mock()
+            conn._write_many([b"foo", b"bar", b"b"])
+            self.assertEqual(10, conn.write_queue_size)
+            self.assertTrue(conn.overloaded)
+            conn._reactor.schedule_write.assert_called_once_with(conn)
+
+            conn.handle_write()
+            self.assertEqual(0, conn.write_queue_size)
+            self.assertEqual(b"CP2foobarb", remote.recv(100))
+        finally:
+            local.close()
+            remote.close()
+
+    def _create_connection_with_socket_pair(self, message_callback=None, config=None):
+        self.server = MockServer()
+        conn = AsyncoreConnection(
+            MagicMock(map=dict(), bytes_sent=0, bytes_received=0),
+            None,
+            None,
+            self.server.get_address(),
+            config or Config(),
+            message_callback,
+        )
+        # Replace the socket of the connection with one end of a
+        # socket pair, so that the other end can be used in tests.
+        conn.close()
+        local, remote = socket.socketpair()
+        local.settimeout(0)
+        conn.socket = local
+        return conn, local, remote
+
     def test_send_buffer_size(self):
         # When the SO_SNDBUF option is set, we should try
         # to use that value while trying to write something.
@@ -1,3 +1,7 @@
+import threading
+import time
+
+from mock import MagicMock
 from parameterized import parameterized
 
 from hazelcast.config import (
@@ -7,7 +11,18 @@ from hazelcast.config import (
     QueryConstants,
     UniqueKeyTransformation,
 )
-from hazelcast.util import calculate_version, int_from_bytes, int_to_bytes
+from hazelcast.config import Config
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.util import (
+    EventBatcher,
+    LazyDict,
+    LazyEntryList,
+    LazyList,
+    calculate_version,
+    int_from_bytes,
+    int_to_bytes,
+    split_into_chunks,
+)
 from unittest import TestCase
 
 
@@ -131,3 +146,204 @@ class IntConversionTest(TestCase):
     @parameterized.expand(_CONVERSION_TEST_CASES)
     def test_int_to_bytes(self, number, buf):
         self.assertEqual(bytearray(buf), int_to_bytes(number))
+
+
+class SplitIntoChunksTest(TestCase):
+    def test_unlimited(self):
+        items = list(range(10))
+        self.assertEqual([items], split_into_chunks(items, -1, -1, len))
+
+    def test_max_count(self):
+        chunks = split_into_chunks(list(range(10)), 4, -1, None)
+        self.assertEqual([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]], chunks)
+
+    def test_max_size(self):
+        chunks = split_into_chunks(["aa", "bbb", "c", "dddddd", "e"], -1, 4, len)
+        # The item larger than the max size is on its own
+        self.assertEqual([["aa"], ["bbb", "c"], ["dddddd"], ["e"]], chunks)
+
+    def test_max_count_and_size(self):
+        chunks = split_into_chunks(["a", "b", "c", "dd", "ee"], 2, 3, len)
+        self.assertEqual([["a", "b"], ["c", "dd"], ["ee"]], chunks)
+
+    def test_empty(self):
+        self.assertEqual([], split_into_chunks([], 2, -1, len))
+
+
+class _CountingToObject:
+    def __init__(self):
+        self._service = SerializationServiceV1(Config())
+        self.calls = 0
+
+    def to_data(self, obj):
+        return self._service.to_data(obj)
+
+    def __call__(self, data):
+        self.calls += 1
+        return self._service.to_object(data)
+
+
+class LazyDeserializationTest(TestCase):
+    def setUp(self):
+        self.to_object = _CountingToObject()
+
+    def test_list(self):
+        items = LazyList([self.to_object.to_data(i) for i in range(10)], self.to_object)
+        self.assertEqual(10, len(items))
+        self.assertEqual(0, self.to_object.calls)
+
+        self.assertEqual(3, items[3])
+        self.assertEqual(3, items[3])
+        self.assertEqual(9, items[-1])
+        self.assertEqual(2, self.to_object.calls)
+
+        self.assertEqual([2, 3, 4], items[2:5])
+        self.assertEqual(4, self.to_object.calls)
+        self.assertEqual(list(range(10)), items)
+        self.assertEqual(10, self.to_object.calls)
+
+    def test_entry_list(self):
+        data = [(self.to_object.to_data(i), self.to_object.to_data(str(i))) for i in range(5)]
+        entries = LazyEntryList(data, self.to_object)
+        self.assertEqual((1, "1"), entries[1])
+        self.assertEqual(2, self.to_object.calls)
+        self.assertEqual([(i, str(i)) for i in range(5)], list(entries))
+
+    def test_dict(self):
+        data = [(self.to_object.to_data(i), self.to_object.to_data(str(i))) for i in range(5)]
+        # Already deserialized entries are returned as they are
+        data.append((5, "5"))
+        entries = LazyDict(data, self.to_object)
+        self.assertEqual(6, len(entries))
+        self.assertEqual(0, self.to_object.calls)
+
+        self.assertEqual("3", entries[3])
+        # Keys are needed for the lookup
+        self.assertEqual(6 + 1, self.to_object.calls)
+        self.assertIn(4, entries)
+        self.assertNotIn(6, entries)
+        self.assertEqual(7, self.to_object.calls)
+
+        self.assertEqual({i: str(i) for i in range(6)}, entries)
+        self.assertEqual({i: str(i) for i in range(6)}, dict(entries))
+
+
+class EventBatcherTest(TestCase):
+    def setUp(self):
+        self.batches = []
+        self.add_timer = MagicMock()
+        self.batcher = EventBatcher(self.batches.append, 3, 0.1, self.add_timer)
+
+    def test_flush_by_count(self):
+        for i in range(7):
+            self.batcher.add(i)
+
+        self.assertEqual([[0, 1, 2], [3, 4, 5]], self.batches)
+        # A timer for each batch, the full ones are canceled
+        self.assertEqual(3, self.add_timer.call_count)
+        self.assertEqual(2, self.add_timer.return_value.cancel.call_count)
+
+    def test_flush_by_timer(self):
+        self.batcher.add(0)
+        self.batcher.add(1)
+        delay, flush = self.add_timer.call_args[0]
+        self.assertEqual(0.1, delay)
+
+        flush()
+        self.assertEqual([[0, 1]], self.batches)
+        # Nothing to flush
+        flush()
+        self.assertEqual([[0, 1]], self.batches)
+
+        self.batcher.add(2)
+        self.assertEqual(2, self.add_timer.call_count)
+
+    def test_batch_func_is_called_without_holding_the_lock(self):
+        def batch_func(events):
+            self.batches.append(events)
+            if len(self.batches) == 1:
+                # Would deadlock, if the lock is held
+                self.batcher.add("from-batch-func")
+
+        self.batcher._batch_func = batch_func
+        for i in range(3):
+            self.batcher.add(i)
+
+        self.assertEqual([[0, 1, 2]], self.batches)
+        self.assertEqual(["from-batch-func"], self.batcher._events)
+
+    def test_batches_are_passed_in_order(self):
+        def batch_func(events):
+            self.batches.append(events)
+            if len(self.batches) == 1:
+                # Completes another batch while the first one is being
+                # passed, it is passed after the first one returns.
+                for i in range(3, 6):
+                    self.batcher.add(i)
+                passed_counts.append(len(self.batches))
+
+        passed_counts = []
+        self.batcher._batch_func = batch_func
+        for i in range(3):
+            self.batcher.add(i)
+
+        self.assertEqual([1], passed_counts)
+        self.assertEqual([[0, 1, 2], [3, 4, 5]], self.batches)
+
+    def test_timer_does_not_wait_for_slow_batch_func(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def batch_func(events):
+            self.batches.append(events)
+            started.set()
+            release.wait(10)
+
+        self.batcher._batch_func = batch_func
+        thread = threading.Thread(target=lambda: [self.batcher.add(i) for i in range(3)])
+        thread.start()
+        self.assertTrue(started.wait(10))
+
+        self.batcher.add(3)
+        flush = self.add_timer.call_args[0][1]
+        start = time.time()
+        # Called on the reactor thread, while the event thread is
+        # in the batch_func.
+        flush()
+        self.assertLess(time.time() - start, 1)
+        self.assertEqual([[0, 1, 2]], self.batches)
+
+        release.set()
+        thread.join(10)
+        # Passed by the thread that was in the batch_func
+        self.assertEqual([[0, 1, 2], [3]], self.batches)
+
+    def test_close(self):
+        self.batcher.add(0)
+        self.batcher.close()
+
+        self.add_timer.return_value.cancel.assert_called_once()
+        for i in range(1, 4):
+            self.batcher.add(i)
+        # The timer of the discarded batch might still fire
+        self.add_timer.call_args[0][1]()
+
+        self.assertEqual([], self.batches)
+        self.assertEqual(1, self.add_timer.call_count)
+
+    def test_close_in_batch_func(self):
+        def batch_func(events):
+            self.batches.append(events)
+            self.batcher.add("discarded")
+            self.batcher.close()
+
+        self.batcher._batch_func = batch_func
+        for i in range(6):
+            self.batcher.add(i)
+
+        self.assertEqual([[0, 1, 2]], self.batches)
+
+    def test_failing_batch_func(self):
+        batcher = EventBatcher(MagicMock(side_effect=RuntimeError("expected")), 1, 0.1, None)
+        with self.assertLogs("hazelcast.util", "ERROR"):
+            batcher.add(0)